@@ -902,17 +902,23 @@ for s in sys.argv[1:]:
 
 default_test_modules = [
     'matplotlib.tests.test_agg',
+    'matplotlib.tests.test_backend_pdf',
+    'matplotlib.tests.test_backend_ps',
+    'matplotlib.tests.test_batch',
     'matplotlib.tests.test_backend_svg',
     'matplotlib.tests.test_basic',
     'matplotlib.tests.test_cbook',
+    'matplotlib.tests.test_font_manager',
     'matplotlib.tests.test_mlab',
+    'matplotlib.tests.test_mplot3d',
     'matplotlib.tests.test_transforms',
     'matplotlib.tests.test_axes',
     'matplotlib.tests.test_dates',
     'matplotlib.tests.test_spines',
     'matplotlib.tests.test_image',
     'matplotlib.tests.test_simplification',
-    'matplotlib.tests.test_mathtext'
+    'matplotlib.tests.test_mathtext',
+    'matplotlib.tests.test_texmanager'
     ]
 
 def test(verbosity=0):
@@ -54,6 +54,7 @@ def allow_rasterization(draw):
         before(artist, renderer)
         draw(artist, renderer, *kl)
         after(artist, renderer)
+        artist._stale = False
 
     # "safe wrapping" to exactly replicate anything we haven't overridden above
     draw_wrapper.__name__ = draw.__name__
@@ -99,6 +100,7 @@ class Artist(object):
         self.x_isdata = True  # False to avoid updating Axes.dataLim with x
         self.y_isdata = True  #                                      with y
         self._snap = None
+        self._stale = True
 
     def remove(self):
         """
@@ -120,6 +122,7 @@ class Artist(object):
         # attribute if Python supported that sort of thing.  The callback
         # has one parameter, which is the child to be removed.
         if self._remove_method != None:
+            self.set_stale()
             self._remove_method(self)
         else:
             raise NotImplementedError('cannot remove artist')
@@ -199,11 +202,41 @@ class Artist(object):
     def pchanged(self):
         """
         Fire an event when property changed, calling all of the
-        registered callbacks.
+        registered callbacks, and mark the artist stale.
         """
+        self.set_stale()
         for oid, func in self._propobservers.items():
             func(self)
 
+    def get_stale(self):
+        """
+        Return *True* if the artist has changed since it was last
+        drawn.
+        """
+        return self._stale
+
+    def set_stale(self, stale=True):
+        """
+        Mark the artist as changed since it was last drawn, or with
+        *stale* = *False*, as up to date.
+
+        The setters of the artist properties call this, and a change
+        marks the :class:`~matplotlib.axes.Axes` (or failing that, the
+        :class:`~matplotlib.figure.Figure`) holding the artist stale
+        as well, so :meth:`get_stale` of a figure tells whether it
+        needs to be drawn again.  Animated artists are not drawn with
+        their figure, and do not mark it.
+        """
+        self._stale = stale
+        # setters may run before Artist.__init__ in subclass constructors
+        if stale and not getattr(self, '_animated', False):
+            axes = getattr(self, 'axes', None)
+            figure = getattr(self, 'figure', None)
+            if axes is not None and axes is not self:
+                axes.set_stale()
+            elif figure is not None:
+                figure.set_stale()
+
     def is_transform_set(self):
         """
         Returns *True* if :class:`Artist` has a transform explicitly
@@ -426,6 +459,7 @@ class Artist(object):
         Only supported by the Agg backends.
         """
         self._snap = snap
+        self.set_stale()
 
     def get_figure(self):
         """
@@ -578,6 +612,7 @@ class Artist(object):
             warnings.warn("Rasterization of '%s' will be ignored" % self)
 
         self._rasterized = rasterized
+        self.set_stale()
 
     def get_agg_filter(self):
         "return filter function to be used for agg filter"
@@ -589,6 +624,7 @@ class Artist(object):
 
         """
         self._agg_filter = filter_func
+        self.set_stale()
 
     def draw(self, renderer, *args, **kwargs):
         'Derived classes drawing method'
@@ -631,6 +667,9 @@ class Artist(object):
 
         ACCEPTS: [True | False]
         """
+        if b and not self._animated:
+            # the figure is drawn without it from now on
+            self.set_stale()
         self._animated = b
         self.pchanged()
 
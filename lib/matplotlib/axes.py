@@ -744,6 +744,7 @@ class Axes(martist.Artist):
             self._position.set(pos)
         if which in ('both', 'original'):
             self._originalPosition.set(pos)
+        self.set_stale()
 
     def reset_position(self):
         'Make the original position the active position'
@@ -758,6 +759,7 @@ class Axes(martist.Artist):
                  returns a bbox.
         """
         self._axes_locator = locator
+        self.set_stale()
 
     def get_axes_locator(self):
         """
@@ -772,6 +774,7 @@ class Axes(martist.Artist):
             a.set_transform(self.transData)
 
         a.set_axes(self)
+        self.set_stale()
 
     def _gen_axes_patch(self):
         """
@@ -891,6 +894,7 @@ class Axes(martist.Artist):
 
         self._shared_x_axes.clean()
         self._shared_y_axes.clean()
+        self.set_stale()
 
     def get_frame(self):
         raise AttributeError('Axes.frame was removed in favor of Axes.spines')
@@ -993,6 +997,7 @@ class Axes(martist.Artist):
             self.set_adjustable(adjustable)
         if anchor is not None:
             self.set_anchor(anchor)
+        self.set_stale()
 
     def get_adjustable(self):
         return self._adjustable
@@ -1009,6 +1014,7 @@ class Axes(martist.Artist):
             self._adjustable = adjustable
         else:
             raise ValueError('argument must be "box", or "datalim"')
+        self.set_stale()
 
     def get_anchor(self):
         return self._anchor
@@ -1037,6 +1043,7 @@ class Axes(martist.Artist):
         else:
             raise ValueError('argument must be among %s' %
                                 ', '.join(mtransforms.BBox.coefs.keys()))
+        self.set_stale()
 
     def get_data_ratio(self):
         """
@@ -1608,6 +1615,7 @@ class Axes(martist.Artist):
         Set zorder value below which artists will be rasterized
         """
         self._rasterization_zorder = z
+        self.set_stale()
 
     def get_rasterization_zorder(self):
         """
@@ -1814,6 +1822,7 @@ class Axes(martist.Artist):
         ACCEPTS: [ *True* | *False* ]
         """
         self._frameon = b
+        self.set_stale()
 
     def get_axisbelow(self):
         """
@@ -1828,6 +1837,7 @@ class Axes(martist.Artist):
         ACCEPTS: [ *True* | *False* ]
         """
         self._axisbelow = b
+        self.set_stale()
 
     @docstring.dedent_interpd
     def grid(self, b=None, **kwargs):
@@ -1921,10 +1931,12 @@ class Axes(martist.Artist):
     def set_axis_off(self):
         """turn off the axis"""
         self.axison = False
+        self.set_stale()
 
     def set_axis_on(self):
         """turn on the axis"""
         self.axison = True
+        self.set_stale()
 
     def get_axis_bgcolor(self):
         'Return the axis background color'
@@ -1940,6 +1952,7 @@ class Axes(martist.Artist):
 
         self._axisbg = color
         self.patch.set_facecolor(color)
+        self.set_stale()
 
     ### data limits, ticks, tick labels, and formatting
 
@@ -2044,6 +2057,8 @@ class Axes(martist.Artist):
         xmin, xmax = self.xaxis.limit_range_for_scale(xmin, xmax)
 
         self.viewLim.intervalx = (xmin, xmax)
+        if (xmin, xmax) != (old_xmin, old_xmax):
+            self.set_stale()
 
         if emit:
             self.callbacks.process('xlim_changed', self)
@@ -2079,6 +2094,7 @@ class Axes(martist.Artist):
         self.xaxis.set_scale(value, **kwargs)
         self.autoscale_view()
         self._update_transScale()
+        self.set_stale()
 
     def get_xticks(self, minor=False):
         'Return the x ticks as a list of locations'
@@ -2218,6 +2234,8 @@ class Axes(martist.Artist):
         ymin, ymax = mtransforms.nonsingular(ymin, ymax, increasing=False)
         ymin, ymax = self.yaxis.limit_range_for_scale(ymin, ymax)
         self.viewLim.intervaly = (ymin, ymax)
+        if (ymin, ymax) != (old_ymin, old_ymax):
+            self.set_stale()
 
         if emit:
             self.callbacks.process('ylim_changed', self)
@@ -2252,6 +2270,7 @@ class Axes(martist.Artist):
         self.yaxis.set_scale(value, **kwargs)
         self.autoscale_view()
         self._update_transScale()
+        self.set_stale()
 
     def get_yticks(self, minor=False):
         'Return the y ticks as a list of locations'
@@ -5420,6 +5439,13 @@ class Axes(martist.Artist):
         *x*, *y* and/or *C* may be masked arrays, in which case only
         unmasked points will be plotted.
 
+        The points are binned with array operations; with the
+        :func:`~numpy.mean`, :func:`~numpy.sum`, :func:`~numpy.min` or
+        :func:`~numpy.max` reductions, so are the values (see
+        :class:`~matplotlib.mlab.HexBinAccumulator`).  Plots with the
+        same *extent* and *gridsize* share the hexagon grid (see
+        :func:`~matplotlib.mlab.get_hex_lattice`).
+
         Optional keyword arguments:
 
           *gridsize*: [ 100 | integer ]
@@ -5528,149 +5554,30 @@ class Axes(martist.Artist):
 
         x, y, C = cbook.delete_masked_points(x, y, C)
 
-
-        # Set the size of the hexagon grid
-        if iterable(gridsize):
-            nx, ny = gridsize
-        else:
-            nx = gridsize
-            ny = int(nx/math.sqrt(3))
-        # Count the number of data in each hexagon
-        x = np.array(x, float)
-        y = np.array(y, float)
+        x = np.asarray(x, float)
+        y = np.asarray(y, float)
         if xscale=='log':
             x = np.log10(x)
         if yscale=='log':
             y = np.log10(y)
-        if extent is not None:
-            xmin, xmax, ymin, ymax = extent
-        else:
-            xmin = np.amin(x)
-            xmax = np.amax(x)
-            ymin = np.amin(y)
-            ymax = np.amax(y)
-        # In the x-direction, the hexagons exactly cover the region from
-        # xmin to xmax. Need some padding to avoid roundoff errors.
-        padding = 1.e-9 * (xmax - xmin)
-        xmin -= padding
-        xmax += padding
-        sx = (xmax-xmin) / nx
-        sy = (ymax-ymin) / ny
-
-        if marginals:
-            xorig = x.copy()
-            yorig = y.copy()
-
-        x = (x-xmin)/sx
-        y = (y-ymin)/sy
-        ix1 = np.round(x).astype(int)
-        iy1 = np.round(y).astype(int)
-        ix2 = np.floor(x).astype(int)
-        iy2 = np.floor(y).astype(int)
-
-        nx1 = nx + 1
-        ny1 = ny + 1
-        nx2 = nx
-        ny2 = ny
-        n = nx1*ny1+nx2*ny2
-
-        d1 = (x-ix1)**2 + 3.0 * (y-iy1)**2
-        d2 = (x-ix2-0.5)**2 + 3.0 * (y-iy2-0.5)**2
-        bdist = (d1<d2)
-        if C is None:
-            accum = np.zeros(n)
-            # Create appropriate views into "accum" array.
-            lattice1 = accum[:nx1*ny1]
-            lattice2 = accum[nx1*ny1:]
-            lattice1.shape = (nx1,ny1)
-            lattice2.shape = (nx2,ny2)
-
-            for i in xrange(len(x)):
-                if bdist[i]:
-                    if ((ix1[i] >= 0) and (ix1[i] < nx1) and
-                        (iy1[i] >= 0) and (iy1[i] < ny1)):
-                        lattice1[ix1[i], iy1[i]]+=1
-                else:
-                    if ((ix2[i] >= 0) and (ix2[i] < nx2) and
-                        (iy2[i] >= 0) and (iy2[i] < ny2)):
-                        lattice2[ix2[i], iy2[i]]+=1
-
-            # threshold
-            if mincnt is not None:
-                for i in xrange(nx1):
-                    for j in xrange(ny1):
-                        if lattice1[i,j]<mincnt:
-                            lattice1[i,j] = np.nan
-                for i in xrange(nx2):
-                    for j in xrange(ny2):
-                        if lattice2[i,j]<mincnt:
-                            lattice2[i,j] = np.nan
-            accum = np.hstack((
-                lattice1.astype(float).ravel(), lattice2.astype(float).ravel()))
-            good_idxs = ~np.isnan(accum)
+        if extent is None:
+            extent = np.amin(x), np.amax(x), np.amin(y), np.amax(y)
+        lattice = mlab.get_hex_lattice(extent, gridsize)
 
+        # Count the number of data in each hexagon, or reduce their C
+        if C is None:
+            accumulator = mlab.HexBinAccumulator(lattice)
         else:
-            if mincnt is None:
-                mincnt = 0
-
-            # create accumulation arrays
-            lattice1 = np.empty((nx1,ny1),dtype=object)
-            for i in xrange(nx1):
-                for j in xrange(ny1):
-                    lattice1[i,j] = []
-            lattice2 = np.empty((nx2,ny2),dtype=object)
-            for i in xrange(nx2):
-                for j in xrange(ny2):
-                    lattice2[i,j] = []
-
-            for i in xrange(len(x)):
-                if bdist[i]:
-                    if ((ix1[i] >= 0) and (ix1[i] < nx1) and
-                        (iy1[i] >= 0) and (iy1[i] < ny1)):
-                        lattice1[ix1[i], iy1[i]].append( C[i] )
-                else:
-                    if ((ix2[i] >= 0) and (ix2[i] < nx2) and
-                        (iy2[i] >= 0) and (iy2[i] < ny2)):
-                        lattice2[ix2[i], iy2[i]].append( C[i] )
-
-
-            for i in xrange(nx1):
-                for j in xrange(ny1):
-                    vals = lattice1[i,j]
-                    if len(vals)>mincnt:
-                        lattice1[i,j] = reduce_C_function( vals )
-                    else:
-                        lattice1[i,j] = np.nan
-            for i in xrange(nx2):
-                for j in xrange(ny2):
-                    vals = lattice2[i,j]
-                    if len(vals)>mincnt:
-                        lattice2[i,j] = reduce_C_function( vals )
-                    else:
-                        lattice2[i,j] = np.nan
-
-            accum = np.hstack((
-                lattice1.astype(float).ravel(), lattice2.astype(float).ravel()))
-            good_idxs = ~np.isnan(accum)
-
-        px = xmin + sx * np.array([ 0.5, 0.5, 0.0, -0.5, -0.5,  0.0])
-        py = ymin + sy * np.array([-0.5, 0.5, 1.0,  0.5, -0.5, -1.0]) / 3.0
-
-        polygons = np.zeros((6, n, 2), float)
-        polygons[:,:nx1*ny1,0] = np.repeat(np.arange(nx1), ny1)
-        polygons[:,:nx1*ny1,1] = np.tile(np.arange(ny1), nx1)
-        polygons[:,nx1*ny1:,0] = np.repeat(np.arange(nx2) + 0.5, ny2)
-        polygons[:,nx1*ny1:,1] = np.tile(np.arange(ny2), nx2) + 0.5
+            accumulator = mlab.HexBinAccumulator(lattice, reduce_C_function)
+        accumulator.add(x, y, C)
+        accum = accumulator.result(mincnt)
 
         # remove accumulation bins with no data
-        polygons = polygons[:,good_idxs,:]
+        good_idxs = ~np.isnan(accum)
+        polygons = lattice.polygons()[good_idxs]
         accum = accum[good_idxs]
-
-        polygons = np.transpose(polygons, axes=[1,0,2])
-        polygons[:,:,0] *= sx
-        polygons[:,:,1] *= sy
-        polygons[:,:,0] += px
-        polygons[:,:,1] += py
+        xmin, xmax = lattice.xmin, lattice.xmax
+        ymin, ymax = lattice.ymin, lattice.ymax
 
         if xscale=='log':
             polygons[:,:,0] = 10**(polygons[:,:,0])
@@ -5730,15 +5637,21 @@ class Axes(martist.Artist):
 
         def coarse_bin(x, y, coarse):
             ind = coarse.searchsorted(x).clip(0, len(coarse)-1)
-            mus = np.zeros(len(coarse))
-            for i in range(len(coarse)):
-                mu = reduce_C_function(y[ind==i])
-                mus[i] = mu
+            mus, counts = mlab.reduce_bins(ind, y, len(coarse),
+                                           reduce_C_function)
+            # empty bins get what reduce_C_function makes of no data,
+            # eg 0 for np.sum, and are left out if that is nan
+            empty = counts == 0
+            if empty.any():
+                try:
+                    mus[empty] = reduce_C_function(np.array([]))
+                except ValueError:
+                    pass
             return mus
 
         coarse = np.linspace(xmin, xmax, gridsize)
 
-        xcoarse = coarse_bin(xorig, C, coarse)
+        xcoarse = coarse_bin(x, C, coarse)
         valid = ~np.isnan(xcoarse)
         verts, values = [], []
         for i,val in enumerate(xcoarse):
@@ -5768,7 +5681,7 @@ class Axes(martist.Artist):
         self.add_collection(hbar)
 
         coarse = np.linspace(ymin, ymax, gridsize)
-        ycoarse = coarse_bin(yorig, C, coarse)
+        ycoarse = coarse_bin(y, C, coarse)
         valid = ~np.isnan(ycoarse)
         verts, values = [], []
         for i,val in enumerate(ycoarse):
@@ -6222,6 +6135,11 @@ class Axes(martist.Artist):
             parameter, i.e. when interpolation is one of: 'sinc',
             'lanczos' or 'blackman'
 
+          *pyramid*: [ False | True ]
+            If *True*, zoomed out views of a large image are drawn
+            from reduced resolution copies of the data.  See
+            :meth:`~matplotlib.image.AxesImage.set_pyramid`.
+
         Additional kwargs are :class:`~matplotlib.artist.Artist` properties:
 
         %(Artist)s
@@ -6899,13 +6817,14 @@ class Axes(martist.Artist):
     def hist(self, x, bins=10, range=None, normed=False, weights=None,
              cumulative=False, bottom=None, histtype='bar', align='mid',
              orientation='vertical', rwidth=None, log=False,
-             **kwargs):
+             binning='linear', **kwargs):
         """
         call signature::
 
           hist(x, bins=10, range=None, normed=False, cumulative=False,
                bottom=None, histtype='bar', align='mid',
-               orientation='vertical', rwidth=None, log=False, **kwargs)
+               orientation='vertical', rwidth=None, log=False,
+               binning='linear', **kwargs)
 
         Compute and draw the histogram of *x*. The return value is a
         tuple (*n*, *bins*, *patches*) or ([*n0*, *n1*, ...], *bins*,
@@ -6924,6 +6843,16 @@ class Axes(martist.Artist):
             :func:`numpy.histogram` with the *new* = True argument.
             Unequally spaced bins are supported if *bins* is a sequence.
 
+            *x* can also be a single dataset too large to hold in
+            memory: a :class:`numpy.memmap`, an iterator over chunks
+            of data, or a function returning such an iterator.  It is
+            then read a chunk at a time by
+            :func:`matplotlib.mlab.stream_histogram`.  Unless *bins*
+            is a sequence, or *bins* and *range* are given, the data
+            is read twice, so iterators need to be wrapped in a
+            function.  A 2D :class:`numpy.memmap` gives a histogram
+            for each column, streamed one column at a time.
+
           *range*:
             The lower and upper range of the bins. Lower and upper outliers
             are ignored. If not provided, *range* is (x.min(), x.max()).
@@ -7000,6 +6929,11 @@ class Axes(martist.Artist):
             be filtered out and only the non-empty (*n*, *bins*,
             *patches*) will be returned.
 
+          *binning*: [ 'linear' | 'quantile' ]
+            If *bins* is a number, make bins of the same width, or
+            with 'quantile', bins holding about the same number of
+            data.
+
         kwargs are used to update the properties of the hist
         :class:`~matplotlib.patches.Rectangle` instances:
 
@@ -7032,64 +6966,93 @@ class Axes(martist.Artist):
                 'hist now uses the rwidth to give relative width '
                 'and not absolute width')
 
-        try:
-            # make sure a copy is created: don't use asarray
-            x = np.transpose(np.array(x))
-            if len(x.shape)==1:
-                x.shape = (1,x.shape[0])
-            elif len(x.shape)==2 and x.shape[1]<x.shape[0]:
-                warnings.warn('2D hist should be nsamples x nvariables; '
-                              'this looks transposed')
-        except ValueError:
-            # multiple hist with data of different length
-            if iterable(x[0]) and not is_string_like(x[0]):
-                tx = []
-                for i in xrange(len(x)):
-                    tx.append( np.array(x[i]) )
-                x = tx
-            else:
-                raise ValueError, 'Can not use provided data to create a histogram'
+        # Check whether bins or range are given explicitly. In that
+        # case do not autoscale axes.
+        binsgiven = (cbook.iterable(bins) or range != None)
 
-        if weights is not None:
+        if binning not in ('linear', 'quantile'):
+            raise ValueError, 'invalid binning: %s' % binning
+
+        if isinstance(x, np.memmap) and x.ndim == 2:
+            # one histogram per column, as for 2D data in memory, with
+            # the bins of the first column or the quantiles of all
+            if binning == 'quantile' and not cbook.iterable(bins):
+                bins = mlab.stream_histogram(x, bins, range=range,
+                                             binning=binning)[1]
+            n = []
+            for i in xrange(x.shape[1]):
+                if weights is None: wi = None
+                else: wi = weights[:, i]
+                m, bins = mlab.stream_histogram(x[:, i], bins, range=range,
+                                                weights=wi, normed=normed,
+                                                binning=binning)
+                n.append(m)
+        elif mlab.is_chunked(x):
+            m, bins = mlab.stream_histogram(x, bins, range=range,
+                                            weights=weights, normed=normed,
+                                            binning=binning)
+            n = [m]
+        else:
             try:
-                w = np.transpose(np.array(weights))
-                if len(w.shape)==1:
-                    w.shape = (1, w.shape[0])
-            except:
-                if iterable(weights[0]) and not is_string_like(weights[0]):
-                    tw = []
-                    for i in xrange(len(weights)):
-                        tw.append( np.array(weights[i]) )
-                    w = tw
+                # make sure a copy is created: don't use asarray
+                x = np.transpose(np.array(x))
+                if len(x.shape)==1:
+                    x.shape = (1,x.shape[0])
+                elif len(x.shape)==2 and x.shape[1]<x.shape[0]:
+                    warnings.warn('2D hist should be nsamples x nvariables; '
+                                  'this looks transposed')
+            except ValueError:
+                # multiple hist with data of different length
+                if iterable(x[0]) and not is_string_like(x[0]):
+                    tx = []
+                    for i in xrange(len(x)):
+                        tx.append( np.array(x[i]) )
+                    x = tx
                 else:
-                    raise ValueError, 'Can not use provided weights to create a hist'
+                    raise ValueError, 'Can not use provided data to create a histogram'
 
-            if len(x) != len(w):
-                raise ValueError, 'weights should have the same shape as x'
-            for i in xrange(len(x)):
-                if len(x[i]) != len(w[i]):
-                    raise ValueError, 'weights should have the same shape as x'
-        else:
-            w = [None]*len(x)
-
-        # Check whether bins or range are given explicitly. In that
-        # case do not autoscale axes.
-        binsgiven = (cbook.iterable(bins) or range != None)
+            if weights is not None:
+                try:
+                    w = np.transpose(np.array(weights))
+                    if len(w.shape)==1:
+                        w.shape = (1, w.shape[0])
+                except:
+                    if iterable(weights[0]) and not is_string_like(weights[0]):
+                        tw = []
+                        for i in xrange(len(weights)):
+                            tw.append( np.array(weights[i]) )
+                        w = tw
+                    else:
+                        raise ValueError, 'Can not use provided weights to create a hist'
 
-        # check the version of the numpy
-        if np.__version__ < "1.3": # version 1.1 and 1.2
-            hist_kwargs = dict(range=range,
-                               normed=bool(normed), new=True)
-        else: # version 1.3 and later, drop new=True
-            hist_kwargs = dict(range=range,
-                               normed=bool(normed))
-
-        n = []
-        for i in xrange(len(x)):
-            # this will automatically overwrite bins,
-            # so that each histogram uses the same bins
-            m, bins = np.histogram(x[i], bins, weights=w[i], **hist_kwargs)
-            n.append(m)
+                if len(x) != len(w):
+                    raise ValueError, 'weights should have the same shape as x'
+                for i in xrange(len(x)):
+                    if len(x[i]) != len(w[i]):
+                        raise ValueError, 'weights should have the same shape as x'
+            else:
+                w = [None]*len(x)
+
+            # check the version of the numpy
+            if np.__version__ < "1.3": # version 1.1 and 1.2
+                hist_kwargs = dict(range=range,
+                                   normed=bool(normed), new=True)
+            else: # version 1.3 and later, drop new=True
+                hist_kwargs = dict(range=range,
+                                   normed=bool(normed))
+
+            if binning == 'quantile' and not cbook.iterable(bins):
+                data = np.concatenate([np.ravel(xi) for xi in x])
+                if range is not None:
+                    data = data[(data >= range[0]) & (data <= range[1])]
+                bins = np.unique(mlab.prctile(data, np.linspace(0, 100, bins+1)))
+
+            n = []
+            for i in xrange(len(x)):
+                # this will automatically overwrite bins,
+                # so that each histogram uses the same bins
+                m, bins = np.histogram(x[i], bins, weights=w[i], **hist_kwargs)
+                n.append(m)
 
         if cumulative:
             slc = slice(None)
@@ -148,6 +148,7 @@ class Tick(artist.Artist):
         ACCEPTS: float
         """
         self._pad = val
+        self.set_stale()
 
     def get_pad(self):
         'Get the value of the tick label pad in points'
@@ -571,6 +572,7 @@ class Axis(artist.Artist):
 
         self.label.set_transform(transform)
         self.label.set_position((x, y))
+        self.set_stale()
 
     def get_transform(self):
         return self._scale.get_transform()
@@ -586,6 +588,7 @@ class Axis(artist.Artist):
         self.isDefault_minloc = True
         self.isDefault_majfmt = True
         self.isDefault_minfmt = True
+        self.set_stale()
 
     def limit_range_for_scale(self, vmin, vmax):
         return self._scale.limit_range_for_scale(vmin, vmax, self.get_minpos())
@@ -976,6 +979,7 @@ class Axis(artist.Artist):
                 if tick is None: continue
                 tick.gridOn = self._gridOnMajor
                 if len(kwargs): artist.setp(tick.gridline,**kwargs)
+        self.set_stale()
 
 
     def update_units(self, data):
@@ -1089,6 +1093,7 @@ class Axis(artist.Artist):
         self.isDefault_majfmt = False
         self.major.formatter = formatter
         formatter.set_axis(self)
+        self.set_stale()
 
 
     def set_minor_formatter(self, formatter):
@@ -1100,6 +1105,7 @@ class Axis(artist.Artist):
         self.isDefault_minfmt = False
         self.minor.formatter = formatter
         formatter.set_axis(self)
+        self.set_stale()
 
 
     def set_major_locator(self, locator):
@@ -1111,6 +1117,7 @@ class Axis(artist.Artist):
         self.isDefault_majloc = False
         self.major.locator = locator
         locator.set_axis(self)
+        self.set_stale()
 
 
     def set_minor_locator(self, locator):
@@ -1122,6 +1129,7 @@ class Axis(artist.Artist):
         self.isDefault_minloc = False
         self.minor.locator = locator
         locator.set_axis(self)
+        self.set_stale()
 
     def set_pickradius(self, pickradius):
         """
@@ -1286,6 +1294,7 @@ class XAxis(Axis):
         else:
             self.label.set_verticalalignment('top')
         self.label_position=position
+        self.set_stale()
 
     def _update_label_position(self, bboxes, bboxes2):
         """
@@ -1393,6 +1402,7 @@ class XAxis(Axis):
                 t.tick2On = True
         for t in ticks:
             t.update_position(t._loc)
+        self.set_stale()
 
     def tick_top(self):
         'use ticks only on top'
@@ -1547,6 +1557,7 @@ class YAxis(Axis):
         else:
             self.label.set_horizontalalignment('right')
         self.label_position=position
+        self.set_stale()
 
     def _update_label_position(self, bboxes, bboxes2):
         """
@@ -1591,6 +1602,7 @@ class YAxis(Axis):
 
         self.offsetText.set_ha(position)
         self.offsetText.set_position((x,y))
+        self.set_stale()
 
     def get_text_widths(self, renderer):
         bbox, bbox2 = self.get_ticklabel_extents(renderer)
@@ -1659,6 +1671,7 @@ class YAxis(Axis):
             for t in ticks:
                 t.tick1On = True
                 t.tick2On = True
+        self.set_stale()
 
     def tick_right(self):
         'use ticks only on right'
@@ -1426,8 +1426,12 @@ class FigureCanvasBase:
     def draw_idle(self, *args, **kwargs):
         """
         :meth:`draw` only if idle; defaults to draw but backends can overrride
+
+        Nothing is drawn if the figure has not changed since it was
+        last drawn (see :meth:`matplotlib.artist.Artist.get_stale`).
         """
-        self.draw(*args, **kwargs)
+        if self.figure.get_stale():
+            self.draw(*args, **kwargs)
 
     def draw_cursor(self, event):
         """
@@ -27,7 +27,7 @@ import numpy as npy
 from matplotlib import verbose, rcParams
 from matplotlib.backend_bases import RendererBase,\
      FigureManagerBase, FigureCanvasBase
-from matplotlib.cbook import is_string_like, maxdict
+from matplotlib.cbook import is_string_like, maxdict, LRUCache
 from matplotlib.figure import Figure
 from matplotlib.font_manager import findfont
 from matplotlib.ft2font import FT2Font, LOAD_FORCE_AUTOHINT, LOAD_NO_HINTING
@@ -44,12 +44,27 @@ class RendererAgg(RendererBase):
     """
     The renderer handles all the drawing primitives using a graphics
     context instance that controls the colors/styles
+
+    The rasters of rendered strings are shared by all renderers in
+    :attr:`text_cache`, a :class:`~matplotlib.cbook.LRUCache` holding
+    at most :attr:`text_cache_bytes` bytes of glyph images and keyed
+    on the font file, size, dpi, hinting flags and text.  The limit is
+    read whenever a raster is added, so a new value takes effect with
+    the next string that is not in the cache.  Drawing a
+    cached string does not go through FreeType; the cache's
+    ``stats()`` method reports its hits and misses.  The rasters of
+    TeX strings are shared in the same way in :attr:`texd`.
     """
     debug=1
+    text_cache_bytes = 16*1024*1024
+    text_cache = LRUCache(maxbytes=text_cache_bytes,
+                          sizeof=lambda image: image.nbytes)
+    texd = LRUCache(maxbytes=text_cache_bytes,
+                    sizeof=lambda image: image.nbytes)
+
     def __init__(self, width, height, dpi):
         if __debug__: verbose.report('RendererAgg.__init__', 'debug-annoying')
         RendererBase.__init__(self)
-        self.texd = maxdict(50)  # a cache of tex image rasters
         self._fontd = maxdict(50)
 
         self.dpi = dpi
@@ -69,6 +84,12 @@ class RendererAgg(RendererBase):
         if __debug__: verbose.report('RendererAgg.__init__ done',
                                      'debug-annoying')
 
+    def _cache_raster(self, cache, key, image):
+        # the caches are made with the class, so pick up any later
+        # change to text_cache_bytes here
+        cache.maxbytes = self.text_cache_bytes
+        cache[key] = image
+
     def _get_hinting_flag(self):
         if rcParams['text.hinting']:
             return LOAD_FORCE_AUTOHINT
@@ -139,19 +160,29 @@ class RendererAgg(RendererBase):
             return self.draw_mathtext(gc, x, y, s, prop, angle)
 
         flags = self._get_hinting_flag()
-        font = self._get_agg_font(prop)
-        if font is None: return None
-        if len(s) == 1 and ord(s) > 127:
-            font.load_char(ord(s), flags=flags)
-        else:
-            # We pass '0' for angle here, since it will be rotated (in raster
-            # space) in the following call to draw_text_image).
-            font.set_text(s, 0, flags=flags)
-        font.draw_glyphs_to_bitmap()
+        # The raster is rendered unrotated and turned in raster space
+        # by draw_text_image, so the angle is not part of the key.
+        key = (findfont(prop), prop.get_size_in_points(), self.dpi,
+               flags, s)
+        image = self.text_cache.get(key)
+        if image is None:
+            font = self._get_agg_font(prop)
+            if font is None: return None
+            if len(s) == 1 and ord(s) > 127:
+                font.load_char(ord(s), flags=flags)
+            else:
+                # We pass '0' for angle here, since it will be rotated (in raster
+                # space) in the following call to draw_text_image).
+                font.set_text(s, 0, flags=flags)
+            font.draw_glyphs_to_bitmap()
+            # as_array shares the font's buffer, which the next string
+            # overwrites
+            image = npy.array(font.get_image().as_array())
+            self._cache_raster(self.text_cache, key, image)
 
         #print x, y, int(x), int(y), s
 
-        self._renderer.draw_text_image(font.get_image(), int(x), int(y) + 1, angle, gc)
+        self._renderer.draw_text_image(image, int(x), int(y) + 1, angle, gc)
 
     def get_text_width_height_descent(self, s, prop, ismath):
         """
@@ -192,11 +223,14 @@ class RendererAgg(RendererBase):
         size = prop.get_size_in_points()
 
         texmanager = self.get_texmanager()
-        key = s, size, self.dpi, angle, texmanager.get_font_config()
-        im = self.texd.get(key)
-        if im is None:
+        # like draw_text, the raster is rotated by draw_text_image
+        key = (s, size, self.dpi, texmanager.get_font_config(),
+               texmanager.get_custom_preamble())
+        Z = self.texd.get(key)
+        if Z is None:
             Z = texmanager.get_grey(s, size, self.dpi)
             Z = npy.array(Z * 255.0, npy.uint8)
+            self._cache_raster(self.texd, key, Z)
 
         self._renderer.draw_text_image(Z, x, y, angle, gc)
 
@@ -440,3 +474,204 @@ class FigureCanvasAgg(FigureCanvasBase):
                        filename_or_obj, self.figure.dpi)
         renderer.dpi = original_dpi
 
+
+
+def _intersection(bbox1, bbox2):
+    'The :class:`Bbox` common to *bbox1* and *bbox2*, or None.'
+    x0 = max(bbox1.xmin, bbox2.xmin)
+    y0 = max(bbox1.ymin, bbox2.ymin)
+    x1 = min(bbox1.xmax, bbox2.xmax)
+    y1 = min(bbox1.ymax, bbox2.ymax)
+    if x0 > x1 or y0 > y1:
+        return None
+    return Bbox.from_extents(x0, y0, x1, y1)
+
+class BlitManager(object):
+    """
+    Redraw the animated artists of a figure on a
+    :class:`FigureCanvasAgg` (or one of the GUI canvases built on it)
+    without drawing the rest of the figure again::
+
+        line, = ax.plot(x, y)
+        manager = BlitManager(fig.canvas, [line])
+        fig.canvas.draw()
+        for y in frames:
+            line.set_ydata(y)
+            manager.update([line])
+
+    The managed artists are made animated, so a full draw of the
+    figure leaves them out.  After each full draw the manager saves
+    the background of every axes holding them, and draws them on top.
+    :meth:`update` then restores the background under the old and new
+    extents of the changed artists only, redraws the managed artists
+    that overlap these rectangles, clipped to them, and blits the
+    rectangles to the screen.
+
+    The managed artists must be in an axes, and are clipped to it.
+    Lines, patches and texts are redrawn within their extents (padded
+    by *pad* pixels and their line widths); other artists damage the
+    whole axes.
+    """
+    def __init__(self, canvas, artists=(), pad=3):
+        self.canvas = canvas
+        self.pad = pad
+        self.artists = []
+        self._extents = {}      # artist -> (axes, bbox) where it was drawn
+        self._backgrounds = {}  # axes -> saved region
+        self._renderer = None   # the renderer the regions come from
+        for artist in artists:
+            self.add_artist(artist)
+        self._cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def add_artist(self, artist):
+        """
+        Manage *artist*; it is drawn from the next full draw of the
+        figure on.
+        """
+        if artist.axes is None:
+            raise ValueError('%r is not in an axes' % (artist,))
+        artist.set_animated(True)
+        self.artists.append(artist)
+
+    def remove_artist(self, artist):
+        """
+        Stop managing *artist*; it is erased by the next :meth:`update`
+        and drawn normally by the next full draw.
+        """
+        self.artists.remove(artist)
+        artist.set_animated(False)
+
+    def disconnect(self):
+        'Stop following the full draws of the canvas.'
+        self.canvas.mpl_disconnect(self._cid)
+
+    def _get_extent(self, artist, renderer):
+        'The display bbox *artist* paints into, within its axes.'
+        from matplotlib.lines import Line2D
+        from matplotlib.patches import Patch
+        from matplotlib.text import Text
+        axes = artist.axes
+        if not isinstance(artist, (Line2D, Patch, Text)):
+            return axes.bbox.frozen()
+        pad = self.pad
+        for attr in 'get_linewidth', 'get_markeredgewidth':
+            if hasattr(artist, attr):
+                pad += (getattr(artist, attr)() or 0) * renderer.dpi / 72.0
+        return artist.get_window_extent(renderer).padded(pad)
+
+    def _to_device(self, bbox, region):
+        """
+        The extents of *bbox* in the pixel coordinates of *region*
+        (y down), clipped to the region, or None if they miss it.
+        """
+        height = self._renderer.height
+        l, b, r, t = bbox.extents
+        x1, y1, x2, y2 = region.get_extents()
+        l = max(int(l), x1)
+        r = min(int(r) + 1, x2)
+        t = max(height - int(t) - 1, y1)
+        b = min(height - int(b), y2)
+        if l >= r or t >= b:
+            return None
+        return l, t, r, b
+
+    def _draw(self, artist, renderer, bbox):
+        'Draw *artist* clipped to *bbox*, as well as to its own clip box.'
+        saved = clipon, clipbox, clippath = (
+            artist.get_clip_on(), artist.clipbox, artist._clippath)
+        if clipon and clipbox is not None:
+            bbox = _intersection(bbox, clipbox)
+            if bbox is None:
+                return
+        if not clipon:
+            clippath = None
+        artist._clipon, artist.clipbox, artist._clippath = (
+            True, bbox, clippath)
+        try:
+            artist.draw(renderer)
+        finally:
+            artist._clipon, artist.clipbox, artist._clippath = saved
+
+    def _on_draw(self, event):
+        'Save the backgrounds and draw the artists after a full draw.'
+        renderer = self.canvas.get_renderer()
+        if event.renderer is not renderer:
+            # a draw to another renderer, such as a print to a file
+            for artist in self.artists:
+                artist.draw(event.renderer)
+            return
+        self._renderer = renderer
+        self._backgrounds = {}
+        self._extents = {}
+        for artist in self.artists:
+            axes = artist.axes
+            if axes not in self._backgrounds:
+                self._backgrounds[axes] = renderer.copy_from_bbox(axes.bbox)
+        self._draw_artists(renderer, self.artists)
+
+    def _draw_artists(self, renderer, artists, bbox=None):
+        dsu = [(artist.get_zorder(), i, artist)
+               for i, artist in enumerate(artists)]
+        dsu.sort()
+        for zorder, i, artist in dsu:
+            extent = self._get_extent(artist, renderer)
+            self._extents[artist] = artist.axes, extent
+            if bbox is None:
+                artist.draw(renderer)
+            elif extent.overlaps(bbox):
+                self._draw(artist, renderer, bbox)
+
+    def update(self, artists=None):
+        """
+        Redraw the managed *artists*, by default those that changed
+        since they were last drawn (see
+        :meth:`~matplotlib.artist.Artist.get_stale`), as well as the
+        artists removed from the manager since the last update.
+        Return the list of the damaged display bboxes, which have been
+        blitted to the screen.
+
+        Before the first full draw, and after the canvas got a new
+        renderer, this draws the whole figure.
+        """
+        renderer = self.canvas.get_renderer()
+        if renderer is not self._renderer:
+            self.canvas.draw()
+            return [self.canvas.figure.bbox.frozen()]
+        if artists is None:
+            artists = [artist for artist in self.artists
+                       if artist.get_stale()]
+        damage = {}
+        for artist in artists:
+            axes = artist.axes
+            if artist in self._extents:
+                axes, old = self._extents[artist]
+                damage.setdefault(axes, []).append(old)
+            damage.setdefault(axes, []).append(
+                self._get_extent(artist, renderer))
+        for artist in self._extents.keys():
+            if artist not in self.artists:
+                axes, old = self._extents.pop(artist)
+                damage.setdefault(axes, []).append(old)
+
+        damaged = []
+        for axes, bboxes in damage.items():
+            region = self._backgrounds.get(axes)
+            if region is None:
+                # the axes had no managed artists at the last full draw
+                self.canvas.draw()
+                return [self.canvas.figure.bbox.frozen()]
+            bbox = _intersection(Bbox.union(bboxes), axes.bbox)
+            if bbox is None:
+                continue
+            extents = self._to_device(bbox, region)
+            if extents is None:
+                continue
+            x1, y1, x2, y2 = region.get_extents()
+            renderer.restore_region(region, extents, (x1, y1))
+            self._draw_artists(
+                renderer,
+                [artist for artist in self.artists if artist.axes is axes],
+                bbox)
+            self.canvas.blit(bbox)
+            damaged.append(bbox)
+        return damaged
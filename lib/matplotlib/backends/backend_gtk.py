@@ -290,7 +290,8 @@ class FigureCanvasGTK (gtk.DrawingArea, FigureCanvasBase):
 
     def draw_idle(self):
         def idle_draw(*args):
-            self.draw()
+            if self.figure.get_stale():
+                self.draw()
             self._idle_draw_id = 0
             return False
         if self._idle_draw_id == 0:
@@ -9,10 +9,16 @@ import codecs
 import os
 import re
 import sys
+import threading
 import time
 import warnings
 import zlib
 
+try:
+    from hashlib import md5
+except ImportError:
+    from md5 import md5 #Deprecated in 2.5
+
 import numpy as npy
 
 from cStringIO import StringIO
@@ -22,6 +28,7 @@ try:
     set
 except NameError:
     from sets import Set as set
+import Queue
 
 import matplotlib
 from matplotlib import __version__, rcParams, get_data_path
@@ -291,24 +298,35 @@ class Stream(object):
     This has no pdfRepr method. Instead, call begin(), then output the
     contents of the stream by calling write(), and finally call end().
     """
-    __slots__ = ('id', 'len', 'pdfFile', 'file', 'compressobj', 'extra', 'pos')
+    __slots__ = ('id', 'len', 'pdfFile', 'file', 'compressobj', 'extra', 'pos',
+                 'level', 'chunks', 'done', 'error')
 
-    def __init__(self, id, len, file, extra=None):
+    def __init__(self, id, len, file, extra=None, level=None):
         """id: object id of stream; len: an unused Reference object for the
         length of the stream, or None (to use a memory buffer); file:
         a PdfFile; extra: a dictionary of extra key-value pairs to
-        include in the stream header """
+        include in the stream header; level: the compression level,
+        by default rcParams['pdf.compression'] """
         self.id = id            # object id
         self.len = len          # id of length object
         self.pdfFile = file
         self.file = file.fh     # file to which the stream is written
         self.compressobj = None # compression object
+        self.chunks = None      # uncompressed data, if compressed later
         if extra is None: self.extra = dict()
         else: self.extra = extra
-
+        if level is None:
+            level = rcParams['pdf.compression']
+        self.level = level
+
+        if self.level and file.compressor is not None:
+            # collect the data for one of the compression threads;
+            # the stream is written out by PdfFile.writeCompressed
+            self.chunks = []
+            return
         self.pdfFile.recordXref(self.id)
-        if rcParams['pdf.compression']:
-            self.compressobj = zlib.compressobj(rcParams['pdf.compression'])
+        if self.level:
+            self.compressobj = zlib.compressobj(self.level)
         if self.len is None:
             self.file = StringIO()
         else:
@@ -320,7 +338,7 @@ class Stream(object):
         write("%d 0 obj\n" % self.id)
         dict = self.extra
         dict['Length'] = self.len
-        if rcParams['pdf.compression']:
+        if self.level:
             dict['Filter'] = Name('FlateDecode')
 
         write(pdfRepr(dict))
@@ -329,6 +347,9 @@ class Stream(object):
     def end(self):
         """Finalize stream."""
 
+        if self.chunks is not None:
+            self.pdfFile.compressor.put(self)
+            return
         self._flush()
         if self.len is None:
             contents = self.file.getvalue()
@@ -345,7 +366,9 @@ class Stream(object):
     def write(self, data):
         """Write some data on the stream."""
 
-        if self.compressobj is None:
+        if self.chunks is not None:
+            self.chunks.append(data)
+        elif self.compressobj is None:
             self.file.write(data)
         else:
             compressed = self.compressobj.compress(data)
@@ -359,10 +382,142 @@ class Stream(object):
             self.file.write(compressed)
             self.compressobj = None
 
+    def compress(self):
+        """
+        Compress the collected data; called in a compression thread.
+        """
+        try:
+            try:
+                self.chunks = [zlib.compress(''.join(self.chunks),
+                                             self.level)]
+            except:
+                self.error = sys.exc_info()
+        finally:
+            self.done.set()
+
+    def writeCompressed(self):
+        """Write out the stream once :meth:`compress` is done."""
+
+        if self.error is not None:
+            raise self.error[0], self.error[1], self.error[2]
+        contents = self.chunks[0]
+        self.chunks = None
+        self.pdfFile.recordXref(self.id)
+        if self.len is None:
+            self.len = len(contents)
+            self._writeHeader()
+            self.file.write(contents)
+            self.file.write("\nendstream\nendobj\n")
+        else:
+            self._writeHeader()
+            self.file.write(contents)
+            self.file.write("\nendstream\nendobj\n")
+            self.pdfFile.writeObject(self.len, len(contents))
+
+class StreamCompressor(object):
+    """
+    Compress the streams of a :class:`PdfFile` in up to *threads*
+    worker threads.  zlib releases the GIL, so the compression overlaps
+    with drawing and with each other; the streams are written to the
+    file in the order they were finished, as soon as they are
+    compressed.  At most *maxbytes* of uncompressed data wait for a
+    thread, beyond that :meth:`put` blocks.
+
+    The threads are started as streams are queued and exit once they
+    have waited :attr:`idle_timeout` seconds without work, so none are
+    left behind by a file that is never closed, e.g. because drawing
+    a figure raised an exception.
+    """
+    idle_timeout = 1.0
+
+    def __init__(self, threads, maxbytes=64*1024*1024):
+        self.queue = Queue.Queue()
+        self.pending = []       # streams not written out yet, in order
+        self.nbytes = 0         # uncompressed size of the pending streams
+        self.maxbytes = maxbytes
+        self.nthreads = threads
+        self.threads = []       # the running workers
+        self.lock = threading.Lock()
+
+    def _work(self):
+        while 1:
+            try:
+                stream = self.queue.get(True, self.idle_timeout)
+            except Queue.Empty:
+                # put starts a new worker if this one has gone
+                self.lock.acquire()
+                try:
+                    if self.queue.empty():
+                        thread = threading.currentThread()
+                        # close may have taken the list already
+                        if thread in self.threads:
+                            self.threads.remove(thread)
+                        return
+                finally:
+                    self.lock.release()
+                continue
+            if stream is None:
+                return
+            stream.compress()
+
+    def put(self, stream):
+        'Queue the finished *stream* for compression.'
+        stream.done = threading.Event()
+        stream.error = None
+        self.pending.append((stream, sum([len(x) for x in stream.chunks])))
+        self.nbytes += self.pending[-1][1]
+        self.lock.acquire()
+        try:
+            self.queue.put(stream)
+            if len(self.threads) < self.nthreads:
+                thread = threading.Thread(target=self._work)
+                thread.setDaemon(True)
+                thread.start()
+                self.threads.append(thread)
+        finally:
+            self.lock.release()
+
+    def write(self, block=False):
+        """
+        Write out the compressed streams at the head of the queue.
+        With *block*, wait for all of them, otherwise only for as many
+        as needed to bring the pending data under *maxbytes*.
+        """
+        while self.pending:
+            stream, nbytes = self.pending[0]
+            if not (block or self.nbytes > self.maxbytes or
+                    stream.done.isSet()):
+                break
+            stream.done.wait()
+            del self.pending[0]
+            self.nbytes -= nbytes
+            stream.writeCompressed()
+
+    def close(self):
+        'Stop the threads.'
+        self.lock.acquire()
+        try:
+            threads = self.threads
+            self.threads = []
+            for thread in threads:
+                self.queue.put(None)
+        finally:
+            self.lock.release()
+        for thread in threads:
+            thread.join()
+
 class PdfFile(object):
-    """PDF file object."""
+    """PDF file object.
+
+    The objects needed by a page (images, markers, hatch patterns and
+    so on) are written out once the page is done, see :meth:`endPage`.
+    With *streaming*, so are the subsets of the TrueType fonts used on
+    it, and later pages start new subsets; this keeps the memory use
+    flat for documents with very many pages, at the cost of a larger
+    file.
+    """
 
-    def __init__(self, filename):
+    def __init__(self, filename, streaming=False):
         self.nextObject = 1     # next free object id
         self.xrefTable = [ [0, 65535, 'the zero object'] ]
         self.passed_in_file_object = False
@@ -377,7 +532,12 @@ class PdfFile(object):
         self._core14fontdir = os.path.join(
             rcParams['datapath'], 'fonts', 'pdfcorefonts')
         self.fh = fh
+        self.streaming = streaming
         self.currentstream = None # stream object to write to, if any
+        self.compressor = None
+        if rcParams['pdf.compression_threads'] > 0:
+            self.compressor = StreamCompressor(
+                rcParams['pdf.compression_threads'])
         fh.write("%PDF-1.4\n")    # 1.4 is the first version to have alpha
         # Output some eight-bit chars as a comment so various utilities
         # recognize the file as binary by looking at the first few
@@ -415,19 +575,32 @@ class PdfFile(object):
         self.type1Descriptors = {} # differently encoded Type-1 fonts may
                                    # share the same descriptor
         self.used_characters = {}
+        self.fonts = {}         # maps internal font names to embedded fonts
 
+        # The resources are entered in the following dictionaries of
+        # names and objects as they are first used, but their contents
+        # only wait in the pending lists until the page is done.
         self.alphaStates = {}   # maps alpha values to graphics state objects
         self.nextAlphaState = 1
-        self.hatchPatterns = {}
+        self.hatchPatterns = {} # maps hatch styles to pattern names
+        self.hatchObjects = {}
+        self.pendingHatches = []
         self.nextHatch = 1
+        self.gouraudObjects = {}
         self.gouraudTriangles = []
 
-        self.images = {}
+        self.xobjects = {}      # maps XObject names to objects
+        self.images = {}        # maps image contents to XObject names
+        self.pendingImages = []
         self.nextImage = 1
 
         self.markers = {}
+        self.nextMarker = 0
         self.multi_byte_charprocs = {}
 
+        self.paths = {}
+        self.nextPath = 0
+
         # The PDF spec recommends to include every procset
         procsets = [ Name(x)
                      for x in "PDF Text ImageB ImageC ImageI".split() ]
@@ -444,7 +617,7 @@ class PdfFile(object):
         self.writeObject(self.resourceObject, resources)
 
     def newPage(self, width, height):
-        self.endStream()
+        self.endPage()
 
         self.width, self.height = width, height
         contentObject = self.reserveObject('page contents')
@@ -463,29 +636,45 @@ class PdfFile(object):
         # graphics context: currently only the join style needs to be set
         self.output(GraphicsContextPdf.joinstyles['round'], Op.setlinejoin)
 
-    def close(self):
+    def endPage(self):
+        """
+        Finish the current page, if any, and write out the objects
+        first used on it.  Only their names are kept for the resource
+        dictionaries.
+        """
         self.endStream()
+        self.writeHatches()
+        self.writeGouraudTriangles()
+        self.writeImages()
+        self.writeMarkers()
+        self.writePathCollectionTemplates()
+        if self.streaming:
+            self.writeFonts()
+
+    def close(self):
+        self.endPage()
         # Write out the various deferred objects
         self.writeFonts()
+        self.writeObject(self.fontObject, self.fonts)
         self.writeObject(self.alphaStateObject,
                          dict([(val[0], val[1])
                                for val in self.alphaStates.values()]))
-        self.writeHatches()
-        self.writeGouraudTriangles()
-        xobjects = dict(self.images.values())
-        for tup in self.markers.values():
-            xobjects[tup[0]] = tup[1]
+        self.writeObject(self.hatchObject, self.hatchObjects)
+        self.writeObject(self.gouraudObject, self.gouraudObjects)
+        xobjects = self.xobjects.copy()
         for name, value in self.multi_byte_charprocs.items():
             xobjects[name] = value
         self.writeObject(self.XObjectObject, xobjects)
-        self.writeImages()
-        self.writeMarkers()
         self.writeObject(self.pagesObject,
                          { 'Type': Name('Pages'),
                            'Kids': self.pageList,
                            'Count': len(self.pageList) })
         self.writeInfoDict()
 
+        if self.compressor is not None:
+            self.compressor.write(block=True)
+            self.compressor.close()
+
         # Finalize the file
         self.writeXref()
         self.writeTrailer()
@@ -504,14 +693,16 @@ class PdfFile(object):
         self.write(fill(map(pdfRepr, data)))
         self.write('\n')
 
-    def beginStream(self, id, len, extra=None):
+    def beginStream(self, id, len, extra=None, level=None):
         assert self.currentstream is None
-        self.currentstream = Stream(id, len, self, extra)
+        self.currentstream = Stream(id, len, self, extra, level)
 
     def endStream(self):
         if self.currentstream is not None:
             self.currentstream.end()
             self.currentstream = None
+        if self.compressor is not None:
+            self.compressor.write()
 
     def fontName(self, fontprop):
         """
@@ -543,8 +734,13 @@ class PdfFile(object):
         return Fx
 
     def writeFonts(self):
-        fonts = {}
+        """
+        Embed the fonts that have been used but not embedded yet.
+        """
+        fonts = self.fonts
         for filename, Fx in self.fontNames.items():
+            if Fx in fonts:
+                continue
             matplotlib.verbose.report('Embedding font %s' % filename, 'debug')
             if filename.endswith('.afm'):
                 # from pdf.use14corefonts
@@ -561,7 +757,14 @@ class PdfFile(object):
                 chars = self.used_characters.get(stat_key)
                 if chars is not None and len(chars[1]):
                     fonts[Fx] = self.embedTTF(realpath, chars[1])
-        self.writeObject(self.fontObject, fonts)
+        if self.streaming:
+            # The TrueType fonts are embedded with the characters used
+            # so far; text drawn from now on starts new subsets.
+            for filename in self.fontNames.keys():
+                if not (filename.endswith('.afm') or
+                        self.dviFontInfo.has_key(filename)):
+                    del self.fontNames[filename]
+            self.used_characters = {}
 
     def _write_afm_font(self, filename):
         fh = file(filename)
@@ -678,7 +881,8 @@ class PdfFile(object):
         self.beginStream(fontfileObject.id, None,
                          { 'Length1': len(t1font.parts[0]),
                            'Length2': len(t1font.parts[1]),
-                           'Length3': 0 })
+                           'Length3': 0 },
+                         rcParams['pdf.font_compression'])
         self.currentstream.write(t1font.parts[0])
         self.currentstream.write(t1font.parts[1])
         self.endStream()
@@ -817,7 +1021,8 @@ end"""
                     # value.
                     stream = stream[stream.find("d1") + 2:]
                 charprocObject = self.reserveObject('charProc')
-                self.beginStream(charprocObject.id, None, charprocDict)
+                self.beginStream(charprocObject.id, None, charprocDict,
+                                 rcParams['pdf.font_compression'])
                 self.currentstream.write(stream)
                 self.endStream()
 
@@ -875,7 +1080,8 @@ end"""
             self.beginStream(
                 fontfileObject.id,
                 self.reserveObject('length of font stream'),
-                {'Length1': length1Object})
+                {'Length1': length1Object},
+                rcParams['pdf.font_compression'])
             fontfile = open(filename, 'rb')
             length1 = 0
             while True:
@@ -934,14 +1140,16 @@ end"""
             cid_to_gid_map = "".join(cid_to_gid_map).encode("utf-16be")
             self.beginStream(cidToGidMapObject.id,
                              None,
-                             {'Length':  len(cid_to_gid_map)})
+                             {'Length':  len(cid_to_gid_map)},
+                             rcParams['pdf.font_compression'])
             self.currentstream.write(cid_to_gid_map)
             self.endStream()
 
             # ToUnicode CMap
             self.beginStream(toUnicodeMapObject.id,
                              None,
-                             {'Length': unicode_cmap})
+                             {'Length': unicode_cmap},
+                             rcParams['pdf.font_compression'])
             self.currentstream.write(unicode_cmap)
             self.endStream()
 
@@ -1033,14 +1241,14 @@ end"""
         name = Name('H%d' % self.nextHatch)
         self.nextHatch += 1
         self.hatchPatterns[hatch_style] = name
+        ob = self.reserveObject('hatch pattern')
+        self.hatchObjects[name] = ob
+        self.pendingHatches.append((hatch_style, ob))
         return name
 
     def writeHatches(self):
-        hatchDict = dict()
         sidelen = 72.0
-        for hatch_style, name in self.hatchPatterns.items():
-            ob = self.reserveObject('hatch pattern')
-            hatchDict[name] = ob
+        for hatch_style, ob in self.pendingHatches:
             res = { 'Procsets':
                     [ Name(x) for x in "PDF Text ImageB ImageC ImageI".split() ] }
             self.beginStream(
@@ -1072,18 +1280,17 @@ end"""
             self.output(Op.stroke)
 
             self.endStream()
-        self.writeObject(self.hatchObject, hatchDict)
+        self.pendingHatches = []
 
     def addGouraudTriangles(self, points, colors):
-        name = Name('GT%d' % len(self.gouraudTriangles))
-        self.gouraudTriangles.append((name, points, colors))
+        name = Name('GT%d' % len(self.gouraudObjects))
+        ob = self.reserveObject('Gouraud triangle')
+        self.gouraudObjects[name] = ob
+        self.gouraudTriangles.append((ob, points, colors))
         return name
 
     def writeGouraudTriangles(self):
-        gouraudDict = dict()
-        for name, points, colors in self.gouraudTriangles:
-            ob = self.reserveObject('Gouraud triangle')
-            gouraudDict[name] = ob
+        for ob, points, colors in self.gouraudTriangles:
             shape = points.shape
             flat_points = points.reshape((shape[0] * shape[1], 2))
             flat_colors = colors.reshape((shape[0] * shape[1], 4))
@@ -1115,19 +1322,38 @@ end"""
 
             self.write(streamarr.tostring())
             self.endStream()
-        self.writeObject(self.gouraudObject, gouraudDict)
+        self.gouraudTriangles = []
 
     def imageObject(self, image):
-        """Return name of an image XObject representing the given image."""
+        """Return name of an image XObject representing the given image.
 
-        pair = self.images.get(image, None)
-        if pair is not None:
-            return pair[0]
+        The pixels are copied out at once, and images with the same
+        contents share one XObject."""
+
+        image.flipud_out()
+        try:
+            if image.is_grayscale:
+                height, width, data = self._gray(image)
+                adata = None
+            else:
+                height, width, data, adata = self._rgb(image)
+        finally:
+            image.flipud_out()
+
+        digest = md5(data)
+        if adata is not None:
+            digest.update(adata)
+        key = (width, height, adata is None, digest.digest())
+        name = self.images.get(key)
+        if name is not None:
+            return name
 
         name = Name('I%d' % self.nextImage)
         ob = self.reserveObject('image %d' % self.nextImage)
         self.nextImage += 1
-        self.images[image] = (name, ob)
+        self.images[key] = name
+        self.xobjects[name] = ob
+        self.pendingImages.append((ob, width, height, data, adata))
         return name
 
     ## These two from backend_ps.py
@@ -1154,52 +1380,54 @@ end"""
         return rgbat[0], rgbat[1], gray.tostring()
 
     def writeImages(self):
-        for img, pair in self.images.items():
-            img.flipud_out()
-            if img.is_grayscale:
-                height, width, data = self._gray(img)
+        for ob, width, height, data, adata in self.pendingImages:
+            if adata is None:
                 self.beginStream(
-                    pair[1].id,
+                    ob.id,
                     self.reserveObject('length of image stream'),
                     {'Type': Name('XObject'), 'Subtype': Name('Image'),
                      'Width': width, 'Height': height,
-                     'ColorSpace': Name('DeviceGray'), 'BitsPerComponent': 8 })
+                     'ColorSpace': Name('DeviceGray'), 'BitsPerComponent': 8 },
+                    rcParams['pdf.image_compression'])
                 self.currentstream.write(data) # TODO: predictors (i.e., output png)
                 self.endStream()
             else:
-                height, width, data, adata = self._rgb(img)
                 smaskObject = self.reserveObject("smask")
                 stream = self.beginStream(
                     smaskObject.id,
                     self.reserveObject('length of smask stream'),
                     {'Type': Name('XObject'), 'Subtype': Name('Image'),
                      'Width': width, 'Height': height,
-                     'ColorSpace': Name('DeviceGray'), 'BitsPerComponent': 8 })
+                     'ColorSpace': Name('DeviceGray'), 'BitsPerComponent': 8 },
+                    rcParams['pdf.image_compression'])
                 self.currentstream.write(adata) # TODO: predictors (i.e., output png)
                 self.endStream()
 
                 self.beginStream(
-                    pair[1].id,
+                    ob.id,
                     self.reserveObject('length of image stream'),
                     {'Type': Name('XObject'), 'Subtype': Name('Image'),
                      'Width': width, 'Height': height,
                      'ColorSpace': Name('DeviceRGB'), 'BitsPerComponent': 8,
-                     'SMask': smaskObject})
+                     'SMask': smaskObject},
+                    rcParams['pdf.image_compression'])
                 self.currentstream.write(data) # TODO: predictors (i.e., output png)
                 self.endStream()
-
-            img.flipud_out()
+        self.pendingImages = []
 
     def markerObject(self, path, trans, fillp, lw):
         """Return name of a marker XObject representing the given path."""
         pathops = self.pathOperations(path, trans)
         key = (tuple(pathops), bool(fillp))
         result = self.markers.get(key)
-        if result is None:
-            name = Name('M%d' % len(self.markers))
-            ob = self.reserveObject('marker %d' % len(self.markers))
+        if result is None or (result[1] is None and result[-1] < lw):
+            # new, or already written with too small a bounding box
+            name = Name('M%d' % self.nextMarker)
+            ob = self.reserveObject('marker %d' % self.nextMarker)
+            self.nextMarker += 1
             bbox = path.get_extents(trans)
             self.markers[key] = [name, ob, bbox, lw]
+            self.xobjects[name] = ob
         else:
             if result[-1] < lw:
                 result[-1] = lw
@@ -1207,7 +1435,13 @@ end"""
         return name
 
     def writeMarkers(self):
-        for (pathops, fillp),(name, ob, bbox, lw) in self.markers.iteritems():
+        # Written markers are kept, without their object, so they can
+        # be reused as long as their bounding box is large enough.
+        for (pathops, fillp), result in self.markers.iteritems():
+            name, ob, bbox, lw = result
+            if ob is None:
+                continue
+            result[1] = None
             bbox = bbox.padded(lw * 0.5)
             self.beginStream(
                 ob.id, None,
@@ -1220,6 +1454,40 @@ end"""
                 self.output(Op.stroke)
             self.endStream()
 
+    def pathCollectionObject(self, path, trans, paint, padding):
+        """Return name of a Form XObject drawing the given path with
+        the given paint operator, for reuse by draw_path_collection."""
+        pathops = self.pathOperations(path, trans)
+        key = (tuple(pathops), paint)
+        result = self.paths.get(key)
+        if result is None or (result[1] is None and result[-1] < padding):
+            name = Name('P%d' % self.nextPath)
+            ob = self.reserveObject('path %d' % self.nextPath)
+            self.nextPath += 1
+            bbox = path.get_extents(trans)
+            self.paths[key] = [name, ob, bbox, padding]
+            self.xobjects[name] = ob
+        else:
+            if result[-1] < padding:
+                result[-1] = padding
+            name = result[0]
+        return name
+
+    def writePathCollectionTemplates(self):
+        for (pathops, paint), result in self.paths.iteritems():
+            name, ob, bbox, padding = result
+            if ob is None:
+                continue
+            result[1] = None
+            bbox = bbox.padded(padding * 0.5)
+            self.beginStream(
+                ob.id, None,
+                {'Type': Name('XObject'), 'Subtype': Name('Form'),
+                 'BBox': list(bbox.extents) })
+            self.output(*pathops)
+            self.output(paint)
+            self.endStream()
+
     @staticmethod
     def pathOperations(path, transform, clip=None):
         cmds = []
@@ -1424,6 +1692,111 @@ class RendererPdf(RendererBase):
                 lastx, lasty = x, y
         output(Op.grestore)
 
+    def draw_path_collection(self, gc, master_transform, paths, all_transforms,
+                             offsets, offsetTrans, facecolors, edgecolors,
+                             linewidths, linestyles, antialiaseds, urls):
+        # Each unique path is written once as a Form XObject that also
+        # contains the paint operator, and is then placed at every
+        # offset.  Hatches are tiled relative to the form's coordinate
+        # system, so those collections take the generic route, as do
+        # collections where the forms would not be reused enough to
+        # pay for their definitions.
+        Npaths = max(len(paths), len(all_transforms))
+        Noffsets = len(offsets)
+        uses_per_path = max(Npaths, Noffsets) // max(Npaths, 1)
+        len_path = 0
+        if len(paths):
+            len_path = len(paths[0])
+        if (gc.get_hatch() is not None or
+            len_path + uses_per_path + 5 >= len_path * uses_per_path):
+            return RendererBase.draw_path_collection(
+                self, gc, master_transform, paths, all_transforms,
+                offsets, offsetTrans, facecolors, edgecolors,
+                linewidths, linestyles, antialiaseds, urls)
+
+        padding = 0.0
+        if len(linewidths):
+            padding = max(linewidths)
+
+        raw_paths = list(self._iter_collection_raw_paths(
+            master_transform, paths, all_transforms))
+        path_ids = range(len(raw_paths))
+        names = {}
+
+        # The clip region is the same for every element, so set it up
+        # before the gsave; check_gc will then never need to pop the
+        # state inside the loop and lose the accumulated translation.
+        self.check_gc(gc)
+        output = self.file.output
+        output(*self.gc.push())
+        lastx, lasty = 0, 0
+        for xo, yo, path_id, gc0, rgbFace in self._iter_collection(
+            gc, path_ids, offsets, offsetTrans, facecolors, edgecolors,
+            linewidths, linestyles, antialiaseds, urls):
+
+            self.check_gc(gc0, rgbFace)
+            paint = self.gc.paint()
+            if paint is Op.endpath:
+                continue
+            name = names.get((path_id, paint))
+            if name is None:
+                path, transform = raw_paths[path_id]
+                name = self.file.pathCollectionObject(
+                    path, transform, paint, padding)
+                names[(path_id, paint)] = name
+            dx, dy = xo - lastx, yo - lasty
+            output(1, 0, 0, 1, dx, dy, Op.concat_matrix,
+                   name, Op.use_xobject)
+            lastx, lasty = xo, yo
+        output(*self.gc.pop())
+
+    def draw_quad_mesh(self, gc, master_transform, meshWidth, meshHeight,
+                       coordinates, offsets, offsetTrans, facecolors,
+                       antialiased, showedges):
+        # Write the quadrilaterals straight from the transformed mesh
+        # rather than building a Path and a graphics context per quad.
+        if len(offsets) > 1 or not len(facecolors):
+            return RendererBase.draw_quad_mesh(
+                self, gc, master_transform, meshWidth, meshHeight,
+                coordinates, offsets, offsetTrans, facecolors,
+                antialiased, showedges)
+
+        if npy.ma.isMaskedArray(coordinates):
+            coordinates = coordinates.data
+        shape = coordinates.shape
+        points = master_transform.transform(
+            coordinates.reshape((shape[0] * shape[1], 2))).reshape(shape)
+        if len(offsets):
+            points = points + offsetTrans.transform(offsets)[0]
+        quads = npy.concatenate((
+                points[0:-1, 0:-1],
+                points[0:-1, 1:  ],
+                points[1:  , 1:  ],
+                points[1:  , 0:-1]
+                ), axis=2)
+        quads = quads.reshape((meshWidth * meshHeight, 8))
+
+        gc0 = self.new_gc()
+        gc0.copy_properties(gc)
+        gc0.set_antialiased(antialiased)
+        if showedges:
+            gc0.set_foreground((0.0, 0.0, 0.0))
+            gc0.set_linewidth(1.0)
+        else:
+            gc0.set_linewidth(0.0)
+
+        output = self.file.output
+        Nfacecolors = len(facecolors)
+        for i, quad in enumerate(quads):
+            rgbFace = facecolors[i % Nfacecolors]
+            gc0.set_alpha(rgbFace[3])
+            self.check_gc(gc0, rgbFace[:3])
+            x0, y0, x1, y1, x2, y2, x3, y3 = quad
+            output(x0, y0, Op.moveto, x1, y1, Op.lineto,
+                   x2, y2, Op.lineto, x3, y3, Op.lineto,
+                   Op.closepath, self.gc.paint())
+        gc0.restore()
+
     def draw_gouraud_triangle(self, gc, points, colors, trans):
         self.draw_gouraud_triangles(gc, points.reshape((1, 3, 2)),
                                     colors.reshape((1, 3, 4)), trans)
@@ -2075,13 +2448,20 @@ class PdfPages(object):
     """
     __slots__ = ('_file',)
 
-    def __init__(self, filename):
+    def __init__(self, filename, streaming=False):
         """
         Create a new PdfPages object that will be written to the file
         named *filename*. The file is opened at once and any older
         file with the same name is overwritten.
+
+        Everything a page needs is written out when the page is saved,
+        except for the subsets of the TrueType fonts, which are
+        embedded when the file is closed.  With *streaming*, they are
+        embedded with each page too, so that the memory use does not
+        grow with the number of pages; the file gets larger as glyphs
+        used on several pages are embedded several times.
         """
-        self._file = PdfFile(filename)
+        self._file = PdfFile(filename, streaming)
 
     def close(self):
         """
@@ -2152,7 +2532,7 @@ class FigureCanvasPdf(FigureCanvasBase):
         self.figure.draw(renderer)
         renderer.finalize()
         if isinstance(filename, PdfPages): # finish off this page
-            file.endStream()
+            file.endPage()
         else:            # we opened the file above; now finish it off
             file.close()
 
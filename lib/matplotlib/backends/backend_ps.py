@@ -166,6 +166,8 @@ class RendererPS(RendererBase):
         self.image_magnification = imagedpi/72.0
         self._clip_paths = {}
         self._path_collection_id = 0
+        self._images = {}
+        self._markers = {}
 
         self.used_characters = {}
         self.mathtext_parser = MathTextParser("PS")
@@ -398,7 +400,31 @@ class RendererPS(RendererBase):
         else:
             h, w, bits = self._rgb(im)
             imagecmd = "false 3 colorimage"
-        hexlines = '\n'.join(self._hex_lines(bits))
+
+        # unflip
+        im.flipud_out()
+
+        # most images are drawn once, and are read inline from the
+        # file; an image drawn again is kept in an array of strings
+        # (a string holds at most 65535 bytes) and read from there
+        key = (h, w, imagecmd, md5(bits).digest())
+        definition = ''
+        if key not in self._images:
+            self._images[key] = None
+            setup = '/DataString %d string def' % w
+            source = 'currentfile DataString readhexstring pop'
+            hexlines = '\n'.join(self._hex_lines(bits))
+        else:
+            name = self._images[key]
+            if name is None:
+                name = 'I%s' % md5(str(key)).hexdigest()
+                self._images[key] = name
+                chunks = ['<%s>' % '\n'.join(self._hex_lines(bits[i:i+32768]))
+                          for i in range(0, len(bits), 32768)]
+                definition = '/%s [\n%s\n] def\n' % (name, '\n'.join(chunks))
+            setup = '/DataIndex -1 def'
+            source = '/DataIndex DataIndex 1 add def %s DataIndex get' % name
+            hexlines = ''
 
         xscale, yscale = (
             w/self.image_magnification, h/self.image_magnification)
@@ -419,23 +445,20 @@ class RendererPS(RendererBase):
         clip = '\n'.join(clip)
 
         #y = figh-(y+h)
-        ps = """gsave
+        ps = definition + """gsave
 %(clip)s
 %(x)s %(y)s translate
 %(xscale)s %(yscale)s scale
-/DataString %(w)s string def
+%(setup)s
 %(w)s %(h)s 8 [ %(w)s 0 0 -%(h)s 0 %(h)s ]
 {
-currentfile DataString readhexstring pop
+%(source)s
 } bind %(imagecmd)s
 %(hexlines)s
 grestore
 """ % locals()
         self._pswriter.write(ps)
 
-        # unflip
-        im.flipud_out()
-
     def _convert_path(self, path, transform, clip=False):
         ps = []
         last_points = None
@@ -499,18 +522,27 @@ grestore
                 ps_color = '%1.3f %1.3f %1.3f setrgbcolor' % rgbFace
 
         # construct the generic marker command:
-        ps_cmd = ['/o {', 'gsave', 'newpath', 'translate'] # dont want the translate to be global
-        ps_cmd.append(self._convert_path(marker_path, marker_trans))
+        marker = ['gsave', 'newpath', 'translate'] # dont want the translate to be global
+        marker.append(self._convert_path(marker_path, marker_trans))
 
         if rgbFace:
-            ps_cmd.extend(['gsave', ps_color, 'fill', 'grestore'])
+            marker.extend(['gsave', ps_color, 'fill', 'grestore'])
+
+        marker.extend(['stroke', 'grestore'])
+        marker = '\n'.join(marker)
 
-        ps_cmd.extend(['stroke', 'grestore', '} bind def'])
+        # markers with the same outline and fill are defined only once
+        name = self._markers.get(marker)
+        ps_cmd = []
+        if name is None:
+            name = 'm%s' % md5(marker).hexdigest()
+            self._markers[marker] = name
+            ps_cmd.extend(['/%s {' % name, marker, '} bind def'])
 
         for vertices, code in path.iter_segments(trans, simplify=False):
             if len(vertices):
                 x, y = vertices[-2:]
-                ps_cmd.append("%g %g o" % (x, y))
+                ps_cmd.append("%g %g %s" % (x, y, name))
 
         ps = '\n'.join(ps_cmd)
         self._draw_ps(ps, gc, rgbFace, fill=False, stroke=False)
@@ -202,7 +202,8 @@ class FigureCanvasQT( QtGui.QWidget, FigureCanvasBase ):
         d = self._idle
         self._idle = False
         def idle_draw(*args):
-            self.draw()
+            if self.figure.get_stale():
+                self.draw()
             self._idle = True
         if d: QtCore.QTimer.singleShot(0, idle_draw)
 
@@ -55,6 +55,7 @@ class RendererSVG(RendererBase):
         self._markers = {}
         self._path_collection_id = 0
         self._imaged = {}
+        self._images = {}
         self._hatchd = {}
         self._n_gradients = 0
         self.mathtext_parser = MathTextParser('SVG')
@@ -382,33 +383,51 @@ class RendererSVG(RendererBase):
 
         h,w = im.get_size_out()
 
+        im.flipud_out()
+        rows, cols, buffer = im.as_rgba_str()
+        im.flipud_out()
+        # an image drawn again with the same pixels and scale is not
+        # stored a second time
+        key = (rows, cols, tuple(trans), md5(buffer).digest())
+        x0, y0 = x/trans[0], (self.height-y)/trans[3]-h
+
         url = getattr(im, '_url', None)
         if url is not None:
             self._svgwriter.write('<a xlink:href="%s">' % url)
-        self._svgwriter.write (
-            '<image x="%f" y="%f" width="%f" height="%f" '
-            '%s xlink:href="'%(x/trans[0], (self.height-y)/trans[3]-h, w, h, transstr)
-            )
 
         if rcParams['svg.image_inline']:
-            self._svgwriter.write("data:image/png;base64,\n")
-            stringio = cStringIO.StringIO()
-            im.flipud_out()
-            rows, cols, buffer = im.as_rgba_str()
-            _png.write_png(buffer, cols, rows, stringio)
-            im.flipud_out()
-            self._svgwriter.write(base64.encodestring(stringio.getvalue()))
+            image = self._images.get(key)
+            if image is None:
+                id = 'i%s' % md5(str(key)).hexdigest()
+                self._images[key] = id, x0, y0
+                self._svgwriter.write (
+                    '<image id="%s" x="%f" y="%f" width="%f" height="%f" '
+                    '%s xlink:href="'%(id, x0, y0, w, h, transstr)
+                    )
+                self._svgwriter.write("data:image/png;base64,\n")
+                stringio = cStringIO.StringIO()
+                _png.write_png(buffer, cols, rows, stringio)
+                self._svgwriter.write(base64.encodestring(stringio.getvalue()))
+                self._svgwriter.write('"/>\n')
+            else:
+                # <use> offsets the first copy in the outer coordinates
+                id, x1, y1 = image
+                self._svgwriter.write(
+                    '<use xlink:href="#%s" x="%f" y="%f"/>\n' %
+                    (id, (x0-x1)*trans[0], (y0-y1)*trans[3]))
         else:
-            self._imaged[self.basename] = self._imaged.get(self.basename,0) + 1
-            filename = '%s.image%d.png'%(self.basename, self._imaged[self.basename])
-            verbose.report( 'Writing image file for inclusion: %s' % filename)
-            im.flipud_out()
-            rows, cols, buffer = im.as_rgba_str()
-            _png.write_png(buffer, cols, rows, filename)
-            im.flipud_out()
-            self._svgwriter.write(filename)
-
-        self._svgwriter.write('"/>\n')
+            filename = self._images.get(key)
+            if filename is None:
+                self._imaged[self.basename] = self._imaged.get(self.basename,0) + 1
+                filename = '%s.image%d.png'%(self.basename, self._imaged[self.basename])
+                verbose.report( 'Writing image file for inclusion: %s' % filename)
+                _png.write_png(buffer, cols, rows, filename)
+                self._images[key] = filename
+            self._svgwriter.write (
+                '<image x="%f" y="%f" width="%f" height="%f" '
+                '%s xlink:href="%s"/>\n'%(x0, y0, w, h, transstr, filename)
+                )
+
         if url is not None:
             self._svgwriter.write('</a>')
 
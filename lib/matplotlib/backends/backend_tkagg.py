@@ -227,7 +227,8 @@ class FigureCanvasTkAgg(FigureCanvasAgg):
         d = self._idle
         self._idle = False
         def idle_draw(*args):
-            self.draw()
+            if self.figure.get_stale():
+                self.draw()
             self._idle = True
 
         if d: self._tkcanvas.after_idle(idle_draw)
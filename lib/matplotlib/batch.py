@@ -0,0 +1,257 @@
+"""
+Export many figures, spreading the work over a pool of worker
+processes.
+
+pyplot's figure manager and the Agg canvas keep global state, so
+figures cannot be drawn concurrently in threads; separate processes
+each get their own copy.  Every job is a function that builds a
+:class:`~matplotlib.figure.Figure`, together with the files to save
+it to::
+
+    from matplotlib.figure import Figure
+    from matplotlib.batch import FigureJob, export_figures
+
+    def make_report(year):
+        fig = Figure()
+        ax = fig.add_subplot(111)
+        ...
+        return fig
+
+    jobs = [FigureJob(make_report, ['report%d.png' % year,
+                                    'report%d.pdf' % year], args=(year,))
+            for year in range(1990, 2010)]
+    for result in export_figures(jobs, processes=4):
+        if result.error is not None:
+            print result.name, 'failed:', result.error
+        else:
+            print result.name, 'took', result.build_time + result.save_time
+
+The job functions and their arguments are pickled to reach the
+workers, so the functions have to be defined at the top level of a
+module.  Results stream back as soon as each figure is written, in
+the order the jobs finish; :attr:`FigureResult.index` gives the
+position of the job in the input.
+
+Without the :mod:`multiprocessing` module (python < 2.6), or with
+*processes* = 1, the jobs are run one after another in the calling
+process.
+"""
+
+import os, sys, time, traceback
+
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None
+
+import matplotlib
+import matplotlib.cbook as cbook
+
+
+class FigureJob(object):
+    """
+    A figure to export: ``func(*args, **kwargs)`` builds and returns
+    the :class:`~matplotlib.figure.Figure`, which is saved to each of
+    *fnames* (a file name or a sequence of them) with
+    ``savefig(fname, **savefig_kw)``.  *name* identifies the job in
+    its :class:`FigureResult` and defaults to the first file name.
+    """
+    def __init__(self, func, fnames, args=(), kwargs=None,
+                 savefig_kw=None, name=None):
+        if cbook.is_string_like(fnames):
+            fnames = [fnames]
+        self.func = func
+        self.fnames = list(fnames)
+        self.args = tuple(args)
+        if kwargs is None: kwargs = {}
+        self.kwargs = kwargs
+        if savefig_kw is None: savefig_kw = {}
+        self.savefig_kw = savefig_kw
+        if name is None and len(self.fnames):
+            name = self.fnames[0]
+        self.name = name
+
+
+class FigureResult(object):
+    """
+    The outcome of one :class:`FigureJob`.
+
+    *index*
+        the position of the job in the sequence passed to
+        :func:`export_figures`
+
+    *name*, *fnames*
+        copied from the job
+
+    *build_time*, *save_time*
+        seconds spent building the figure and saving it
+
+    *error*
+        None on success, otherwise the formatted traceback of the
+        exception raised by the job
+
+    *pid*
+        the id of the process that ran the job
+    """
+    def __init__(self, index, job):
+        self.index = index
+        self.name = job.name
+        self.fnames = job.fnames
+        self.build_time = 0.0
+        self.save_time = 0.0
+        self.error = None
+        self.pid = os.getpid()
+
+    def __repr__(self):
+        if self.error is None:
+            status = 'ok'
+        else:
+            status = 'failed'
+        return '<FigureResult %d %r: %s, %.3fs>' % (
+            self.index, self.name, status, self.build_time + self.save_time)
+
+
+def _destroy_figure(fig):
+    'Drop *fig* from the pyplot figure manager, if it was made there.'
+    from matplotlib._pylab_helpers import Gcf
+    for num, manager in Gcf.figs.items():
+        if manager.canvas.figure is fig:
+            Gcf.destroy(num)
+
+
+def _run_job(item):
+    'Build and save the figure of the (index, job) pair *item*.'
+    index, job = item
+    result = FigureResult(index, job)
+    fig = None
+    try:
+        t0 = time.time()
+        fig = job.func(*job.args, **job.kwargs)
+        t1 = time.time()
+        result.build_time = t1 - t0
+        from matplotlib.figure import Figure
+        if not isinstance(fig, Figure):
+            raise TypeError('%r returned %r instead of a Figure' %
+                            (job.func, fig))
+        if fig.canvas is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            FigureCanvasAgg(fig)
+        for fname in job.fnames:
+            fig.savefig(fname, **job.savefig_kw)
+        result.save_time = time.time() - t1
+    except Exception:
+        result.error = traceback.format_exc()
+    if fig is not None:
+        _destroy_figure(fig)
+    return result
+
+
+def _run_worker_job(item):
+    'Run *item* in a worker and leave no pyplot figures behind.'
+    result = _run_job(item)
+    from matplotlib._pylab_helpers import Gcf
+    for num in Gcf.figs.keys():
+        Gcf.destroy(num)
+    return result
+
+
+def _init_worker(backend, rc, initializer, initargs):
+    """
+    Prepare a worker process: select *backend*, apply the *rc*
+    settings, load the font cache and call *initializer*.
+    """
+    matplotlib.use(backend, warn=False)
+    if ('matplotlib.pyplot' in sys.modules and
+        matplotlib.get_backend().lower() != backend.lower()):
+        # the worker was forked from a process that had pyplot loaded
+        sys.modules['matplotlib.pyplot'].switch_backend(backend)
+    if rc:
+        matplotlib.rcParams.update(rc)
+    from matplotlib import font_manager
+    font_manager.findfont(font_manager.FontProperties())
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _export_serial(jobs, rc, initializer, initargs):
+    if initializer is not None:
+        initializer(*initargs)
+    for item in enumerate(jobs):
+        if rc:
+            orig = matplotlib.rcParams.copy()
+            matplotlib.rcParams.update(rc)
+            try:
+                result = _run_job(item)
+            finally:
+                matplotlib.rcParams.update(orig)
+        else:
+            result = _run_job(item)
+        yield result
+
+
+class _PoolResults(object):
+    """
+    Iterate over the results of a pool of workers, shutting the pool
+    down once they are exhausted, on error, or on :meth:`close`.
+    """
+    def __init__(self, pool, results):
+        self._pool = pool
+        self._results = results
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self._pool is None:
+            raise StopIteration
+        try:
+            return self._results.next()
+        except StopIteration:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            raise
+        except:
+            self.close()
+            raise
+
+    def close(self):
+        'Stop the workers, abandoning the jobs that have not finished.'
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __del__(self):
+        self.close()
+
+
+def export_figures(jobs, processes=None, backend='agg', rc=None,
+                   initializer=None, initargs=(), chunksize=1):
+    """
+    Build and save the figures of the :class:`FigureJob` instances in
+    *jobs* in *processes* worker processes (default: one per cpu) and
+    return an iterator over their :class:`FigureResult` objects, which
+    come in the order the jobs finish.
+
+    Each worker is set up once: it switches to *backend*, updates
+    :data:`matplotlib.rcParams` with the dictionary *rc*, loads the
+    font cache and finally calls ``initializer(*initargs)``.  Figures
+    left open in pyplot by a job are closed after it.  An exception in
+    a job is recorded in its result and does not stop the others.
+    *chunksize* jobs are sent to a worker at a time; raise it when
+    there are many small figures.
+
+    When the jobs run in the calling process, *backend* is left alone
+    and *rc* is applied around each job only.
+    """
+    jobs = list(jobs)
+    if processes is None and multiprocessing is not None:
+        processes = multiprocessing.cpu_count()
+    if multiprocessing is None or processes == 1:
+        return _export_serial(jobs, rc, initializer, initargs)
+    pool = multiprocessing.Pool(processes, _init_worker,
+                                (backend, rc, initializer, initargs))
+    results = pool.imap_unordered(_run_worker_job, list(enumerate(jobs)),
+                                  chunksize)
+    return _PoolResults(pool, results)
@@ -17,7 +17,7 @@ This provides several classes used for blocking interaction with figure windows:
     Note: Subclass of BlockingMouseInput.  Used by clabel
 """
 
-from matplotlib import path, verbose
+from matplotlib import verbose
 from matplotlib.cbook import is_sequence_of_strings
 
 class BlockingInput(object):
@@ -356,13 +356,13 @@ class BlockingContourLabeler( BlockingMouseInput ):
                          cs.labelCValueList[lmin])
 
             if self.inline:
-                # Remove old, not looping over paths so we can do this up front
-                paths.pop(segmin)
-
-                # Add paths if not empty or single point
+                # Replace the old segment by the pieces around the
+                # label, leaving out any that are empty or single points
+                segs = [p.vertices for i, p in enumerate(paths) if i != segmin]
                 for n in nlc:
                     if len(n)>1:
-                        paths.append( path.Path(n) )
+                        segs.append(n)
+                cs.collections[conmin].set_segments(segs)
 
             self.fig.canvas.draw()
         else: # Remove event if not valid
@@ -1007,6 +1007,127 @@ class maxdict(dict):
         dict.__setitem__(self, k, v)
 
 
+class LRUCache(object):
+    """
+    A thread-safe mapping which discards its least recently used
+    entries once it holds more than *maxsize* entries or, if
+    *maxbytes* is given, once the total of ``sizeof(value)`` over all
+    values exceeds *maxbytes*.  *sizeof* defaults to :func:`len`.
+
+    Lookups through :meth:`get` are counted; see :meth:`stats`.
+    """
+    def __init__(self, maxsize=None, maxbytes=None, sizeof=len):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        """
+        Remove all entries and reset the hit and miss counters.
+        """
+        self._lock.acquire()
+        try:
+            # Entries are [prev, next, key, value, nbytes] nodes of a
+            # circular doubly linked list, most recently used first.
+            self._root = root = [None, None, None, None, 0]
+            root[0] = root[1] = root
+            self._map = {}
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+        finally:
+            self._lock.release()
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def _unlink(self, node):
+        node[0][1] = node[1]
+        node[1][0] = node[0]
+
+    def _link_front(self, node):
+        root = self._root
+        node[0] = root
+        node[1] = root[1]
+        root[1][0] = node
+        root[1] = node
+
+    def get(self, key, default=None):
+        """
+        Return the value for *key*, marking it as most recently used,
+        or *default* if *key* is not cached.
+        """
+        self._lock.acquire()
+        try:
+            node = self._map.get(key)
+            if node is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._unlink(node)
+            self._link_front(node)
+            return node[3]
+        finally:
+            self._lock.release()
+
+    def __getitem__(self, key):
+        value = self.get(key, self)
+        if value is self:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if self.maxbytes is not None:
+            nbytes = self._sizeof(value)
+        else:
+            nbytes = 0
+        self._lock.acquire()
+        try:
+            node = self._map.pop(key, None)
+            if node is not None:
+                self._unlink(node)
+                self.nbytes -= node[4]
+            if self.maxbytes is not None and nbytes > self.maxbytes:
+                # Never going to fit
+                return
+            node = [None, None, key, value, nbytes]
+            self._link_front(node)
+            self._map[key] = node
+            self.nbytes += nbytes
+            root = self._root
+            while ((self.maxsize is not None and
+                    len(self._map) > self.maxsize) or
+                   (self.maxbytes is not None and
+                    self.nbytes > self.maxbytes)):
+                oldest = root[0]
+                self._unlink(oldest)
+                del self._map[oldest[2]]
+                self.nbytes -= oldest[4]
+        finally:
+            self._lock.release()
+
+    def __delitem__(self, key):
+        self._lock.acquire()
+        try:
+            node = self._map.pop(key)
+            self._unlink(node)
+            self.nbytes -= node[4]
+        finally:
+            self._lock.release()
+
+    def stats(self):
+        """
+        Return a dictionary with the number of *hits* and *misses* of
+        :meth:`get`, and the current number of *entries* and *nbytes*.
+        """
+        return dict(hits=self.hits, misses=self.misses,
+                    entries=len(self._map), nbytes=self.nbytes)
+
 
 class Stack(object):
     """
@@ -193,6 +193,9 @@ class ScalarMappable:
         'Set the image array from numpy array *A*'
         self._A = A
         self.update_dict['array'] = True
+        # a mappable artist needs to be drawn again
+        if hasattr(self, 'set_stale'):
+            self.set_stale()
 
     def get_array(self):
         'Return the array'
@@ -285,3 +288,7 @@ class ScalarMappable:
 
         for key in self.update_dict:
             self.update_dict[key] = True
+
+        # a mappable artist needs to be drawn again
+        if hasattr(self, 'set_stale'):
+            self.set_stale()
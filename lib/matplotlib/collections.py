@@ -133,6 +133,13 @@ class Collection(artist.Artist, cm.ScalarMappable):
 
 
     def get_paths(self):
+        """
+        Return the paths of the collection.  For
+        :class:`PolyCollection` and :class:`LineCollection` this is a
+        :class:`~matplotlib.path.PathArray`, which can be indexed and
+        iterated like a list of paths but not changed in place; use
+        :meth:`set_paths` to replace the paths.
+        """
         return self._paths
 
     def set_paths(self):
@@ -147,7 +154,7 @@ class Collection(artist.Artist, cm.ScalarMappable):
         offsets = self._offsets
         paths = self.get_paths()
         if not transform.is_affine:
-            paths = [transform.transform_path_non_affine(p) for p in paths]
+            paths = self._transform_paths_non_affine(transform, paths)
             transform = transform.get_affine()
         if not transOffset.is_affine:
             offsets = transOffset.transform_non_affine(offsets)
@@ -160,6 +167,15 @@ class Collection(artist.Artist, cm.ScalarMappable):
         result = result.inverse_transformed(transData)
         return result
 
+    def _transform_paths_non_affine(self, transform, paths):
+        """
+        Apply the non-affine part of *transform* to *paths*; a
+        :class:`~matplotlib.path.PathArray` is transformed in one go.
+        """
+        if isinstance(paths, mpath.PathArray):
+            return paths.transformed_non_affine(transform)
+        return [transform.transform_path_non_affine(p) for p in paths]
+
     def get_window_extent(self, renderer):
         bbox = self.get_datalim(transforms.IdentityTransform())
         #TODO:check to ensure that this does not fail for
@@ -175,13 +191,19 @@ class Collection(artist.Artist, cm.ScalarMappable):
         paths = self.get_paths()
 
         if self.have_units():
-            paths = []
-            for path in self.get_paths():
-                vertices = path.vertices
-                xs, ys = vertices[:, 0], vertices[:, 1]
-                xs = self.convert_xunits(xs)
-                ys = self.convert_yunits(ys)
-                paths.append(mpath.Path(zip(xs, ys), path.codes))
+            if isinstance(paths, mpath.PathArray):
+                xs = self.convert_xunits(paths.vertices[:, 0])
+                ys = self.convert_yunits(paths.vertices[:, 1])
+                paths = mpath.PathArray(np.column_stack([xs, ys]),
+                                        paths.codes, paths.starts)
+            else:
+                paths = []
+                for path in self.get_paths():
+                    vertices = path.vertices
+                    xs, ys = vertices[:, 0], vertices[:, 1]
+                    xs = self.convert_xunits(xs)
+                    ys = self.convert_yunits(ys)
+                    paths.append(mpath.Path(zip(xs, ys), path.codes))
             if len(self._offsets):
                 xs = self.convert_xunits(self._offsets[:,0])
                 ys = self.convert_yunits(self._offsets[:,1])
@@ -190,7 +212,7 @@ class Collection(artist.Artist, cm.ScalarMappable):
         offsets = np.asarray(offsets, np.float_)
 
         if not transform.is_affine:
-            paths = [transform.transform_path_non_affine(path) for path in paths]
+            paths = self._transform_paths_non_affine(transform, paths)
             transform = transform.get_affine()
         if not transOffset.is_affine:
             offsets = transOffset.transform_non_affine(offsets)
@@ -262,6 +284,7 @@ class Collection(artist.Artist, cm.ScalarMappable):
             self._offsets = offsets
         else:
             self._uniform_offsets = offsets
+        self.set_stale()
 
     def get_offsets(self):
         """
@@ -283,6 +306,7 @@ class Collection(artist.Artist, cm.ScalarMappable):
         """
         if lw is None: lw = mpl.rcParams['patch.linewidth']
         self._linewidths = self._get_value(lw)
+        self.set_stale()
 
     def set_linewidths(self, lw):
         """alias for set_linewidth"""
@@ -333,6 +357,7 @@ class Collection(artist.Artist, cm.ScalarMappable):
         except ValueError:
             raise ValueError('Do not know how to convert %s to dashes'%ls)
         self._linestyles = dashes
+        self.set_stale()
 
     def set_linestyles(self, ls):
         """alias for set_linestyle"""
@@ -351,6 +376,7 @@ class Collection(artist.Artist, cm.ScalarMappable):
         if aa is None:
             aa = mpl.rcParams['patch.antialiased']
         self._antialiaseds = self._get_bool(aa)
+        self.set_stale()
 
     def set_antialiaseds(self, aa):
         """alias for set_antialiased"""
@@ -390,6 +416,7 @@ class Collection(artist.Artist, cm.ScalarMappable):
         if c is None: c = mpl.rcParams['patch.facecolor']
         self._facecolors_original = c
         self._facecolors = mcolors.colorConverter.to_rgba_array(c, self._alpha)
+        self.set_stale()
 
     def set_facecolors(self, c):
         """alias for set_facecolor"""
@@ -432,6 +459,7 @@ class Collection(artist.Artist, cm.ScalarMappable):
             if c is None: c = mpl.rcParams['patch.edgecolor']
             self._edgecolors_original = c
             self._edgecolors = mcolors.colorConverter.to_rgba_array(c, self._alpha)
+        self.set_stale()
 
 
     def set_edgecolors(self, c):
@@ -539,6 +567,7 @@ class PathCollection(Collection):
 
     def set_paths(self, paths):
         self._paths = paths
+        self.set_stale()
 
 
 class PolyCollection(Collection):
@@ -568,27 +597,10 @@ class PolyCollection(Collection):
 
     def set_verts(self, verts, closed=True):
         '''This allows one to delay initialization of the vertices.'''
-        if np.ma.isMaskedArray(verts):
-            verts = verts.astype(np.float_).filled(np.nan)
-            # This is much faster than having Path do it one at a time.
-        if closed:
-            self._paths = []
-            for xy in verts:
-                if len(xy):
-                    if np.ma.isMaskedArray(xy):
-                        xy = np.ma.concatenate([xy, np.zeros((1,2))])
-                    else:
-                        xy = np.asarray(xy)
-                        xy = np.concatenate([xy, np.zeros((1,2))])
-                    codes = np.empty(xy.shape[0], dtype=mpath.Path.code_type)
-                    codes[:] = mpath.Path.LINETO
-                    codes[0] = mpath.Path.MOVETO
-                    codes[-1] = mpath.Path.CLOSEPOLY
-                    self._paths.append(mpath.Path(xy, codes))
-                else:
-                    self._paths.append(mpath.Path(xy))
-        else:
-            self._paths = [mpath.Path(xy) for xy in verts]
+        # All the polygons go into the arrays of a single PathArray,
+        # which is much faster and smaller than a Path for each.
+        self._paths = mpath.PathArray.from_polygons(verts, closed)
+        self.set_stale()
 
     set_paths = set_verts
 
@@ -825,16 +837,15 @@ class LineCollection(Collection):
 
     def set_segments(self, segments):
         if segments is None: return
-        _segments = []
-
-        for seg in segments:
-
-            if not np.ma.isMaskedArray(seg):
-                seg = np.asarray(seg, np.float_)
-            _segments.append(seg)
         if self._uniform_offsets is not None:
-            _segments = self._add_offsets(_segments)
-        self._paths = [mpath.Path(seg) for seg in _segments]
+            _segments = []
+            for seg in segments:
+                if not np.ma.isMaskedArray(seg):
+                    seg = np.asarray(seg, np.float_)
+                _segments.append(seg)
+            segments = self._add_offsets(_segments)
+        self._paths = mpath.PathArray.from_polygons(segments)
+        self.set_stale()
 
     set_verts = set_segments # for compatibility with PolyCollection
     set_paths = set_segments
@@ -984,6 +995,7 @@ class EllipseCollection(Collection):
         for x, y, a in zip(self._widths, self._heights, self._angles):
             trans = _affine().scale(x * sc, y * sc).rotate(a)
             self._transforms.append(trans)
+        self.set_stale()
 
     def draw(self, renderer):
         if True: ###not self._transforms:
@@ -1050,6 +1062,7 @@ class PatchCollection(Collection):
         paths = [p.get_transform().transform_path(p.get_path())
                         for p in patches]
         self._paths = paths
+        self.set_stale()
 
 
 class QuadMesh(Collection):
@@ -1109,6 +1122,7 @@ class QuadMesh(Collection):
     def set_paths(self):
         self._paths = self.convert_mesh_to_paths(
             self._meshWidth, self._meshHeight, self._coordinates)
+        self.set_stale()
 
     @staticmethod
     def convert_mesh_to_paths(meshWidth, meshHeight, coordinates):
@@ -572,8 +572,7 @@ class ContourLabeler:
             # After looping over all segments on a contour, remove old
             # paths and add new ones if inlining
             if inline:
-                del paths[:]
-                paths.extend(additions)
+                con.set_segments([path.vertices for path in additions])
 
 class ContourSet(cm.ScalarMappable, ContourLabeler):
     """
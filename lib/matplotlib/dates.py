@@ -90,6 +90,7 @@ Here all all the date formatters:
       indexing.
 """
 import re, time, math, datetime
+from operator import attrgetter, methodcaller
 
 import pytz
 
@@ -112,6 +113,7 @@ from dateutil.rrule import rrule, MO, TU, WE, TH, FR, SA, SU, YEARLY, \
      MONTHLY, WEEKLY, DAILY, HOURLY, MINUTELY, SECONDLY
 from dateutil.relativedelta import relativedelta
 import dateutil.parser
+import dateutil.tz
 
 
 __all__ = ( 'date2num', 'num2date', 'drange', 'epoch2num',
@@ -142,6 +144,9 @@ SEC_PER_MIN = 60
 SEC_PER_HOUR = 3600
 SEC_PER_DAY = SEC_PER_HOUR * 24
 SEC_PER_WEEK = SEC_PER_DAY * 7
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+MUSEC_PER_SEC = 1000000
+MUSEC_PER_DAY = MUSEC_PER_SEC * SEC_PER_DAY
 MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY = (
     MO, TU, WE, TH, FR, SA, SU)
 WEEKDAYS = (MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY)
@@ -191,6 +196,152 @@ def _from_ordinalf(x, tz=None):
 
     return dt
 
+# num2date builds its datetimes through numpy's datetime64, which is
+# missing (or broken) in older numpy releases; there it falls back to
+# one datetime at a time.
+try:
+    _DT64_PROBE = datetime.datetime(2000, 1, 2, 3, 4, 5, 6)
+    _HAVE_DATETIME64 = (
+        np.array([_DT64_PROBE], 'datetime64[us]').tolist() == [_DT64_PROBE])
+except (AttributeError, TypeError, ValueError):
+    _HAVE_DATETIME64 = False
+del _DT64_PROBE
+
+# tzinfo classes whose utcoffset does not depend on the datetime; a
+# localized pytz instance carries its own offset.
+_CONSTANT_OFFSET_TZ = (pytz.tzinfo.BaseTzInfo, type(pytz.utc),
+                       pytz._FixedOffset, dateutil.tz.tzutc,
+                       dateutil.tz.tzoffset)
+
+def _musec_to_ordinalf(musec):
+    """
+    Convert an int64 array of microseconds since the epoch to float
+    days, summing the fields in the same order as :func:`_to_ordinalf`
+    so the results are identical.
+    """
+    days, musec = divmod(musec, MUSEC_PER_DAY)
+    hour, musec = divmod(musec, SEC_PER_HOUR*MUSEC_PER_SEC)
+    minute, musec = divmod(musec, SEC_PER_MIN*MUSEC_PER_SEC)
+    second, microsecond = divmod(musec, MUSEC_PER_SEC)
+    base = (days + EPOCH_ORDINAL).astype(np.float_)
+    base += (hour/HOURS_PER_DAY + minute/MINUTES_PER_DAY +
+             second/SECONDS_PER_DAY + microsecond/MUSECONDS_PER_DAY)
+    return base
+
+def _dt64_to_ordinalf(d):
+    """
+    Convert a :class:`numpy.datetime64` array to UTC float days; NaT
+    becomes nan.
+    """
+    musec = d.astype('datetime64[us]').view(np.int64)
+    nat = musec == np.iinfo(np.int64).min
+    base = _musec_to_ordinalf(musec)
+    base[nat] = np.nan
+    return base
+
+def _delta_to_musec(delta):
+    'Return the :class:`timedelta` *delta* as integer microseconds.'
+    if delta is None: return 0
+    return ((delta.days*SEC_PER_DAY + delta.seconds) * MUSEC_PER_SEC +
+            delta.microseconds)
+
+def _dates_to_ordinalf(d):
+    """
+    Convert a list of :mod:`datetime` instances to an array of UTC
+    float days.  The fields are pulled out with :func:`map` and
+    combined with numpy, and the timezone offset is looked up once per
+    pytz tzinfo instance rather than once per element.  Return None if
+    *d* is empty or mixes dates with datetimes or anything else.
+    """
+    n = len(d)
+    types = set(map(type, d))
+    if not types: return None
+    hastime = [issubclass(cls, datetime.datetime) for cls in types]
+    if min(hastime) != max(hastime): return None
+    if not hastime[0]:
+        for cls in types:
+            if not issubclass(cls, datetime.date): return None
+        return np.fromiter(map(methodcaller('toordinal'), d), np.float_, n)
+
+    return _musec_to_ordinalf(_datetimes_to_musec(d))
+
+def _datetimes_to_musec(d):
+    """
+    Convert a list of :class:`datetime.datetime` instances to an int64
+    array of UTC microseconds since the epoch.
+    """
+    n = len(d)
+    def field(name):
+        return np.fromiter(map(attrgetter(name), d), np.int64, n)
+    musec = ((field('hour')*SEC_PER_HOUR + field('minute')*SEC_PER_MIN +
+              field('second')) * MUSEC_PER_SEC + field('microsecond'))
+    musec += (np.fromiter(map(methodcaller('toordinal'), d), np.int64, n) -
+              EPOCH_ORDINAL) * MUSEC_PER_DAY
+
+    tzinfos = map(attrgetter('tzinfo'), d)
+    if tzinfos.count(None) != n:
+        offsets = {None: 0}
+        for tzinfo, val in dict(zip(tzinfos, d)).items():
+            if isinstance(tzinfo, _CONSTANT_OFFSET_TZ):
+                offsets[tzinfo] = _delta_to_musec(tzinfo.utcoffset(val))
+        if len(offsets) == len(set(tzinfos) | set([None])):
+            musec -= np.fromiter(map(offsets.__getitem__, tzinfos),
+                                 np.int64, n)
+        else:
+            musec -= np.array([_delta_to_musec(val.utcoffset())
+                               for val in d], np.int64)
+    return musec
+
+def _from_ordinalf_array(x, tz):
+    """
+    Convert an array of Gregorian floats to a list of :class:`datetime`
+    instances in *tz*, following :func:`_from_ordinalf`.  Return None
+    if *x* holds values that :func:`_from_ordinalf` should handle (and
+    complain about) itself.
+    """
+    x = np.asarray(x, np.float_).ravel()
+    if not np.isfinite(x).all():
+        return None
+    ix = x.astype(np.int64)
+    if len(ix) and (ix.min() < 1 or
+                    ix.max() > datetime.date.max.toordinal()):
+        return None
+    hour, remainder = divmod(24*(x - ix), 1)
+    minute, remainder = divmod(60*remainder, 1)
+    second, remainder = divmod(60*remainder, 1)
+    microsecond = (1e6*remainder).astype(np.int64)
+    microsecond[microsecond<10] = 0 # compensate for rounding errors
+    musec = (((ix - EPOCH_ORDINAL)*SEC_PER_DAY + (hour*SEC_PER_HOUR +
+              minute*SEC_PER_MIN + second).astype(np.int64)) *
+             MUSEC_PER_SEC + microsecond)
+    roundup = microsecond>999990  # compensate for rounding errors
+    musec[roundup] += MUSEC_PER_SEC - microsecond[roundup]
+
+    if isinstance(tz, pytz.tzinfo.DstTzInfo):
+        # Do what tz.fromutc does, but once per transition instead of
+        # once per datetime.
+        transitions = np.array(tz._utc_transition_times,
+                               'datetime64[us]').view(np.int64)
+        idx = np.searchsorted(transitions, musec, side='right') - 1
+        idx[idx<0] = 0
+        used = np.unique(idx)
+        offsets = np.zeros(len(transitions), np.int64)
+        tzinfos = {}
+        for i in used:
+            inf = tz._transition_info[i]
+            offsets[i] = _delta_to_musec(inf[0])
+            tzinfos[i] = tz._tzinfos[inf]
+        dts = (musec + offsets[idx]).view('datetime64[us]').tolist()
+        return [dt.replace(tzinfo=tzinfos[i]) for dt, i in zip(dts, idx)]
+
+    if isinstance(tz, _CONSTANT_OFFSET_TZ):
+        musec += _delta_to_musec(tz.utcoffset(None))
+        dts = musec.view('datetime64[us]').tolist()
+        return [dt.replace(tzinfo=tz) for dt in dts]
+
+    dts = musec.view('datetime64[us]').tolist()
+    return [dt.replace(tzinfo=UTC).astimezone(tz) for dt in dts]
+
 class strpdate2num:
     """
     Use this class to parse date strings to matplotlib datenums when
@@ -222,14 +373,22 @@ def datestr2num(d):
 
 def date2num(d):
     """
-    *d* is either a :class:`datetime` instance or a sequence of datetimes.
+    *d* is either a :class:`datetime` instance or a sequence of
+    datetimes; a :class:`numpy.datetime64` array is also accepted.
 
     Return value is a floating point number (or sequence of floats)
     which gives number of days (fraction part represents hours,
     minutes, seconds) since 0001-01-01 00:00:00 UTC.
     """
     if not cbook.iterable(d): return _to_ordinalf(d)
-    else: return np.asarray([_to_ordinalf(val) for val in d])
+    if isinstance(d, np.ndarray) and d.dtype.kind == 'M':
+        return _dt64_to_ordinalf(d)
+    if not isinstance(d, np.ndarray) or d.dtype == object:
+        d = list(d)
+        base = _dates_to_ordinalf(d)
+        if base is not None:
+            return base
+    return np.asarray([_to_ordinalf(val) for val in d])
 
 
 def julian2num(j):
@@ -255,7 +414,11 @@ def num2date(x, tz=None):
     """
     if tz is None: tz = _get_rc_timezone()
     if not cbook.iterable(x): return _from_ordinalf(x, tz)
-    else: return [_from_ordinalf(val, tz) for val in x]
+    if _HAVE_DATETIME64:
+        dts = _from_ordinalf_array(x, tz)
+        if dts is not None:
+            return dts
+    return [_from_ordinalf(val, tz) for val in x]
 
 def drange(dstart, dend, delta):
     """
@@ -471,6 +634,125 @@ class rrulewrapper:
             return self.__dict__[name]
         return getattr(self._rrule, name)
 
+# The length in microseconds of one period of each rrule frequency;
+# the periods of DAILY and finer have a fixed width, so their
+# occurrences can be laid out arithmetically.
+_FIXED_FREQ_MUSEC = {
+    DAILY    : MUSEC_PER_DAY,
+    HOURLY   : SEC_PER_HOUR*MUSEC_PER_SEC,
+    MINUTELY : SEC_PER_MIN*MUSEC_PER_SEC,
+    SECONDLY : MUSEC_PER_SEC,
+    }
+_FREQ_MUSEC = {
+    YEARLY   : 366*MUSEC_PER_DAY,
+    MONTHLY  : 31*MUSEC_PER_DAY,
+    WEEKLY   : 7*MUSEC_PER_DAY,
+    }
+_FREQ_MUSEC.update(_FIXED_FREQ_MUSEC)
+
+def _musec_to_datetime(musec):
+    'Convert UTC microseconds since the epoch to a UTC :class:`datetime`.'
+    return (datetime.datetime(1970, 1, 1, tzinfo=UTC) +
+            datetime.timedelta(microseconds=int(musec)))
+
+def _rrule_key(rule):
+    """
+    Return a hashable key for the occurrences of the dateutil *rule*,
+    or None if they should not be cached.
+
+    Once its by-rules are filled in, *rule* depends on its start only
+    through the period (year, month, week, ... of its frequency) that
+    the start falls in, which anchors the counting of the interval.
+    Occurrences before the start or after the end of the rule are
+    dropped, which callers have to allow for.
+    """
+    if rule._count is not None or rule._until is None:
+        return None
+    dt = rule._dtstart
+    freq = rule._freq
+    if freq == YEARLY:
+        anchor = dt.year
+    elif freq == MONTHLY:
+        anchor = dt.year, dt.month
+    elif freq == WEEKLY:
+        anchor = dt.toordinal() - (dt.weekday() - rule._wkst) % 7
+    else:
+        anchor = (dt.toordinal(), dt.hour, dt.minute, dt.second)
+        anchor = anchor[:freq - DAILY + 1]
+    return (freq, rule._interval, rule._wkst, anchor, dt.tzinfo,
+            rule._bysetpos, rule._bymonth, rule._byyearday,
+            rule._byeaster, rule._bymonthday, rule._bynmonthday,
+            rule._byweekno, rule._byweekday, rule._bynweekday,
+            rule._byhour, rule._byminute, rule._bysecond)
+
+def _is_fixed_width(rule):
+    """
+    Return True if the occurrences of the dateutil *rule* can be
+    computed by :func:`_fixed_width_ticks`: its periods have a fixed
+    width, it has no by-rules on months, days or weeks that would
+    drop some of them, and the utc offset of its start cannot change.
+    dateutil steps through wall clock time, so with a timezone that
+    has daylight saving time, such as one from :func:`dateutil.tz.gettz`,
+    the occurrences after a transition have a different offset.
+    """
+    def covers(by, values):
+        return by is None or not (set(values) - set(by))
+    tzinfo = rule._dtstart.tzinfo
+    return ((tzinfo is None or isinstance(tzinfo, _CONSTANT_OFFSET_TZ)) and
+            rule._freq in _FIXED_FREQ_MUSEC and rule._count is None and
+            covers(rule._bymonth, range(1, 13)) and
+            (not rule._bymonthday or covers(rule._bymonthday, range(1, 32)))
+            and not rule._bynmonthday and
+            covers(rule._byweekday, range(7)) and
+            rule._bynweekday is None and rule._byyearday is None and
+            rule._byweekno is None and rule._byeaster is None and
+            rule._bysetpos is None)
+
+def _fixed_width_ticks(rule, lo, hi):
+    """
+    Return the occurrences of *rule*, for which :func:`_is_fixed_width`
+    holds, between the UTC microseconds *lo* and *hi* inclusive.  They
+    are returned as UTC microseconds and match what
+    :meth:`rule.between` gives, without iterating over the rule.
+    """
+    unit = _FIXED_FREQ_MUSEC[rule._freq]
+    step = unit*rule._interval
+    dtstart = rule._dtstart
+    # dateutil steps through the wall clock time of the start; its
+    # tzinfo has a constant offset, which all the occurrences share.
+    offset = _delta_to_musec(dtstart.utcoffset())
+    start = int(_datetimes_to_musec([dtstart.replace(tzinfo=None)])[0])
+    anchor = start - start % unit
+    lo = max(lo, start - offset)
+    if rule._until is not None:
+        hi = min(hi, int(_datetimes_to_musec([rule._until])[0]))
+
+    # the periods that can hold an occurrence in [lo, hi]
+    k0 = max(0, (lo + offset - unit - anchor) // step + 1)
+    k1 = (hi + offset - anchor) // step
+    periods = anchor + step*np.arange(k0, k1 + 1, dtype=np.int64)
+
+    # by-rules at the frequency or coarser select periods, finer ones
+    # give the occurrences within each period
+    within = np.zeros(1, np.int64)
+    for freq, by, size, count in ((HOURLY, rule._byhour, SEC_PER_HOUR, 24),
+                                  (MINUTELY, rule._byminute, SEC_PER_MIN, 60),
+                                  (SECONDLY, rule._bysecond, 1, 60)):
+        if by is None: continue
+        size *= MUSEC_PER_SEC
+        by = [val for val in by if 0 <= val < count]
+        if freq <= rule._freq:
+            allowed = np.zeros(count, np.bool_)
+            allowed[by] = True
+            periods = periods[allowed[periods // size % count]]
+        else:
+            within = (within[:, np.newaxis] +
+                      size*np.asarray(by, np.int64)).ravel()
+    within.sort()
+
+    ticks = (periods[:, np.newaxis] + within).ravel() - offset
+    return ticks[(ticks >= lo) & (ticks <= hi)]
+
 class DateLocator(ticker.Locator):
     hms0d = {'byhour':0, 'byminute':0,'bysecond':0}
     def __init__(self, tz=None):
@@ -507,6 +789,12 @@ class DateLocator(ticker.Locator):
 class RRuleLocator(DateLocator):
     # use the dateutil rrule instance
 
+    # The tick locations are shared by all rrule locators through an
+    # LRU cache, so that redraws, and pans within a block of
+    # tick_cache_block tick intervals, do not walk the rule again.
+    tick_cache = cbook.LRUCache(256)
+    tick_cache_block = 32
+
     def __init__(self, o, tz=None):
         DateLocator.__init__(self, tz)
         self.rule = o
@@ -533,8 +821,36 @@ class RRuleLocator(DateLocator):
             stop = _from_ordinalf( 3652059.9999999 )
 
         self.rule.set(dtstart=start, until=stop)
-        dates = self.rule.between(dmin, dmax, True)
-        return self.raise_if_exceeds(date2num(dates))
+        return self.raise_if_exceeds(self._get_ticks(dmin, dmax))
+
+    def _get_ticks(self, dmin, dmax):
+        """
+        Return the occurrences of the rule between *dmin* and *dmax*
+        as float days, through :attr:`tick_cache`.
+        """
+        rule = self.rule._rrule
+        key = _rrule_key(rule)
+        if key is None:
+            return date2num(rule.between(dmin, dmax, True))
+
+        lo, hi = [int(val) for val in _datetimes_to_musec([dmin, dmax])]
+        block = self.tick_cache_block*rule._interval*_FREQ_MUSEC[rule._freq]
+        key += (lo // block, hi // block)
+        entry = self.tick_cache.get(key)
+        if entry is None or entry[0] > lo or entry[1] < hi:
+            start, stop = [int(val) for val in
+                           _datetimes_to_musec([rule._dtstart, rule._until])]
+            wlo = max(start, (lo // block)*block)
+            whi = min(stop, (hi // block + 1)*block)
+            if _is_fixed_width(rule):
+                ticks = _fixed_width_ticks(rule, wlo, whi)
+            else:
+                ticks = _datetimes_to_musec(rule.between(
+                    _musec_to_datetime(wlo), _musec_to_datetime(whi), True))
+            entry = wlo, whi, ticks
+            self.tick_cache[key] = entry
+        ticks = entry[2]
+        return _musec_to_ordinalf(ticks[(ticks >= lo) & (ticks <= hi)])
 
     def _get_unit(self):
         """
@@ -650,6 +966,7 @@ class AutoDateLocator(DateLocator):
         """
         DateLocator.__init__(self, tz)
         self._locator = YearLocator()
+        self._locator_params = None
         self._freq = YEARLY
         self._freqs = [YEARLY, MONTHLY, DAILY, HOURLY, MINUTELY, SECONDLY]
         self.minticks = minticks
@@ -777,13 +1094,21 @@ class AutoDateLocator(DateLocator):
         unused, bymonth, bymonthday, byhour, byminute, bysecond = byranges
         del unused
 
-        rrule = rrulewrapper( self._freq, interval=interval,
-                              dtstart=dmin, until=dmax,
-                              bymonth=bymonth, bymonthday=bymonthday,
-                              byhour=byhour, byminute = byminute,
-                              bysecond=bysecond )
-
-        locator = RRuleLocator(rrule, self.tz)
+        # The rrule locator sets the start and end of its rule whenever
+        # it is used, so the last one can be kept if the rule is the same.
+        params = (self._freq, interval, bymonth, bymonthday, byhour,
+                  byminute, bysecond, self.tz)
+        locator = self._locator
+        if (params != self._locator_params or
+            not isinstance(locator, RRuleLocator)):
+            rrule = rrulewrapper( self._freq, interval=interval,
+                                  dtstart=dmin, until=dmax,
+                                  bymonth=bymonth, bymonthday=bymonthday,
+                                  byhour=byhour, byminute = byminute,
+                                  bysecond=bysecond )
+
+            locator = RRuleLocator(rrule, self.tz)
+            self._locator_params = params
         locator.set_axis(self.axis)
 
         locator.set_view_interval(*self.axis.get_view_interval())
@@ -1134,6 +1459,8 @@ class DateConverter(units.ConversionInterface):
 
 units.registry[datetime.date] = DateConverter()
 units.registry[datetime.datetime] = DateConverter()
+if _HAVE_DATETIME64:
+    units.registry[np.datetime64] = DateConverter()
 
 
 
@@ -261,6 +261,11 @@ class Figure(Artist):
         children.extend(self.legends)
         return children
 
+    def set_stale(self, stale=True):
+        'mark the figure as changed since it was last drawn'
+        # the figure has no parent to pass this on to
+        self._stale = stale
+
     def contains(self, mouseevent):
         """
         Test whether the mouse event occurred on the figure.
@@ -451,6 +456,7 @@ class Figure(Artist):
             manager = getattr(self.canvas, 'manager', None)
             if manager is not None:
                 manager.resize(int(canvasw), int(canvash))
+        self.set_stale()
 
     def get_size_inches(self):
         return self.bbox_inches.p1
@@ -486,6 +492,7 @@ class Figure(Artist):
         ACCEPTS: any matplotlib color - see help(colors)
         """
         self.patch.set_edgecolor(color)
+        self.set_stale()
 
     def set_facecolor(self, color):
         """
@@ -494,6 +501,7 @@ class Figure(Artist):
         ACCEPTS: any matplotlib color - see help(colors)
         """
         self.patch.set_facecolor(color)
+        self.set_stale()
 
     def set_dpi(self, val):
         """
@@ -502,6 +510,7 @@ class Figure(Artist):
         ACCEPTS: float
         """
         self.dpi = val
+        self.set_stale()
 
     def set_figwidth(self, val):
         """
@@ -510,6 +519,7 @@ class Figure(Artist):
         ACCEPTS: float
         """
         self.bbox_inches.x1 = val
+        self.set_stale()
 
     def set_figheight(self, val):
         """
@@ -518,6 +528,7 @@ class Figure(Artist):
         ACCEPTS: float
         """
         self.bbox_inches.y1 = val
+        self.set_stale()
 
     def set_frameon(self, b):
         """
@@ -526,6 +537,7 @@ class Figure(Artist):
         ACCEPTS: boolean
         """
         self.frameon = b
+        self.set_stale()
 
     def delaxes(self, a):
         'remove a from the figure and update the current axes'
@@ -535,6 +547,7 @@ class Figure(Artist):
         for key, thisax in self._seen.items():
             if a==thisax: del self._seen[key]
         for func in self._axobservers: func(self)
+        self.set_stale()
 
 
 
@@ -720,6 +733,7 @@ class Figure(Artist):
         self.images = []
         self.legends = []
         self._axobservers = []
+        self.set_stale()
 
     def clear(self):
         """
@@ -51,7 +51,7 @@ import matplotlib
 from matplotlib import afm
 from matplotlib import ft2font
 from matplotlib import rcParams, get_configdir
-from matplotlib.cbook import is_string_like
+from matplotlib.cbook import is_string_like, LRUCache
 from matplotlib.fontconfig_pattern import \
     parse_fontconfig_pattern, generate_fontconfig_pattern
 
@@ -559,11 +559,17 @@ def afmFontProperty(fontpath, font):
     return FontEntry(fontpath, name, style, variant, weight, stretch, size)
 
 
-def createFontList(fontfiles, fontext='ttf'):
+def createFontList(fontfiles, fontext='ttf', cache=None):
     """
     A function to create a font lookup list.  The default is to create
     a list of TrueType fonts.  An AFM font list can optionally be
     created.
+
+    If *cache* is given, it is a dictionary mapping font file paths
+    to ``(stat_key, entry)`` pairs from a previous call.  Files whose
+    size and modification time are unchanged reuse their entry
+    instead of being parsed again, and the dictionary is updated with
+    the files parsed by this call.
     """
 
     fontlist = []
@@ -574,6 +580,20 @@ def createFontList(fontfiles, fontext='ttf'):
         fname = os.path.split(fpath)[1]
         if fname in seen:  continue
         else: seen[fname] = 1
+        if cache is not None:
+            try:
+                st = os.stat(fpath)
+            except OSError:
+                continue
+            stat_key = (st.st_mtime, st.st_size)
+            cached = cache.get(fpath)
+            if cached is not None and cached[0] == stat_key:
+                if cached[1] is not None:
+                    fontlist.append(cached[1])
+                continue
+            # Remember failures too, so that broken files are not
+            # reopened on every refresh.
+            cache[fpath] = (stat_key, None)
         if fontext == 'afm':
             try:
                 fh = open(fpath, 'r')
@@ -602,6 +622,8 @@ def createFontList(fontfiles, fontext='ttf'):
             try: prop = ttfFontProperty(font)
             except: continue
 
+        if cache is not None:
+            cache[fpath] = (stat_key, prop)
         fontlist.append(prop)
     return fontlist
 
@@ -711,8 +733,9 @@ class FontProperties(object):
         return parse_fontconfig_pattern(pattern)
 
     def __hash__(self):
-        l = [(k, getattr(self, "get" + k)()) for k in sorted(self.__dict__)]
-        return hash(repr(l))
+        return hash((tuple(self.get_family()), self.get_style(),
+                     self.get_variant(), self.get_weight(),
+                     self.get_stretch(), self.get_size(), self.get_file()))
 
     def __str__(self):
         return self.get_fontconfig_pattern()
@@ -936,21 +959,33 @@ def ttfdict_to_fnames(d):
 
 def pickle_dump(data, filename):
     """
-    Equivalent to pickle.dump(data, open(filename, 'w'))
+    Equivalent to pickle.dump(data, open(filename, 'wb'))
     but closes the file to prevent filehandle leakage.
+
+    The data is written to a temporary file which is then renamed
+    over *filename*, so that other processes reading the same file
+    never see a partially written pickle.
     """
-    fh = open(filename, 'w')
+    tmpname = '%s.%d.tmp' % (filename, os.getpid())
+    fh = open(tmpname, 'wb')
     try:
-        pickle.dump(data, fh)
+        pickle.dump(data, fh, pickle.HIGHEST_PROTOCOL)
     finally:
         fh.close()
+    try:
+        os.rename(tmpname, filename)
+    except OSError:
+        # win32 will not rename over an existing file
+        if os.path.exists(filename):
+            os.remove(filename)
+        os.rename(tmpname, filename)
 
 def pickle_load(filename):
     """
-    Equivalent to pickle.load(open(filename, 'r'))
+    Equivalent to pickle.load(open(filename, 'rb'))
     but closes the file to prevent filehandle leakage.
     """
-    fh = open(filename, 'r')
+    fh = open(filename, 'rb')
     try:
         data = pickle.load(fh)
     finally:
@@ -965,11 +1000,24 @@ class FontManager:
     does a nearest neighbor search to find the font that most closely
     matches the specification.  If no good enough match is found, a
     default font is returned.
+
+    The modification times of the directories that were scanned are
+    recorded, so that a pickled instance can tell with :meth:`is_stale`
+    whether fonts were added or removed since, and :meth:`refresh`
+    only parses the font files that are new or have changed.
+
+    The results of :meth:`findfont` are kept in :attr:`lookup_cache`,
+    a :class:`~matplotlib.cbook.LRUCache` holding at most
+    :attr:`lookup_cache_size` entries, which is emptied whenever the
+    font lists are rebuilt.  Its ``stats()`` method reports the number
+    of hits and misses.
     """
     # Increment this version number whenever the font cache data
     # format or behavior has changed and requires a existing font
     # cache files to be rebuilt.
-    __version__ = 5
+    __version__ = 7
+
+    lookup_cache_size = 1024
 
     def __init__(self, size=None, weight='normal'):
         self._version = self.__version__
@@ -977,6 +1025,14 @@ class FontManager:
         self.__default_weight = weight
         self.default_size = size
 
+        self._fontentries = {}
+        self.refresh()
+
+    def _get_font_paths(self):
+        """
+        Return the list of font directories searched in addition to
+        the system font directories.
+        """
         paths = [os.path.join(rcParams['datapath'], 'fonts', 'ttf'),
                  os.path.join(rcParams['datapath'], 'fonts', 'afm'),
                  os.path.join(rcParams['datapath'], 'fonts', 'pdfcorefonts')]
@@ -991,7 +1047,66 @@ class FontManager:
                     paths.extend(ttfpath.split(':'))
                 else:
                     paths.append(ttfpath)
+        return paths
+
+    def _get_dir_mtimes(self, paths):
+        """
+        Return a dictionary mapping the directories that were searched
+        for fonts to their modification times.
 
+        Every directory below the search paths is included, as is the
+        parent of every directory holding a font, since installing a
+        font package usually adds a new directory next to the existing
+        ones and only changes the modification time of their parent.
+        """
+        dirs = set()
+        for path in paths:
+            dirs.add(path)
+            for dirname, subdirs, files in os.walk(path):
+                dirs.add(dirname)
+        if sys.platform == 'win32':
+            dirs.add(win32FontDirectory())
+        else:
+            dirs.update(x11FontDirectory())
+            if sys.platform == 'darwin':
+                dirs.update(OSXFontDirectory())
+        for fname in self.ttffiles + self.afmfiles:
+            dirname = os.path.dirname(fname)
+            dirs.add(dirname)
+            dirs.add(os.path.dirname(dirname))
+
+        mtimes = {}
+        for dirname in dirs:
+            try:
+                mtimes[dirname] = os.stat(dirname).st_mtime
+            except OSError:
+                mtimes[dirname] = None
+        return mtimes
+
+    def is_stale(self):
+        """
+        Return True if the font search path or the contents of any of
+        the scanned font directories changed since the last
+        :meth:`refresh`.
+        """
+        if getattr(self, '_fontpaths', None) != self._get_font_paths():
+            return True
+        for dirname, mtime in self._dir_mtimes.iteritems():
+            try:
+                current = os.stat(dirname).st_mtime
+            except OSError:
+                current = None
+            if current != mtime:
+                return True
+        return False
+
+    def refresh(self):
+        """
+        Rescan the font directories and rebuild :attr:`ttflist` and
+        :attr:`afmlist`.  Font files that have not changed since the
+        previous scan are not reopened.
+        """
+        paths = self._get_font_paths()
         verbose.report('font search path %s'%(str(paths)))
         #  Load TrueType fonts and create font dictionary.
 
@@ -1007,15 +1122,36 @@ class FontManager:
             # use anything
             self.defaultFont['ttf'] = self.ttffiles[0]
 
-        self.ttflist = createFontList(self.ttffiles)
-
+        # Forget files that are no longer on the search path
+        allfiles = set(self.ttffiles)
         self.afmfiles = findSystemFonts(paths, fontext='afm') + \
             findSystemFonts(fontext='afm')
-        self.afmlist = createFontList(self.afmfiles, fontext='afm')
+        allfiles.update(self.afmfiles)
+        for fname in self._fontentries.keys():
+            if fname not in allfiles:
+                del self._fontentries[fname]
+
+        self.ttflist = createFontList(self.ttffiles,
+                                      cache=self._fontentries)
+        self.afmlist = createFontList(self.afmfiles, fontext='afm',
+                                      cache=self._fontentries)
         self.defaultFont['afm'] = None
 
-        self.ttf_lookup_cache = {}
-        self.afm_lookup_cache = {}
+        self._fontpaths = paths
+        self._dir_mtimes = self._get_dir_mtimes(paths)
+
+        self.lookup_cache = LRUCache(self.lookup_cache_size)
+
+    def __getstate__(self):
+        # The lookup cache holds a lock and is cheap to rebuild, so
+        # it is not pickled with the font lists.
+        state = self.__dict__.copy()
+        del state['lookup_cache']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lookup_cache = LRUCache(self.lookup_cache_size)
 
     def get_default_weight(self):
         """
@@ -1170,8 +1306,8 @@ class FontManager:
         `directory`, is specified, will only return fonts from the
         given directory (or subdirectory of that directory).
 
-        The result is cached, so subsequent lookups don't have to
-        perform the O(n) nearest neighbor search.
+        The result is cached in :attr:`lookup_cache`, so subsequent
+        lookups don't have to perform the O(n) nearest neighbor search.
 
         See the `W3C Cascading Style Sheet, Level 1
         <http://www.w3.org/TR/1998/REC-CSS2-19980512/>`_ documentation
@@ -1188,13 +1324,12 @@ class FontManager:
             return fname
 
         if fontext == 'afm':
-            font_cache = self.afm_lookup_cache
             fontlist = self.afmlist
         else:
-            font_cache = self.ttf_lookup_cache
             fontlist = self.ttflist
 
-        cached = font_cache.get(hash(prop))
+        key = (hash(prop), fontext, directory)
+        cached = self.lookup_cache.get(key)
         if cached:
             return cached
 
@@ -1230,7 +1365,7 @@ class FontManager:
                            (prop, best_font.name, best_font.fname, best_score))
             result = best_font.fname
 
-        font_cache[hash(prop)] = result
+        self.lookup_cache[key] = result
         return result
 
 
@@ -1306,7 +1441,14 @@ else:
             _rebuild()
         else:
             fontManager.default_size = None
-            verbose.report("Using fontManager instance from %s" % _fmcache)
+            if fontManager.is_stale():
+                fontManager.refresh()
+                pickle_dump(fontManager, _fmcache)
+                verbose.report("refreshed fontManager instance in %s" %
+                               _fmcache)
+            else:
+                verbose.report("Using fontManager instance from %s" %
+                               _fmcache)
     except:
         _rebuild()
 
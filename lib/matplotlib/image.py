@@ -54,6 +54,11 @@ class _AxesImageBase(martist.Artist, cm.ScalarMappable):
 
     interpnames = _interpd.keys()
 
+    # the edge length, in pixels, of the tiles in which colormapped
+    # image data is cached, and the most bytes of tiles kept per image
+    rgba_tile_size = 512
+    rgba_cache_bytes = 32*1024*1024
+
     def __str__(self):
         return "AxesImage(%g,%g;%gx%g)" % tuple(self.axes.bbox.bounds)
 
@@ -114,6 +119,7 @@ class _AxesImageBase(martist.Artist, cm.ScalarMappable):
         """
         martist.Artist.set_alpha(self, alpha)
         self._imcache = None
+        self._rgbacache = None
 
     def changed(self):
         """
@@ -127,6 +133,53 @@ class _AxesImageBase(martist.Artist, cm.ScalarMappable):
     def make_image(self, magnification=1.0):
         raise RuntimeError('The make_image method must be overridden.')
 
+    def _get_rgba_bytes(self, yslice, xslice, level=0):
+        """
+        Return the MxNx4 uint8 RGBA array for the data in *yslice*,
+        *xslice* of the given pyramid *level* (see
+        :meth:`AxesImage.set_pyramid`).
+
+        The data is colormapped in square tiles of
+        :attr:`rgba_tile_size` pixels which are cached, so only the
+        visible part of a large image is ever converted, and panning
+        reuses the tiles that were already converted.  The least
+        recently used tiles are dropped once they take more than
+        :attr:`rgba_cache_bytes` bytes.
+        """
+        if len(self._A.shape) == 2 and not self.norm.scaled():
+            # The norm must be scaled to the whole array, not to
+            # whichever tile happens to be converted first.
+            self.autoscale_None()
+        if self._rgbacache is None:
+            self._rgbacache = cbook.LRUCache(maxbytes=self.rgba_cache_bytes,
+                                             sizeof=lambda a: a.nbytes)
+        if level:
+            A = self._pyramid_levels[level]
+        else:
+            A = self._A
+        is_source = _is_array_source(A)
+
+        ts = self.rgba_tile_size
+        y0, y1 = yslice.start, yslice.stop
+        x0, x1 = xslice.start, xslice.stop
+        out = np.empty((max(y1 - y0, 0), max(x1 - x0, 0), 4), np.uint8)
+        for ty in range(y0 // ts, (y1 + ts - 1) // ts):
+            ty0 = ty * ts
+            iy0, iy1 = max(y0, ty0), min(y1, ty0 + ts)
+            for tx in range(x0 // ts, (x1 + ts - 1) // ts):
+                tx0 = tx * ts
+                tile = self._rgbacache.get((level, ty, tx))
+                if tile is None:
+                    tile = A[ty0:ty0 + ts, tx0:tx0 + ts]
+                    if is_source:
+                        tile = cbook.safe_masked_invalid(tile)
+                    tile = self.to_rgba(tile, self._alpha, bytes=True)
+                    self._rgbacache[(level, ty, tx)] = tile
+                ix0, ix1 = max(x0, tx0), min(x1, tx0 + ts)
+                out[iy0 - y0:iy1 - y0, ix0 - x0:ix1 - x0] = \
+                    tile[iy0 - ty0:iy1 - ty0, ix0 - tx0:ix1 - tx0]
+        return out
+
     @allow_rasterization
     def draw(self, renderer, *args, **kwargs):
         if not self.get_visible(): return
@@ -185,25 +238,37 @@ class _AxesImageBase(martist.Artist, cm.ScalarMappable):
         """
         Set the image array
 
+        *A* may also be a :class:`numpy.memmap` or any other array
+        source: an object with *shape* and *dtype* attributes that
+        returns an array when indexed with a tuple of slices.  Such
+        data is not copied; only the windows needed to draw the
+        current view are read from it.
+
         ACCEPTS: numpy/PIL Image A
         """
         # check if data is PIL Image without importing Image
         if hasattr(A,'getpixel'):
             self._A = pil_to_array(A)
+        elif _is_array_source(A):
+            self._A = A
         else:
             self._A = cbook.safe_masked_invalid(A)
 
         if self._A.dtype != np.uint8 and not np.can_cast(self._A.dtype, np.float):
             raise TypeError("Image data can not convert to float")
 
-        if (self._A.ndim not in (2, 3) or
-            (self._A.ndim == 3 and self._A.shape[-1] not in (3, 4))):
+        ndim = len(self._A.shape)
+        if (ndim not in (2, 3) or
+            (ndim == 3 and self._A.shape[-1] not in (3, 4))):
             raise TypeError("Invalid dimensions for image data")
 
         self._imcache =None
         self._rgbacache = None
+        self._pyramid_levels = {}
         self._oldxslice = None
         self._oldyslice = None
+        self._oldlevel = None
+        self.set_stale()
 
     def set_array(self, A):
         """
@@ -216,6 +281,28 @@ class _AxesImageBase(martist.Artist, cm.ScalarMappable):
 
         self.set_data(A)
 
+    def autoscale(self):
+        """
+        Autoscale the scalar limits on the norm instance using the
+        current array
+        """
+        if _is_array_source(self._A):
+            self.norm.autoscale(_source_limits(self._A))
+            self.changed()
+        else:
+            cm.ScalarMappable.autoscale(self)
+
+    def autoscale_None(self):
+        """
+        Autoscale the scalar limits on the norm instance using the
+        current array, changing only limits that are None
+        """
+        if _is_array_source(self._A):
+            if not self.norm.scaled():
+                self.norm.autoscale_None(_source_limits(self._A))
+            self.changed()
+        else:
+            cm.ScalarMappable.autoscale_None(self)
 
 
     def get_interpolation(self):
@@ -243,6 +330,7 @@ class _AxesImageBase(martist.Artist, cm.ScalarMappable):
         if s not in self._interpd:
             raise ValueError('Illegal interpolation string')
         self._interpolation = s
+        self.set_stale()
 
     def set_resample(self, v):
         """
@@ -252,6 +340,7 @@ class _AxesImageBase(martist.Artist, cm.ScalarMappable):
         """
         if v is None: v = rcParams['image.resample']
         self._resample = v
+        self.set_stale()
 
     def get_resample(self):
         'return the image resample boolean'
@@ -268,6 +357,7 @@ class _AxesImageBase(martist.Artist, cm.ScalarMappable):
             self._filternorm = 1
         else:
             self._filternorm = 0
+        self.set_stale()
 
     def get_filternorm(self):
         'return the filternorm setting'
@@ -283,6 +373,7 @@ class _AxesImageBase(martist.Artist, cm.ScalarMappable):
         r = float(filterrad)
         assert(r>0)
         self._filterrad = r
+        self.set_stale()
 
     def get_filterrad(self):
         'return the filterrad setting'
@@ -321,6 +412,7 @@ class AxesImage(_AxesImageBase):
         """
 
         self._extent = extent
+        self._pyramid = False
 
         _AxesImageBase.__init__(self, ax,
                                 cmap = cmap,
@@ -342,11 +434,36 @@ class AxesImage(_AxesImageBase):
         dxintv = xmax-xmin
         dyintv = ymax-ymin
 
+        A = self._A
+        level = 0
+        if self._pyramid or _is_array_source(A):
+            level = self._get_pyramid_level(magnification)
+        if level:
+            A = self._get_pyramid(level)
+            # The reduced array drops the trailing rows and columns
+            # that do not fill a whole block; shrink the extent to
+            # the part of the image it still covers.
+            fy = float(A.shape[0] << level) / self._A.shape[0]
+            fx = float(A.shape[1] << level) / self._A.shape[1]
+            xmax = xmin + dxintv*fx
+            if self.origin == 'upper':
+                ymin = ymax - dyintv*fy
+            else:
+                ymax = ymin + dyintv*fy
+            dxintv = xmax-xmin
+            dyintv = ymax-ymin
+
         # the viewport scale factor
         sx = dxintv/self.axes.viewLim.width
         sy = dyintv/self.axes.viewLim.height
-        numrows, numcols = self._A.shape[:2]
-        if sx > 2:
+        numrows, numcols = A.shape[:2]
+        # Data that is read from an array source is always windowed to
+        # the view, in-memory arrays only when zoomed in far enough.
+        if _is_array_source(A):
+            minscale = 1
+        else:
+            minscale = 2
+        if sx > minscale:
             x0 = (self.axes.viewLim.x0-xmin)/dxintv * numcols
             ix0 = max(0, int(x0 - self._filterrad))
             x1 = (self.axes.viewLim.x1-xmin)/dxintv * numcols
@@ -360,7 +477,7 @@ class AxesImage(_AxesImageBase):
         else:
             xslice = slice(0, numcols)
 
-        if sy > 2:
+        if sy > minscale:
             y0 = (self.axes.viewLim.y0-ymin)/dyintv * numrows
             iy0 = max(0, int(y0 - self._filterrad))
             y1 = (self.axes.viewLim.y1-ymin)/dyintv * numrows
@@ -377,22 +494,20 @@ class AxesImage(_AxesImageBase):
         else:
             yslice = slice(0, numrows)
 
-        if xslice != self._oldxslice or yslice != self._oldyslice:
+        if (xslice != self._oldxslice or yslice != self._oldyslice or
+            level != self._oldlevel):
             self._imcache = None
             self._oldxslice = xslice
             self._oldyslice = yslice
+            self._oldlevel = level
 
         if self._imcache is None:
-            if self._A.dtype == np.uint8 and len(self._A.shape) == 3:
-                im = _image.frombyte(self._A[yslice,xslice,:], 0)
+            if A.dtype == np.uint8 and len(A.shape) == 3:
+                im = _image.frombyte(np.asarray(A[yslice,xslice,:]), 0)
                 im.is_grayscale = False
             else:
-                if self._rgbacache is None:
-                    x = self.to_rgba(self._A, self._alpha)
-                    self._rgbacache = x
-                else:
-                    x = self._rgbacache
-                im = _image.fromarray(x[yslice,xslice], 0)
+                x = self._get_rgba_bytes(yslice, xslice, level)
+                im = _image.frombyte(x, 0)
                 if len(self._A.shape) == 2:
                     im.is_grayscale = self.cmap.is_gray()
                 else:
@@ -435,6 +550,68 @@ class AxesImage(_AxesImageBase):
         return im
 
 
+    def set_pyramid(self, b):
+        """
+        Set whether the image is drawn from a reduced resolution copy
+        of the data when it is zoomed out far enough that several data
+        pixels fall on each display pixel.
+
+        The copies are built on demand by averaging 2x2 blocks of the
+        previous level (ignoring masked values) and are kept until
+        the data is changed, so that redrawing a very large image
+        does not have to resample the full array each time.
+
+        Memory-mapped and other array sources (see :meth:`set_data`)
+        are always drawn this way, but their levels take every
+        2**\ *level*-th row and column instead of averaging, so that
+        no more of the data is read than is displayed.
+
+        ACCEPTS: [True | False]
+        """
+        self._pyramid = bool(b)
+        self._imcache = None
+        self.set_stale()
+
+    def get_pyramid(self):
+        'return whether the image is drawn from a resolution pyramid'
+        return self._pyramid
+
+    def _get_pyramid_level(self, magnification):
+        """
+        Return the coarsest pyramid level that still has at least one
+        data pixel per display pixel in the current view.
+        """
+        numrows, numcols = self._A.shape[:2]
+        xmin, xmax, ymin, ymax = self.get_extent()
+        l, b, r, t = self.axes.bbox.extents
+        widthDisplay = max((r - l) * magnification, 1)
+        heightDisplay = max((t - b) * magnification, 1)
+        # data pixels per display pixel along each axis
+        px = (numcols * abs(self.axes.viewLim.width /
+                            (xmax - xmin)) / widthDisplay)
+        py = (numrows * abs(self.axes.viewLim.height /
+                            (ymax - ymin)) / heightDisplay)
+        level = 0
+        while (2 << level) <= min(px, py, numrows, numcols):
+            level += 1
+        return level
+
+    def _get_pyramid(self, level):
+        """
+        Return the data reduced by a factor of 2**\ *level* along both
+        axes, building and caching any missing intermediate levels.
+        """
+        A = self._pyramid_levels.get(level)
+        if A is None:
+            if _is_array_source(self._A):
+                A = _SourceLevel(self._A, 1 << level)
+            elif level == 1:
+                A = _downsample(self._A)
+            else:
+                A = _downsample(self._get_pyramid(level - 1))
+            self._pyramid_levels[level] = A
+        return A
+
     def set_extent(self, extent):
         """
         extent is data axes (left, right, bottom, top) for making image plots
@@ -448,6 +625,7 @@ class AxesImage(_AxesImageBase):
             self.axes.set_xlim((xmin, xmax))
         if self.axes._autoscaleYon:
             self.axes.set_ylim((ymin, ymax))
+        self.set_stale()
 
     def get_extent(self):
         'get the image extent: left, right, bottom, top'
@@ -539,6 +717,7 @@ class NonUniformImage(AxesImage):
         self._Ax = x
         self._Ay = y
         self._imcache = None
+        self.set_stale()
 
     def set_array(self, *args):
         raise NotImplementedError('Method not supported')
@@ -672,6 +851,7 @@ class PcolorImage(martist.Artist, cm.ScalarMappable):
         self._Ax = x
         self._Ay = y
         self.update_dict['array'] = True
+        self.set_stale()
 
     def set_array(self, *args):
         raise NotImplementedError('Method not supported')
@@ -746,6 +926,7 @@ class FigureImage(martist.Artist, cm.ScalarMappable):
 
         """
         cm.ScalarMappable.set_array(self, cbook.safe_masked_invalid(A))
+        self.set_stale()
 
     def set_array(self, A):
         """
@@ -878,12 +1059,10 @@ class BboxImage(_AxesImageBase):
                 im = _image.frombyte(self._A, 0)
                 im.is_grayscale = False
             else:
-                if self._rgbacache is None:
-                    x = self.to_rgba(self._A, self._alpha)
-                    self._rgbacache = x
-                else:
-                    x = self._rgbacache
-                im = _image.fromarray(x, 0)
+                numrows, numcols = self._A.shape[:2]
+                x = self._get_rgba_bytes(slice(0, numrows),
+                                         slice(0, numcols))
+                im = _image.frombyte(x, 0)
                 if len(self._A.shape) == 2:
                     im.is_grayscale = self.cmap.is_gray()
                 else:
@@ -937,6 +1116,106 @@ class BboxImage(_AxesImageBase):
 
 
 
+def _is_array_source(A):
+    """
+    Return True if *A* is a memory-mapped array or an array-like
+    object (with *shape*, *dtype* and slicing, but not an ndarray)
+    that should be read a window at a time rather than converted.
+    """
+    if isinstance(A, np.memmap):
+        return True
+    return (not isinstance(A, np.ndarray) and hasattr(A, 'shape') and
+            hasattr(A, 'dtype') and hasattr(A, '__getitem__'))
+
+
+def _iter_source_rows(A, nelements=1 << 22):
+    """
+    Yield the array source *A* in blocks of an even number of rows,
+    with roughly *nelements* elements each, with invalid values masked.
+    """
+    rowsize = 1
+    for n in A.shape[1:]:
+        rowsize *= n
+    nrows = max(2, (nelements // max(rowsize, 1)) // 2 * 2)
+    for i in xrange(0, A.shape[0], nrows):
+        yield cbook.safe_masked_invalid(A[i:i + nrows])
+
+
+def _source_limits(A):
+    """
+    Return the minimum and maximum of the array source *A* as a
+    two element array, reading it in blocks.
+    """
+    vmin = vmax = None
+    for block in _iter_source_rows(A):
+        if block.size == 0 or ma.getmaskarray(block).all():
+            continue
+        bmin, bmax = ma.minimum(block), ma.maximum(block)
+        if vmin is None or bmin < vmin:
+            vmin = bmin
+        if vmax is None or bmax > vmax:
+            vmax = bmax
+    if vmin is None:
+        return ma.masked_all((2,))
+    return np.array([vmin, vmax])
+
+
+class _SourceLevel(object):
+    """
+    The array source *A* seen through every *step*-th row and column,
+    itself an array source: only the windows that are indexed are
+    read.  Like :func:`_downsample`, the trailing rows and columns
+    that do not fill a whole step are dropped.
+    """
+    def __init__(self, A, step):
+        self.A = A
+        self.step = step
+        self.shape = ((A.shape[0] // step, A.shape[1] // step) +
+                      tuple(A.shape[2:]))
+        self.dtype = A.dtype
+
+    def __getitem__(self, key):
+        step = self.step
+        key = tuple(key)
+        index = []
+        for i, k in enumerate(key[:2]):
+            start, stop, kstep = k.indices(self.shape[i])
+            index.append(slice(start*step, stop*step, kstep*step))
+        return self.A[tuple(index) + key[2:]]
+
+
+def _downsample(A):
+    """
+    Return *A* reduced by a factor of two along its first two axes by
+    averaging each 2x2 block; a trailing odd row or column is dropped.
+
+    For masked arrays only the unmasked values of a block are averaged,
+    and the block is masked if all of its values are.  uint8 data
+    stays uint8.
+    """
+    numrows, numcols = A.shape[0] // 2 * 2, A.shape[1] // 2 * 2
+    A = A[:numrows, :numcols]
+    blocks = (A[0::2, 0::2], A[1::2, 0::2], A[0::2, 1::2], A[1::2, 1::2])
+
+    if ma.getmask(A) is not ma.nomask:
+        total = np.zeros(blocks[0].shape, np.float_)
+        count = np.zeros(blocks[0].shape, np.int_)
+        for block in blocks:
+            valid = ~ma.getmaskarray(block)
+            total += np.where(valid, block.filled(0), 0)
+            count += valid
+        return ma.masked_array(total / np.maximum(count, 1),
+                               mask=(count == 0))
+
+    total = np.zeros(blocks[0].shape, np.float_)
+    for block in blocks:
+        total += np.asarray(block)
+    total /= 4.0
+    if A.dtype == np.uint8:
+        return (total + 0.5).astype(np.uint8)
+    return total
+
+
 def imread(fname, format=None):
     """
     Return image file in *fname* as :class:`numpy.array`.  *fname* may
@@ -737,6 +737,7 @@ in the normalized axes coordinate.
             self._legend_title_box.set_visible(True)
         else:
             self._legend_title_box.set_visible(False)
+        self.set_stale()
 
     def get_title(self):
         'return Text instance for the legend title'
@@ -760,6 +761,7 @@ in the normalized axes coordinate.
         ACCEPTS: [ *True* | *False* ]
         """
         self._drawFrame = b
+        self.set_stale()
 
     def get_bbox_to_anchor(self):
         """
@@ -780,6 +782,7 @@ in the normalized axes coordinate.
         coordinate if None), or a tuple of [left, bottom] where the
         width and height will be assumed to be zero.
         """
+        self.set_stale()
         if bbox is None:
             self._bbox_to_anchor = None
             return
@@ -336,6 +336,7 @@ class Line2D(Artist):
         """
         assert fs in ['full', 'left' , 'right' , 'bottom' , 'top']
 	self._fillstyle = fs
+        self.set_stale()
 
     def set_markevery(self, every):
         """
@@ -357,6 +358,7 @@ class Line2D(Artist):
 
         """
         self._markevery = every
+        self.set_stale()
 
     def get_markevery(self):
         'return the markevery setting'
@@ -419,6 +421,7 @@ class Line2D(Artist):
             self._xorig = x
             self._yorig = y
             self._invalid = True
+        self.set_stale()
 
     def recache(self):
         #if self.axes is None: print 'recache no axes'
@@ -660,6 +663,7 @@ class Line2D(Artist):
         ACCEPTS: [True | False]
         """
         self._antialiased = b
+        self.set_stale()
 
     def set_color(self, color):
         """
@@ -668,6 +672,7 @@ class Line2D(Artist):
         ACCEPTS: any matplotlib color
         """
         self._color = color
+        self.set_stale()
 
     def set_drawstyle(self, drawstyle):
         """
@@ -680,6 +685,7 @@ class Line2D(Artist):
         ACCEPTS: [ 'default' | 'steps' | 'steps-pre' | 'steps-mid' | 'steps-post' ]
         """
         self._drawstyle = drawstyle
+        self.set_stale()
 
     def set_linewidth(self, w):
         """
@@ -688,6 +694,7 @@ class Line2D(Artist):
         ACCEPTS: float value in points
         """
         self._linewidth = w
+        self.set_stale()
 
     def set_linestyle(self, linestyle):
         """
@@ -736,6 +743,7 @@ class Line2D(Artist):
         if linestyle in [' ','']:
             linestyle = 'None'
         self._linestyle = linestyle
+        self.set_stale()
 
     def set_marker(self, marker):
         """
@@ -795,6 +803,7 @@ class Line2D(Artist):
             marker = 'None'
         self._marker = marker
         self._markerFunc = self._markers[marker]
+        self.set_stale()
 
     def set_markeredgecolor(self, ec):
         """
@@ -805,6 +814,7 @@ class Line2D(Artist):
         if ec is None :
             ec = 'auto'
         self._markeredgecolor = ec
+        self.set_stale()
 
     def set_markeredgewidth(self, ew):
         """
@@ -815,6 +825,7 @@ class Line2D(Artist):
         if ew is None :
             ew = rcParams['lines.markeredgewidth']
         self._markeredgewidth = ew
+        self.set_stale()
 
     def set_markerfacecolor(self, fc):
         """
@@ -825,6 +836,7 @@ class Line2D(Artist):
         if fc is None :
             fc = 'auto'
         self._markerfacecolor = fc
+        self.set_stale()
 
     def set_markersize(self, sz):
         """
@@ -833,6 +845,7 @@ class Line2D(Artist):
         ACCEPTS: float
         """
         self._markersize = sz
+        self.set_stale()
 
     def set_xdata(self, x):
         """
@@ -863,6 +876,7 @@ class Line2D(Artist):
         else:
             self.set_linestyle('--')
         self._dashSeq = seq  # TODO: offset ignored for now
+        self.set_stale()
 
 
     def _draw_lines(self, renderer, gc, path, trans):
@@ -1387,6 +1401,7 @@ class Line2D(Artist):
             raise ValueError('set_dash_joinstyle passed "%s";\n' % (s,)
                   + 'valid joinstyles are %s' % (self.validJoin,))
         self._dashjoinstyle = s
+        self.set_stale()
 
     def set_solid_joinstyle(self, s):
         """
@@ -1398,6 +1413,7 @@ class Line2D(Artist):
             raise ValueError('set_solid_joinstyle passed "%s";\n' % (s,)
                   + 'valid joinstyles are %s' % (self.validJoin,))
         self._solidjoinstyle = s
+        self.set_stale()
 
 
     def get_dash_joinstyle(self):
@@ -1424,6 +1440,7 @@ class Line2D(Artist):
                   + 'valid capstyles are %s' % (self.validCap,))
 
         self._dashcapstyle = s
+        self.set_stale()
 
 
     def set_solid_capstyle(self, s):
@@ -1438,6 +1455,7 @@ class Line2D(Artist):
                   + 'valid capstyles are %s' % (self.validCap,))
 
         self._solidcapstyle = s
+        self.set_stale()
 
 
     def get_dash_capstyle(self):
@@ -25,21 +25,21 @@ try:
     set
 except NameError:
     from sets import Set as set
-import unicodedata
+import re, unicodedata
 from warnings import warn
 
 from numpy import inf, isinf
 import numpy as np
 from matplotlib.pyparsing import Combine, Group, Optional, Forward, \
     Literal, OneOrMore, ZeroOrMore, ParseException, Empty, \
-    ParseResults, Suppress, oneOf, StringEnd, ParseFatalException, \
+    ParseResults, Suppress, StringEnd, ParseFatalException, \
     FollowedBy, Regex, ParserElement
 # Enable packrat parsing
 ParserElement.enablePackrat()
 
 from matplotlib.afm import AFM
 from matplotlib.cbook import Bunch, get_realpath_and_stat, \
-    is_string_like, maxdict
+    is_string_like, LRUCache
 from matplotlib.ft2font import FT2Font, FT2Image, KERNING_DEFAULT, LOAD_FORCE_AUTOHINT, LOAD_NO_HINTING
 from matplotlib.font_manager import findfont, FontProperties
 from matplotlib._mathtext_data import latex_to_bakoma, \
@@ -54,6 +54,18 @@ import matplotlib._png as _png
 
 
 
+def _oneOf(symbols):
+    """
+    Return a parser element matching the longest of the literal
+    strings in *symbols*, like pyparsing's :func:`oneOf`.  That
+    compares every pair of symbols to order them, which makes building
+    the grammar with its hundreds of symbol names slow; sorting them
+    by length gives the same result.
+    """
+    symbols = list(set(symbols))
+    symbols.sort(key=len, reverse=True)
+    return Regex('|'.join([re.escape(sym) for sym in symbols]))
+
 ##############################################################################
 # FONTS
 
@@ -2141,16 +2153,16 @@ class Parser(object):
 
         bslash       = Literal('\\')
 
-        accent       = oneOf(self._accent_map.keys() +
+        accent       = _oneOf(self._accent_map.keys() +
                              list(self._wide_accents))
 
-        function     = oneOf(list(self._function_names))
+        function     = _oneOf(list(self._function_names))
 
-        fontname     = oneOf(list(self._fontnames))
-        latex2efont  = oneOf(['math' + x for x in self._fontnames])
+        fontname     = _oneOf(list(self._fontnames))
+        latex2efont  = _oneOf(['math' + x for x in self._fontnames])
 
         space        =(FollowedBy(bslash)
-                     + oneOf([r'\ ',
+                     + _oneOf([r'\ ',
                               r'\/',
                               r'\,',
                               r'\;',
@@ -2170,12 +2182,12 @@ class Parser(object):
         symbol       =(Regex(UR"([a-zA-Z0-9 +\-*/<>=:,.;!'@()\[\]|%s])|(\\[%%${}\[\]_|])" % unicode_range)
                      | (Combine(
                          bslash
-                       + oneOf(tex2uni.keys())
+                       + _oneOf(tex2uni.keys())
                        ) + FollowedBy(Regex("[^a-zA-Z]")))
                      ).setParseAction(self.symbol).leaveWhitespace()
 
         c_over_c     =(Suppress(bslash)
-                     + oneOf(self._char_over_chars.keys())
+                     + _oneOf(self._char_over_chars.keys())
                      ).setParseAction(self.char_over_chars)
 
         accent       = Group(
@@ -2221,17 +2233,17 @@ class Parser(object):
                         | Error(r"Expected \binom{num}{den}"))
                      ).setParseAction(self.binom).setName("binom")
 
-        ambiDelim    = oneOf(list(self._ambiDelim))
-        leftDelim    = oneOf(list(self._leftDelim))
-        rightDelim   = oneOf(list(self._rightDelim))
-        rightDelimSafe = oneOf(list(self._rightDelim - set(['}'])))
+        ambiDelim    = _oneOf(list(self._ambiDelim))
+        leftDelim    = _oneOf(list(self._leftDelim))
+        rightDelim   = _oneOf(list(self._rightDelim))
+        rightDelimSafe = _oneOf(list(self._rightDelim - set(['}'])))
         genfrac      = Group(
                        Suppress(Literal(r"\genfrac"))
                      + ((Suppress(Literal('{')) +
-                         oneOf(list(self._ambiDelim | self._leftDelim | set(['']))) +
+                         _oneOf(list(self._ambiDelim | self._leftDelim | set(['']))) +
                          Suppress(Literal('}')) +
                          Suppress(Literal('{')) +
-                         oneOf(list(self._ambiDelim |
+                         _oneOf(list(self._ambiDelim |
                                     (self._rightDelim - set(['}'])) |
                                     set(['', r'\}']))) +
                          Suppress(Literal('}')) +
@@ -2271,7 +2283,7 @@ class Parser(object):
                      | subsuper
                      )
 
-        subsuperop   = oneOf(["_", "^"])
+        subsuperop   = _oneOf(["_", "^"])
 
         subsuper    << Group(
                          ( Optional(placeable)
@@ -2861,8 +2873,41 @@ class Parser(object):
 ##############################################################################
 # MAIN
 
+def _result_nbytes(result):
+    """
+    A rough estimate of the memory held by a result of
+    :meth:`MathTextParser.parse`.
+    """
+    nbytes = 0
+    for item in result:
+        if hasattr(item, 'get_width'):
+            # an FT2Image
+            nbytes += item.get_width() * item.get_height()
+        elif hasattr(item, 'getvalue'):
+            nbytes += len(item.getvalue())
+        elif hasattr(item, 'svg_glyphs'):
+            nbytes += 64 * (len(item.svg_glyphs) + len(item.svg_rects))
+        elif hasattr(item, '__len__'):
+            nbytes += 64 * len(item)
+        else:
+            nbytes += 16
+    return nbytes
+
 class MathTextParser(object):
+    """
+    Lay out math expressions for one kind of output.
+
+    The results are shared by all parsers for the same output in a
+    :class:`~matplotlib.cbook.LRUCache` holding about
+    :attr:`cache_bytes` bytes; see :meth:`get_cache`.
+    """
     _parser = None
+    cache_bytes = 16*1024*1024
+    _caches = {}
+    # the settings besides the font properties that change a layout
+    _cache_rc_keys = tuple(sorted(
+        [k for k in rcParams if k.startswith('mathtext.')] +
+        ['text.hinting', 'ps.useafm']))
 
     _backend_mapping = {
         'bitmap': MathtextBackendBitmap,
@@ -2887,7 +2932,22 @@ class MathTextParser(object):
         Create a MathTextParser for the given backend *output*.
         """
         self._output = output.lower()
-        self._cache = maxdict(50)
+        self._cache = self.get_cache(self._output)
+
+    @classmethod
+    def get_cache(cls, output):
+        """
+        Return the cache of the parse results for *output*, created
+        with the current :attr:`cache_bytes` when first needed.  Its
+        ``stats()`` method reports the hits and misses.
+        """
+        output = output.lower()
+        cache = cls._caches.get(output)
+        if cache is None:
+            cache = cls._caches.setdefault(
+                output, LRUCache(maxbytes=cls.cache_bytes,
+                                 sizeof=_result_nbytes))
+        return cache
 
     def parse(self, s, dpi = 72, prop = None):
         """
@@ -2902,7 +2962,8 @@ class MathTextParser(object):
         """
         if prop is None:
             prop = FontProperties()
-        cacheKey = (s, dpi, hash(prop))
+        cacheKey = (s, dpi, hash(prop),
+                    tuple([rcParams[k] for k in self._cache_rc_keys]))
         result = self._cache.get(cacheKey)
         if result is not None:
             return result
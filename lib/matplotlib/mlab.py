@@ -63,6 +63,15 @@ Functions that don't exist in matlab(TM), but are useful anyway:
 :meth:`cross_from_above`
     return the indices where a 1D array crosses a threshold from above
 
+:meth:`reduce_bins`
+    reduce the values that fall into each bin, like a histogram
+
+:class:`HexBinAccumulator`
+    count and reduce points in hexagonal bins, chunk by chunk
+
+:meth:`stream_histogram`
+    histogram of data that is read a chunk at a time
+
 
 record array helper functions
 -------------------------------
@@ -200,14 +209,51 @@ def detrend_linear(y):
     a = y.mean() - b*x.mean()
     return y - (b*x + a)
 
+# the number of values in the segments transformed by one call to the fft
+_spectral_block = 1 << 20
+
+def _detrend_segments(segments, func):
+    """
+    Apply the detrend function *func* to each row of the 2-D array
+    *segments*, to all rows at once if it is one of those of mlab.
+    """
+    if func is detrend_none:
+        return segments
+    if func is detrend_mean or func is detrend:
+        return segments - segments.mean(axis=1)[:,np.newaxis]
+    if func is detrend_linear and not np.iscomplexobj(segments):
+        x = np.arange(segments.shape[1], dtype=np.float_)
+        x -= x.mean()
+        ym = segments.mean(axis=1)[:,np.newaxis]
+        b = np.dot(segments - ym, x)[:,np.newaxis] / np.dot(x, x)
+        return segments - (b*x + ym)
+    return np.array([func(segment) for segment in segments])
+
+def _segment_ffts(x, start, nseg, step, NFFT, windowVals, detrend, pad_to,
+                  numFreqs):
+    """
+    Return the first *numFreqs* terms of the ffts of the *nseg*
+    detrended and windowed segments of *x* beginning at *start*,
+    *step* apart, as the rows of an array.
+    """
+    # a view of the overlapping segments, without copying them
+    segments = np.lib.stride_tricks.as_strided(
+        x[start:], shape=(nseg, NFFT), strides=(step*x.strides[0],
+                                                x.strides[0]))
+    segments = windowVals * _detrend_segments(segments, detrend)
+    if numFreqs == pad_to//2 + 1 and not np.iscomplexobj(segments):
+        return np.fft.rfft(segments, n=pad_to, axis=1)
+    return np.fft.fft(segments, n=pad_to, axis=1)[:,:numFreqs]
+
 #This is a helper function that implements the commonality between the
 #psd, csd, and spectrogram.  It is *NOT* meant to be used outside of mlab
 def _spectral_helper(x, y, NFFT=256, Fs=2, detrend=detrend_none,
         window=window_hanning, noverlap=0, pad_to=None, sides='default',
-        scale_by_freq=None):
+        scale_by_freq=None, average=False):
     #The checks for if y is x are so that we can use the same function to
     #implement the core of psd(), csd(), and spectrogram() without doing
-    #extra calculations.  We return the unaveraged Pxy, freqs, and t.
+    #extra calculations.  We return the unaveraged Pxy, freqs, and t, or
+    #with average=True, the mean of Pxy over the segments as a column.
     same_data = y is x
 
     #Make sure we're dealing with a numpy array. If y and x were the same
@@ -260,21 +306,29 @@ def _spectral_helper(x, y, NFFT=256, Fs=2, detrend=detrend_none,
     step = NFFT - noverlap
     ind = np.arange(0, len(x) - NFFT + 1, step)
     n = len(ind)
-    Pxy = np.zeros((numFreqs,n), np.complex_)
-
-    # do the ffts of the slices
-    for i in range(n):
-        thisX = x[ind[i]:ind[i]+NFFT]
-        thisX = windowVals * detrend(thisX)
-        fx = np.fft.fft(thisX, n=pad_to)
-
+    if average:
+        Pxy = np.zeros((numFreqs,1), np.complex_)
+    else:
+        Pxy = np.zeros((numFreqs,n), np.complex_)
+
+    # do the ffts of the slices, as many at a time as fit in a block
+    nblock = max(1, _spectral_block // max(NFFT, pad_to))
+    for i in range(0, n, nblock):
+        nseg = min(nblock, n - i)
+        fx = _segment_ffts(x, ind[i], nseg, step, NFFT, windowVals,
+                           detrend, pad_to, numFreqs)
         if same_data:
-            fy = fx
+            Pxy_block = (fx.real**2 + fx.imag**2).T
+        else:
+            fy = _segment_ffts(y, ind[i], nseg, step, NFFT, windowVals,
+                               detrend, pad_to, numFreqs)
+            Pxy_block = (np.conjugate(fx) * fy).T
+        if average:
+            Pxy[:,0] += Pxy_block.sum(axis=1)
         else:
-            thisY = y[ind[i]:ind[i]+NFFT]
-            thisY = windowVals * detrend(thisY)
-            fy = np.fft.fft(thisY, n=pad_to)
-        Pxy[:,i] = np.conjugate(fx[:numFreqs]) * fy[:numFreqs]
+            Pxy[:,i:i+nseg] = Pxy_block
+    if average:
+        Pxy /= n
 
     # Scale the spectrum by the norm of the window to compensate for
     # windowing loss; see Bendat & Piersol Sec 11.5.2.  Also include
@@ -408,10 +462,10 @@ def csd(x, y, NFFT=256, Fs=2, detrend=detrend_none, window=window_hanning,
         Procedures, John Wiley & Sons (1986)
     """
     Pxy, freqs, t = _spectral_helper(x, y, NFFT, Fs, detrend, window,
-        noverlap, pad_to, sides, scale_by_freq)
+        noverlap, pad_to, sides, scale_by_freq, average=True)
 
-    if len(Pxy.shape) == 2 and Pxy.shape[1]>1:
-        Pxy = Pxy.mean(axis=1)
+    if len(t)>1:
+        Pxy = Pxy[:,0]
     return Pxy, freqs
 
 @docstring.dedent_interpd
@@ -1271,6 +1325,446 @@ class FIFOBuffer:
 
         self.dataLim.update_numerix(x, y, True)
 
+def _bincount(ind, n, weights=None):
+    'numpy.bincount of *ind*, padded to length *n*'
+    if not len(ind):
+        return np.zeros(n)
+    counts = np.bincount(ind, weights)
+    if len(counts) < n:
+        counts = np.concatenate((counts, np.zeros(n - len(counts))))
+    return counts
+
+# the reducers that reduce_bins and HexBinAccumulator compute themselves
+_bin_reducers = {np.sum: 'sum', sum: 'sum', np.mean: 'mean',
+                 np.amin: 'min', min: 'min', np.amax: 'max', max: 'max'}
+
+def reduce_bins(ind, values, n, reduce_C_function=np.mean):
+    """
+    Group *values* by their bin index *ind* (integers from 0 to
+    *n* - 1) and reduce each group with *reduce_C_function*.  Return
+    the array of the *n* reduced values, *nan* for empty bins, and the
+    array of the number of values in each bin.
+
+    Sums, means, minima and maxima (:func:`numpy.sum`,
+    :func:`numpy.mean`, :func:`numpy.min`, :func:`numpy.max` and the
+    builtin :func:`sum`, :func:`min` and :func:`max`) are computed with
+    array operations; any other function is called once for each
+    nonempty bin, with the values of the bin in their original order.
+    """
+    ind = np.asarray(ind, int)
+    values = np.asarray(values)
+    counts = _bincount(ind, n)
+    reduced = np.empty(n)
+    reduced.fill(np.nan)
+    full = counts > 0
+    kind = _bin_reducers.get(reduce_C_function)
+    if kind == 'sum':
+        reduced[full] = _bincount(ind, n, values)[full]
+    elif kind == 'mean':
+        reduced[full] = _bincount(ind, n, values)[full] / counts[full]
+    elif len(ind):
+        if kind is None:
+            order = ind.argsort(kind='mergesort')
+        else:
+            order = np.lexsort((values, ind))
+        ind = ind[order]
+        values = values[order]
+        # where each run of equal bin indices starts and ends
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(ind)) + 1))
+        ends = np.concatenate((starts[1:], [len(ind)]))
+        if kind == 'min':
+            reduced[ind[starts]] = values[starts]
+        elif kind == 'max':
+            reduced[ind[starts]] = values[ends - 1]
+        else:
+            for start, end in zip(starts, ends):
+                reduced[ind[start]] = reduce_C_function(values[start:end])
+    return reduced, counts
+
+
+class HexLattice(object):
+    """
+    The grid of hexagons of :meth:`~matplotlib.axes.Axes.hexbin`,
+    covering *extent* = (*xmin*, *xmax*, *ymin*, *ymax*) with
+    *gridsize* hexagons in the *x*-direction, or with *gridsize* =
+    (*nx*, *ny*) hexagons in both directions.
+
+    The hexagons are the cells of two interleaved rectangular
+    lattices, of (*nx* + 1) x (*ny* + 1) cells centered on the integer
+    grid points and of *nx* x *ny* cells shifted by half a cell; they
+    are numbered row by row, the first lattice first.  *xmin*,
+    *xmax*, *ymin*, *ymax*, *sx* and *sy* are the (slightly padded)
+    limits and the cell size, *n* is the number of cells.
+
+    Use :func:`get_hex_lattice` to share lattices between plots with
+    the same extent and grid size.
+    """
+    def __init__(self, extent, gridsize=100):
+        if cbook.iterable(gridsize):
+            nx, ny = gridsize
+        else:
+            nx = gridsize
+            ny = int(nx/math.sqrt(3))
+        xmin, xmax, ymin, ymax = extent
+        # In the x-direction, the hexagons exactly cover the region from
+        # xmin to xmax. Need some padding to avoid roundoff errors.
+        padding = 1.e-9 * (xmax - xmin)
+        self.xmin = xmin - padding
+        self.xmax = xmax + padding
+        self.ymin = ymin
+        self.ymax = ymax
+        self.sx = (self.xmax - self.xmin) / nx
+        self.sy = (ymax - ymin) / ny
+        self.nx = nx
+        self.ny = ny
+        self.n = (nx + 1) * (ny + 1) + nx * ny
+        self._polygons = None
+
+    def bin(self, x, y):
+        """
+        Return the index of the hexagon holding each point of the
+        arrays *x*, *y*, or -1 for the points outside the lattice.
+        """
+        nx1, ny1 = self.nx + 1, self.ny + 1
+        nx2, ny2 = self.nx, self.ny
+        x = (np.asarray(x, float) - self.xmin) / self.sx
+        y = (np.asarray(y, float) - self.ymin) / self.sy
+        ix1 = np.round(x).astype(int)
+        iy1 = np.round(y).astype(int)
+        ix2 = np.floor(x).astype(int)
+        iy2 = np.floor(y).astype(int)
+
+        d1 = (x-ix1)**2 + 3.0 * (y-iy1)**2
+        d2 = (x-ix2-0.5)**2 + 3.0 * (y-iy2-0.5)**2
+        bdist = (d1<d2)
+        inside = np.where(bdist,
+                          (ix1 >= 0) & (ix1 < nx1) & (iy1 >= 0) & (iy1 < ny1),
+                          (ix2 >= 0) & (ix2 < nx2) & (iy2 >= 0) & (iy2 < ny2))
+        ind = np.where(bdist, ix1*ny1 + iy1, nx1*ny1 + ix2*ny2 + iy2)
+        ind[~inside] = -1
+        return ind
+
+    def polygons(self):
+        """
+        Return the vertices of all the hexagons, as an array of shape
+        (*n*, 6, 2).  The array is computed once and shared; do not
+        modify it.
+        """
+        if self._polygons is not None:
+            return self._polygons
+        nx1, ny1 = self.nx + 1, self.ny + 1
+        nx2, ny2 = self.nx, self.ny
+        sx, sy = self.sx, self.sy
+        px = self.xmin + sx * np.array([ 0.5, 0.5, 0.0, -0.5, -0.5,  0.0])
+        py = self.ymin + sy * np.array([-0.5, 0.5, 1.0,  0.5, -0.5, -1.0]) / 3.0
+
+        polygons = np.zeros((6, self.n, 2), float)
+        polygons[:,:nx1*ny1,0] = np.repeat(np.arange(nx1), ny1)
+        polygons[:,:nx1*ny1,1] = np.tile(np.arange(ny1), nx1)
+        polygons[:,nx1*ny1:,0] = np.repeat(np.arange(nx2) + 0.5, ny2)
+        polygons[:,nx1*ny1:,1] = np.tile(np.arange(ny2), nx2) + 0.5
+
+        polygons = np.transpose(polygons, axes=[1,0,2]).copy()
+        polygons[:,:,0] *= sx
+        polygons[:,:,1] *= sy
+        polygons[:,:,0] += px
+        polygons[:,:,1] += py
+        self._polygons = polygons
+        return polygons
+
+_hex_lattices = cbook.LRUCache(8)
+
+def get_hex_lattice(extent, gridsize=100):
+    """
+    Return the :class:`HexLattice` for *extent* and *gridsize*,
+    reusing the one made by an earlier call with the same arguments.
+    """
+    if cbook.iterable(gridsize):
+        gridsize = tuple(gridsize)
+    key = tuple([float(v) for v in extent]), gridsize
+    lattice = _hex_lattices.get(key)
+    if lattice is None:
+        lattice = _hex_lattices[key] = HexLattice(extent, gridsize)
+    return lattice
+
+
+class HexBinAccumulator(object):
+    """
+    Count the points that fall in each hexagon of a
+    :class:`HexLattice`, and with a *reduce_C_function*, reduce the
+    values attached to the points of each hexagon.  The points can be
+    added in several chunks, so data that does not fit into memory at
+    once can be binned piece by piece::
+
+        lattice = get_hex_lattice((0, 1, 0, 1), 50)
+        accumulator = HexBinAccumulator(lattice, np.max)
+        for x, y, C in chunks:
+            accumulator.add(x, y, C)
+        accum = accumulator.result()
+
+    Sums, means, minima and maxima are kept up to date as the points
+    arrive; for any other function, the values are stored until
+    :meth:`result` is called (see :func:`reduce_bins`).
+    """
+    # the number of points binned at a time, to bound the size of
+    # the temporary arrays
+    chunksize = 1 << 20
+
+    def __init__(self, lattice, reduce_C_function=None):
+        self.lattice = lattice
+        self.reduce_C_function = reduce_C_function
+        self.counts = np.zeros(lattice.n)
+        self._kind = _bin_reducers.get(reduce_C_function)
+        self._reduced = np.empty(lattice.n)
+        self._reduced.fill(np.nan)
+        if self._kind in ('sum', 'mean'):
+            self._reduced.fill(0)
+        self._ind = []
+        self._values = []
+
+    def add(self, x, y, C=None):
+        """
+        Add the points *x*, *y*, with the values *C* if the
+        accumulator reduces them.
+        """
+        n = self.lattice.n
+        for i in xrange(0, len(x), self.chunksize):
+            s = slice(i, i + self.chunksize)
+            ind = self.lattice.bin(x[s], y[s])
+            inside = ind >= 0
+            ind = ind[inside]
+            self.counts += _bincount(ind, n)
+            if self.reduce_C_function is None:
+                continue
+            values = np.asarray(C[s], float)[inside]
+            if self._kind in ('sum', 'mean'):
+                self._reduced += _bincount(ind, n, values)
+            elif self._kind is not None:
+                reduced = reduce_bins(ind, values, n, self.reduce_C_function)[0]
+                old = self._reduced
+                both = ~np.isnan(old) & ~np.isnan(reduced)
+                self._reduced = np.where(np.isnan(old), reduced, old)
+                if self._kind == 'min':
+                    self._reduced[both] = np.minimum(old, reduced)[both]
+                else:
+                    self._reduced[both] = np.maximum(old, reduced)[both]
+            else:
+                self._ind.append(ind)
+                self._values.append(values)
+
+    def result(self, mincnt=None):
+        """
+        Return the array of the counts, or of the reduced values, of
+        the hexagons.  As in :meth:`~matplotlib.axes.Axes.hexbin`, the
+        hexagons with fewer than *mincnt* points, or when reducing,
+        with no more than *mincnt* (default 0) points, are *nan*.
+        """
+        counts = self.counts
+        if self.reduce_C_function is None:
+            accum = counts.copy()
+            if mincnt is not None:
+                accum[counts < mincnt] = np.nan
+            return accum
+        if mincnt is None:
+            mincnt = 0
+        if self._kind == 'mean':
+            accum = self._reduced / np.where(counts > 0, counts, 1)
+        elif self._kind is not None:
+            accum = self._reduced.copy()
+        elif self._ind:
+            accum = reduce_bins(np.concatenate(self._ind),
+                                np.concatenate(self._values),
+                                self.lattice.n, self.reduce_C_function)[0]
+        else:
+            accum = np.empty(self.lattice.n)
+        accum[counts <= mincnt] = np.nan
+        return accum
+
+
+class QuantileSketch(object):
+    """
+    Estimate the quantiles of a stream of values in bounded memory.
+
+    The values are kept in levels of at most *k* values each; when a
+    level fills up, it is sorted and every other value moves up to the
+    next level, where it stands for twice as many values.  The
+    quantiles are exact as long as no more than *k* values were
+    added, and otherwise their rank is off by about
+    ``log2(count/k)/k`` of the :attr:`count` of the values.  The
+    minimum and maximum are always exact.
+    """
+    def __init__(self, k=8192):
+        self.k = k
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._levels = [np.empty(0)]
+        self._offset = 0
+
+    def add(self, values):
+        'Add the array of *values*.'
+        values = np.asarray(values, float).ravel()
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        levels = self._levels
+        levels[0] = np.concatenate((levels[0], values))
+        i = 0
+        while i < len(levels):
+            level = levels[i]
+            if len(level) > self.k:
+                level = np.sort(level)
+                # keep an odd value out, and alternate the values kept
+                # so the errors do not all go the same way
+                even = len(level) - len(level) % 2
+                self._offset = 1 - self._offset
+                if i + 1 == len(levels):
+                    levels.append(np.empty(0))
+                levels[i+1] = np.concatenate(
+                    (levels[i+1], level[self._offset:even:2]))
+                levels[i] = level[even:]
+            i += 1
+
+    def quantiles(self, q):
+        """
+        Return the values below which the fractions *q* (a sequence of
+        numbers from 0 to 1) of the values lie, like :func:`prctile`
+        with *p* = 100 * *q*.
+        """
+        if not self.count:
+            raise ValueError('no values in the sketch')
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.ones(len(level)) * 2**i
+                                  for i, level in enumerate(self._levels)])
+        order = values.argsort()
+        values = values[order]
+        ranks = weights[order].cumsum()
+        ind = ranks.searchsorted(np.asarray(q) * ranks[-1], side='right')
+        result = values[ind.clip(0, len(values) - 1)]
+        q = np.asarray(q)
+        return np.where(q <= 0, self.min, np.where(q >= 1, self.max, result))
+
+
+class HistogramAccumulator(object):
+    """
+    Count the values that fall into each of the bins with the edges
+    *bins* (a monotonically increasing sequence), adding the values
+    a chunk at a time.  As with :func:`numpy.histogram`, each bin
+    includes its left edge, the last bin its right edge too, and the
+    values outside the bins are ignored.
+    """
+    def __init__(self, bins):
+        self.bins = np.asarray(bins, float)
+        self.counts = np.zeros(len(self.bins) - 1)
+
+    def add(self, x, weights=None):
+        'Add the values *x*, each counting *weights* if given.'
+        x = np.asarray(x).ravel()
+        if weights is not None:
+            weights = np.asarray(weights).ravel()
+            if len(weights) != len(x):
+                raise ValueError('weights should have the same shape as x')
+        self.counts += np.histogram(x, self.bins, weights=weights)[0]
+
+    def result(self, normed=False):
+        """
+        Return the counts, or if *normed* is *True*, the probability
+        density.
+        """
+        if normed:
+            return self.counts / (np.diff(self.bins) * self.counts.sum())
+        return self.counts.copy()
+
+
+def _iter_chunks(x, chunksize):
+    'Yield the 1-D chunks of the data *x* of :func:`stream_histogram`'
+    if callable(x):
+        x = x()
+    if isinstance(x, np.ndarray):
+        if x.ndim != 1:
+            x = x.ravel()
+        # a strided 1-D view, such as a column, is copied a chunk at
+        # a time rather than as a whole by ravel
+        for i in xrange(0, len(x), chunksize):
+            yield np.asarray(x[i:i+chunksize])
+    else:
+        for chunk in x:
+            yield np.asarray(chunk).ravel()
+
+def is_chunked(x):
+    """
+    Return *True* if :func:`stream_histogram` should read *x* a chunk
+    at a time rather than as a whole: if *x* is a memory-mapped array,
+    a function or an iterator.
+    """
+    return (isinstance(x, np.memmap) or callable(x) or
+            (hasattr(x, '__iter__') and not hasattr(x, '__len__')))
+
+def stream_histogram(x, bins=10, range=None, weights=None, normed=False,
+                     binning='linear', chunksize=1<<20):
+    """
+    Compute the histogram of data read a chunk at a time, in memory
+    independent of the size of the data.  Return the counts, or the
+    probability density if *normed* is *True*, and the bin edges.
+
+    *x* is an array, which is read *chunksize* values at a time (use
+    a :class:`numpy.memmap` for data on disk), or an iterable of
+    arrays, or a function returning either.  *weights*, if given,
+    must be of the same kind and come in chunks of the same sizes.
+
+    *bins* and *range* are as for :func:`numpy.histogram`.  If *bins*
+    is a number, the bin edges are computed in a first pass over the
+    data: with *binning* = 'linear', the bins have the same width and
+    span *range* or the full range of the data; with *binning* =
+    'quantile', the bins hold about the same number of values, as
+    estimated by a :class:`QuantileSketch`.  The data is read twice
+    then, so *x* cannot be a one-shot iterator; pass a function that
+    returns a fresh one instead.
+    """
+    if binning not in ('linear', 'quantile'):
+        raise ValueError('invalid binning: %s' % binning)
+    if not cbook.iterable(bins) and (range is None or binning == 'quantile'):
+        if not callable(x) and not isinstance(x, np.ndarray):
+            raise ValueError('computing the bins takes a second pass '
+                             'over the data; give the bins or pass a '
+                             'function returning the chunks')
+        sketch = QuantileSketch()
+        for chunk in _iter_chunks(x, chunksize):
+            chunk = chunk[~np.isnan(chunk)]
+            if range is not None:
+                chunk = chunk[(chunk >= range[0]) & (chunk <= range[1])]
+            if binning == 'quantile':
+                sketch.add(chunk)
+            elif len(chunk):
+                sketch.count += len(chunk)
+                sketch.min = min(sketch.min, chunk.min())
+                sketch.max = max(sketch.max, chunk.max())
+        if not sketch.count:
+            range = 0, 1
+        elif binning == 'linear':
+            range = sketch.min, sketch.max
+        else:
+            bins = np.unique(sketch.quantiles(np.linspace(0, 1, bins + 1)))
+            if len(bins) == 1:
+                range = bins[0], bins[0]
+                bins = 1
+    if not cbook.iterable(bins):
+        # the same edges as numpy.histogram
+        bins = np.histogram([], bins, range=range)[1]
+
+    accumulator = HistogramAccumulator(bins)
+    if weights is None:
+        for chunk in _iter_chunks(x, chunksize):
+            accumulator.add(chunk)
+    else:
+        wchunks = _iter_chunks(weights, chunksize)
+        for chunk in _iter_chunks(x, chunksize):
+            accumulator.add(chunk, wchunks.next())
+    return accumulator.result(normed), accumulator.bins
+
+
 def movavg(x,n):
     """
     Compute the len(*n*) moving average of *x*.
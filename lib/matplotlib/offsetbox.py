@@ -635,16 +635,16 @@ class TextArea(OffsetBox):
 
     def get_extent(self, renderer):
         clean_line, ismath = self._text.is_math_text(self._text._text)
-        _, h_, d_ = renderer.get_text_width_height_descent(
-            "lp", self._text._fontproperties, ismath=False)
+        _, h_, d_ = mtext.get_text_metrics(
+            renderer, "lp", self._text._fontproperties, ismath=False)
 
         bbox, info = self._text._get_layout(renderer)
         w, h = bbox.width, bbox.height
 
         line = info[0][0] # first line
 
-        _, hh, dd = renderer.get_text_width_height_descent(
-            line, self._text._fontproperties, ismath=ismath)
+        _, hh, dd = mtext.get_text_metrics(
+            renderer, line, self._text._fontproperties, ismath=ismath)
 
 
         self._baseline_transform.clear()
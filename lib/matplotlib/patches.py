@@ -211,6 +211,7 @@ class Patch(artist.Artist):
         """
         if aa is None: aa = mpl.rcParams['patch.antialiased']
         self._antialiased = aa
+        self.set_stale()
 
     def set_aa(self, aa):
         """alias for set_antialiased"""
@@ -224,6 +225,7 @@ class Patch(artist.Artist):
         """
         if color is None: color = mpl.rcParams['patch.edgecolor']
         self._edgecolor = color
+        self.set_stale()
 
     def set_ec(self, color):
         """alias for set_edgecolor"""
@@ -237,6 +239,7 @@ class Patch(artist.Artist):
         """
         if color is None: color = mpl.rcParams['patch.facecolor']
         self._facecolor = color
+        self.set_stale()
 
     def set_fc(self, color):
         """alias for set_facecolor"""
@@ -265,6 +268,7 @@ class Patch(artist.Artist):
         """
         if w is None: w = mpl.rcParams['patch.linewidth']
         self._linewidth = w
+        self.set_stale()
 
     def set_lw(self, lw):
         """alias for set_linewidth"""
@@ -278,6 +282,7 @@ class Patch(artist.Artist):
         """
         if ls is None: ls = "solid"
         self._linestyle = ls
+        self.set_stale()
 
     def set_ls(self, ls):
         """alias for set_linestyle"""
@@ -290,6 +295,7 @@ class Patch(artist.Artist):
         ACCEPTS: [True | False]
         """
         self.fill = b
+        self.set_stale()
 
     def get_fill(self):
         'return whether fill is set'
@@ -322,6 +328,7 @@ class Patch(artist.Artist):
         ACCEPTS: [ '/' | '\\\\' | '|' | '-' | '+' | 'x' | 'o' | 'O' | '.' | '*' ]
         """
         self._hatch = hatch
+        self.set_stale()
 
     def get_hatch(self):
         'Return the current hatching pattern'
@@ -333,6 +340,7 @@ class Patch(artist.Artist):
         matplotlib.patheffect._Base class or its derivatives.
         """
         self._path_effects = path_effects
+        self.set_stale()
 
     def get_path_effects(self):
         return self._path_effects
@@ -553,6 +561,7 @@ class Rectangle(Patch):
         ACCEPTS: float
         """
         self._x = x
+        self.set_stale()
 
     def set_y(self, y):
         """
@@ -561,6 +570,7 @@ class Rectangle(Patch):
         ACCEPTS: float
         """
         self._y = y
+        self.set_stale()
 
     def set_xy(self, xy):
         """
@@ -569,6 +579,7 @@ class Rectangle(Patch):
         ACCEPTS: 2-item sequence
         """
         self._x, self._y = xy
+        self.set_stale()
 
     def set_width(self, w):
         """
@@ -577,6 +588,7 @@ class Rectangle(Patch):
         ACCEPTS: float
         """
         self._width = w
+        self.set_stale()
 
     def set_height(self, h):
         """
@@ -585,6 +597,7 @@ class Rectangle(Patch):
         ACCEPTS: float
         """
         self._height = h
+        self.set_stale()
 
     def set_bounds(self, *args):
         """
@@ -600,6 +613,7 @@ class Rectangle(Patch):
         self._y = b
         self._width = w
         self._height = h
+        self.set_stale()
 
     def get_bbox(self):
         return transforms.Bbox.from_bounds(self._x, self._y, self._width, self._height)
@@ -758,6 +772,7 @@ class Polygon(Patch):
         return self._path.vertices
     def set_xy(self, vertices):
         self._path = Path(vertices)
+        self.set_stale()
     _get_xy = get_xy
     _set_xy = set_xy
     xy = property(
@@ -1176,6 +1191,7 @@ class Circle(Ellipse):
         ACCEPTS: float
         """
         self.width = self.height = 2 * radius
+        self.set_stale()
 
     def get_radius(self):
         'return the radius of the circle'
@@ -2119,6 +2135,7 @@ class FancyBboxPatch(Patch):
             self._bbox_transmuter = boxstyle
         else:
             self._bbox_transmuter = BoxStyle(boxstyle, **kw)
+        self.set_stale()
 
 
     def set_mutation_scale(self, scale):
@@ -2128,6 +2145,7 @@ class FancyBboxPatch(Patch):
         ACCEPTS: float
         """
         self._mutation_scale=scale
+        self.set_stale()
 
     def get_mutation_scale(self):
         """
@@ -2142,6 +2160,7 @@ class FancyBboxPatch(Patch):
         ACCEPTS: float
         """
         self._mutation_aspect=aspect
+        self.set_stale()
 
     def get_mutation_aspect(self):
         """
@@ -2190,6 +2209,7 @@ class FancyBboxPatch(Patch):
         ACCEPTS: float
         """
         self._x = x
+        self.set_stale()
 
     def set_y(self, y):
         """
@@ -2198,6 +2218,7 @@ class FancyBboxPatch(Patch):
         ACCEPTS: float
         """
         self._y = y
+        self.set_stale()
 
     def set_width(self, w):
         """
@@ -2206,6 +2227,7 @@ class FancyBboxPatch(Patch):
         ACCEPTS: float
         """
         self._width = w
+        self.set_stale()
 
     def set_height(self, h):
         """
@@ -2214,6 +2236,7 @@ class FancyBboxPatch(Patch):
         ACCEPTS: float
         """
         self._height = h
+        self.set_stale()
 
     def set_bounds(self, *args):
         """
@@ -2229,6 +2252,7 @@ class FancyBboxPatch(Patch):
         self._y = b
         self._width = w
         self._height = h
+        self.set_stale()
 
 
     def get_bbox(self):
@@ -3626,18 +3650,21 @@ class FancyArrowPatch(Patch):
         """
         if posA is not None: self._posA_posB[0] = posA
         if posB is not None: self._posA_posB[1] = posB
+        self.set_stale()
 
 
     def set_patchA(self, patchA):
         """ set the begin patch.
         """
         self.patchA = patchA
+        self.set_stale()
 
 
     def set_patchB(self, patchB):
         """ set the begin patch
         """
         self.patchB = patchB
+        self.set_stale()
 
 
     def set_connectionstyle(self, connectionstyle, **kw):
@@ -3667,6 +3694,7 @@ class FancyArrowPatch(Patch):
             self._connector = connectionstyle
         else:
             self._connector = ConnectionStyle(connectionstyle, **kw)
+        self.set_stale()
 
 
     def get_connectionstyle(self):
@@ -3700,6 +3728,7 @@ class FancyArrowPatch(Patch):
             self._arrow_transmuter = arrowstyle
         else:
             self._arrow_transmuter = ArrowStyle(arrowstyle, **kw)
+        self.set_stale()
 
     def get_arrowstyle(self):
         """
@@ -3715,6 +3744,7 @@ class FancyArrowPatch(Patch):
         ACCEPTS: float
         """
         self._mutation_scale=scale
+        self.set_stale()
 
     def get_mutation_scale(self):
         """
@@ -3729,6 +3759,7 @@ class FancyArrowPatch(Patch):
         ACCEPTS: float
         """
         self._mutation_aspect=aspect
+        self.set_stale()
 
     def get_mutation_aspect(self):
         """
@@ -4057,6 +4088,7 @@ class ConnectionPatch(FancyArrowPatch):
           * None : the self.xy will be checked only if *xycoords* is "data"
         """
         self._annotation_clip = b
+        self.set_stale()
 
     def get_annotation_clip(self):
         """
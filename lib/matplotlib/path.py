@@ -612,11 +612,154 @@ class Path(object):
         cls._hatch_dict[(hatchpattern, density)] = hatch_path
         return hatch_path
 
+
+class PathArray(object):
+    """
+    A sequence of paths packed end to end into a single pair of
+    vertices and codes arrays, for collections of many small paths:
+
+      - *vertices*: an Nx2 float array holding the vertices of all
+        the paths
+      - *codes*: an N-length array of :class:`Path` codes, or None if
+        every path is a polyline
+      - *starts*: an array of M+1 indices into *vertices*; path *i*
+        is made of the vertices ``starts[i]:starts[i+1]``
+
+    Indexing or iterating returns :class:`Path` objects, made on
+    demand as views of the arrays, so that a :class:`PathArray` can be
+    read wherever a list of paths is expected; unlike a list, it
+    cannot be changed in place.  The Agg renderer and
+    the path collection functions of :mod:`matplotlib._path` read the
+    arrays directly and never make the individual paths.
+
+    As for :class:`Path`, the arrays should be treated as immutable.
+    """
+    def __init__(self, vertices, codes=None, starts=None):
+        if ma.isMaskedArray(vertices):
+            vertices = vertices.astype(np.float_).filled(np.nan)
+        else:
+            vertices = np.asarray(vertices, np.float_)
+        if starts is None:
+            starts = [0, len(vertices)]
+        starts = np.asarray(starts, np.intp)
+
+        assert vertices.ndim == 2
+        assert vertices.shape[1] == 2
+        assert starts.ndim == 1 and len(starts)
+        assert starts[0] == 0 and starts[-1] == len(vertices)
+        assert np.all(starts[1:] >= starts[:-1])
+        if codes is not None:
+            codes = np.asarray(codes, Path.code_type)
+            assert codes.ndim == 1
+            assert len(codes) == len(vertices)
+            nonempty = starts[:-1][starts[1:] > starts[:-1]]
+            assert np.all(codes[nonempty] == Path.MOVETO)
+
+        self.vertices = vertices
+        self.codes = codes
+        self.starts = starts
+
+    @classmethod
+    def from_polygons(cls, verts, closed=False):
+        """
+        Pack the sequence *verts* of Nx2 vertex arrays (or a
+        numpolys x numsides x 2 array) into a :class:`PathArray` of
+        polylines.  Masked vertices become NaNs.  If *closed* is True,
+        each non-empty polygon is closed with a ``CLOSEPOLY``.
+        """
+        if ma.isMaskedArray(verts):
+            verts = verts.astype(np.float_).filled(np.nan)
+        if isinstance(verts, np.ndarray) and verts.ndim == 3:
+            numpolys, numsides, two = verts.shape
+            assert two == 2
+            vertices = np.asarray(verts, np.float_)
+            lengths = np.empty(numpolys, np.intp)
+            lengths.fill(numsides)
+            if closed and numsides:
+                vertices = np.concatenate(
+                    [vertices, np.zeros((numpolys, 1, 2))], axis=1)
+                lengths += 1
+            vertices = vertices.reshape((-1, 2))
+        else:
+            arrays = []
+            lengths = []
+            closing = np.zeros((1, 2))
+            for xy in verts:
+                if ma.isMaskedArray(xy):
+                    xy = xy.astype(np.float_).filled(np.nan)
+                else:
+                    xy = np.asarray(xy, np.float_)
+                if not xy.size:
+                    xy = xy.reshape((0, 2))
+                arrays.append(xy)
+                if closed and len(xy):
+                    arrays.append(closing)
+                    lengths.append(len(xy) + 1)
+                else:
+                    lengths.append(len(xy))
+            if arrays:
+                vertices = np.concatenate(arrays)
+            else:
+                vertices = np.zeros((0, 2))
+            lengths = np.asarray(lengths, np.intp)
+
+        starts = np.zeros(len(lengths) + 1, np.intp)
+        np.cumsum(lengths, out=starts[1:])
+        codes = None
+        if closed:
+            ends = starts[1:][lengths > 0]
+            codes = np.empty(len(vertices), Path.code_type)
+            codes.fill(Path.LINETO)
+            codes[starts[:-1][lengths > 0]] = Path.MOVETO
+            codes[ends - 1] = Path.CLOSEPOLY
+        return cls(vertices, codes, starts)
+
+    def __repr__(self):
+        return "PathArray(%d paths, %d vertices)" % (len(self),
+                                                     len(self.vertices))
+
+    def __len__(self):
+        return len(self.starts) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in xrange(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError('path index out of range')
+        start, end = self.starts[i], self.starts[i + 1]
+        if self.codes is None:
+            return Path(self.vertices[start:end])
+        return Path(self.vertices[start:end], self.codes[start:end])
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
+    def transformed(self, transform):
+        """
+        Return a copy of the path array with all of its vertices
+        transformed by *transform*.
+        """
+        return PathArray(transform.transform(self.vertices), self.codes,
+                         self.starts)
+
+    def transformed_non_affine(self, transform):
+        """
+        Return a copy of the path array with all of its vertices
+        transformed by the non-affine part of *transform*.
+        """
+        return PathArray(transform.transform_non_affine(self.vertices),
+                         self.codes, self.starts)
+
 _get_path_collection_extents = get_path_collection_extents
 def get_path_collection_extents(*args):
     """
-    Given a sequence of :class:`Path` objects, returns the bounding
-    box that encapsulates all of them.
+    Given a sequence of :class:`Path` objects, or a
+    :class:`PathArray`, returns the bounding box that encapsulates all
+    of them.
     """
     from transforms import Bbox
     if len(args[1]) == 0:
@@ -85,6 +85,12 @@ def validate_int(s):
     except ValueError:
         raise ValueError('Could not convert "%s" to int' % s)
 
+def validate_int_or_None(s):
+    'convert s to int, or return None for "None" or None'
+    if s is None or (isinstance(s, basestring) and s.lower() == 'none'):
+        return None
+    return validate_int(s)
+
 def validate_fonttype(s):
     'confirm that this is a Postscript of PDF font type that we know how to convert to'
     fonttypes = { 'type3':    3,
@@ -522,6 +528,9 @@ defaultParams = {
     'ps.distiller.res'   : [6000, validate_int],     # dpi
     'ps.fonttype'        : [3, validate_fonttype], # 3 (Type3) or 42 (Truetype)
     'pdf.compression'    : [6, validate_int],        # compression level from 0 to 9; 0 to disable
+    'pdf.image_compression' : [None, validate_int_or_None], # compression level of images; None for pdf.compression
+    'pdf.font_compression' : [None, validate_int_or_None], # compression level of embedded fonts; None for pdf.compression
+    'pdf.compression_threads' : [0, validate_int],  # compress the streams in this many threads; 0 to compress while drawing
     'pdf.inheritcolor'   : [False, validate_bool],   # ignore any color-setting commands from the frontend
     'pdf.use14corefonts' : [False, validate_bool],  # use only the 14 PDF core fonts
                                                     # embedded in every PDF viewing application
@@ -82,10 +82,12 @@ class Spine(mpatches.Patch):
         self._width = radius*2
         self._height = radius*2
         self._angle = 0
+        self.set_stale()
 
     def set_patch_line(self):
         """set the spine to be linear"""
         self._patch_type = 'line'
+        self.set_stale()
 
     # Behavior copied from mpatches.Ellipse:
     def _recompute_transform(self):
@@ -237,6 +239,7 @@ class Spine(mpatches.Patch):
 
         if self.axis is not None:
             self.axis.cla()
+        self.set_stale()
 
     def get_position(self):
         """get the spine position"""
@@ -1,4 +1,8 @@
 import os
+import threading
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 def report_memory(i):
     pid = os.getpid()
@@ -62,3 +66,233 @@ def report_memory(i):
 ##     # w/o text and w/o write_png: Average memory consumed per loop: 0.02
 ##     # w/o text and w/ write_png : Average memory consumed per loop: 0.3400
 ##     # w/ text and w/ write_png  : Average memory consumed per loop: 0.32
+
+def _threaded_figure(seed):
+    np.random.seed(seed)
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.plot(np.cumsum(np.random.randn(5000)), lw=2, ls='--')
+    ax.scatter(np.random.rand(500)*5000, np.random.randn(500)*20)
+    ax.bar([1000, 3000], [20, -20], width=500, hatch='/')
+    im = ax.imshow(np.random.rand(20, 20), extent=(0, 5000, -50, 50),
+                   aspect='auto')
+    im.set_clip_path(ax.patches[0])
+    return fig
+
+def test_threaded_draw():
+    # figures drawn concurrently (Agg releases the GIL while
+    # rasterizing) must come out the same as when drawn one by one
+    figs = [_threaded_figure(i) for i in range(4)]
+    expected = []
+    for fig in figs:
+        fig.canvas.draw()
+        expected.append(fig.canvas.tostring_rgb())
+    threads = [threading.Thread(target=fig.canvas.draw) for fig in figs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for fig, buf in zip(figs, expected):
+        assert fig.canvas.tostring_rgb() == buf
+
+def test_text_cache():
+    # strings drawn again come from RendererAgg.text_cache and must
+    # look the same as freshly rendered ones
+    from matplotlib.backends.backend_agg import RendererAgg
+    def draw():
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.set_title(u'Caf\xe9')
+        ax.text(0.5, 0.5, 'rotated', rotation=30)
+        ax.text(0.2, 0.2, u'\u2022')
+        ax.text(0.8, 0.8, '')
+        fig.canvas.draw()
+        return fig.canvas.tostring_rgb()
+    RendererAgg.text_cache.clear()
+    first = draw()
+    misses = RendererAgg.text_cache.misses
+    hits = RendererAgg.text_cache.hits
+    assert draw() == first
+    assert RendererAgg.text_cache.misses == misses
+    assert RendererAgg.text_cache.hits > hits
+
+def test_text_cache_bytes():
+    # a new text_cache_bytes applies to the cache made with the class
+    from matplotlib.backends.backend_agg import RendererAgg
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.set_title('a longer title than any tick label')
+    RendererAgg.text_cache.clear()
+    fig.canvas.draw()
+    nbytes = RendererAgg.text_cache.nbytes
+    assert nbytes > 0
+    old = RendererAgg.text_cache_bytes
+    RendererAgg.text_cache_bytes = nbytes // 2
+    try:
+        RendererAgg.text_cache.clear()
+        fig.canvas.draw()
+        assert 0 < RendererAgg.text_cache.nbytes <= nbytes // 2
+    finally:
+        RendererAgg.text_cache_bytes = old
+
+def test_text_metrics_cache():
+    # a second figure with the same labels measures no new strings
+    from matplotlib import text
+    def draw():
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        for i in range(4):
+            ax = fig.add_subplot(2, 2, i + 1)
+            ax.set_title('metrics\nof %d' % i)
+            ax.legend([ax.plot([0, 1])[0]], ['line'])
+        fig.canvas.draw()
+        return fig.canvas.tostring_rgb()
+    text.metrics_cache.clear()
+    first = draw()
+    misses = text.metrics_cache.misses
+    assert text.metrics_cache.hits > 0
+    assert draw() == first
+    assert text.metrics_cache.misses == misses
+
+def test_text_metrics_cache_mathtext():
+    # math text is measured again when the mathtext fonts change
+    import matplotlib
+    from matplotlib import text
+    from matplotlib.backends.backend_agg import RendererAgg
+    renderer = RendererAgg(100, 100, 72)
+    prop = text.FontProperties()
+    s = r'$\sum_{i=0}^\infty x_i$'
+    fontset = matplotlib.rcParams['mathtext.fontset']
+    try:
+        cm = text.get_text_metrics(renderer, s, prop, True)
+        matplotlib.rcParams['mathtext.fontset'] = 'stix'
+        misses = text.metrics_cache.misses
+        stix = text.get_text_metrics(renderer, s, prop, True)
+        assert text.metrics_cache.misses == misses + 1
+        assert stix == renderer.get_text_width_height_descent(s, prop, True)
+        assert stix != cm
+    finally:
+        matplotlib.rcParams['mathtext.fontset'] = fontset
+
+def test_blit_manager():
+    # frames redrawn by the BlitManager look like full draws
+    from matplotlib.backends.backend_agg import BlitManager
+    def build(animated):
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        artists = []
+        for i in range(2):
+            ax = fig.add_subplot(1, 2, i + 1)
+            ax.plot(np.arange(100) % 7)
+            artists.append(ax.plot([0, 50], [0, 3], 'o-', lw=3, zorder=10,
+                                   animated=animated)[0])
+            artists.append(ax.text(10, 5, 'frame 0', zorder=10,
+                                   animated=animated))
+        return fig, artists
+    fig, artists = build(False)
+    blitted, managed = build(True)
+    manager = BlitManager(blitted.canvas, managed)
+    blitted.canvas.draw()
+    for frame in range(1, 4):
+        for line, text in (artists[:2], managed[:2]):
+            line.set_data([0, 50 + 10 * frame], [0, frame])
+            text.set_text('frame %d' % frame)
+        damaged = manager.update(managed[:2])
+        assert len(damaged) == 1
+        assert damaged[0].width < blitted.bbox.width / 2
+    fig.canvas.draw()
+    assert blitted.canvas.tostring_rgb() == fig.canvas.tostring_rgb()
+
+    manager.remove_artist(managed[1])
+    manager.update([])
+    artists[1].set_visible(False)
+    fig.canvas.draw()
+    assert blitted.canvas.tostring_rgb() == fig.canvas.tostring_rgb()
+
+def test_stale():
+    # a drawn figure is stale again only after a change to its artists
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    line, = ax.plot(range(10))
+    animated, = ax.plot(range(10), animated=True)
+    assert fig.get_stale()
+    fig.canvas.draw()
+    assert not fig.get_stale()
+    assert not ax.get_stale() and not line.get_stale()
+
+    line.set_ydata(range(10, 0, -1))
+    assert line.get_stale() and ax.get_stale() and fig.get_stale()
+    fig.canvas.draw()
+    ax.set_xlim(ax.get_xlim())
+    assert not fig.get_stale()
+    ax.set_xlim(0, 5)
+    assert fig.get_stale()
+    fig.canvas.draw()
+    animated.set_color('r')
+    assert animated.get_stale() and not fig.get_stale()
+
+    draws = []
+    draw = fig.canvas.draw
+    def counted_draw(*args, **kwargs):
+        draws.append(None)
+        draw(*args, **kwargs)
+    fig.canvas.draw = counted_draw
+    fig.canvas.draw_idle()
+    assert len(draws) == 0
+    ax.set_title('changed')
+    fig.canvas.draw_idle()
+    assert len(draws) == 1
+
+def test_stale_setters():
+    # changes that only set attributes still make the figure stale
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    mesh = ax.pcolormesh(np.random.rand(5, 5))
+    points = ax.scatter(range(5), range(5), c=range(5))
+    changes = [lambda: mesh.set_array(np.random.rand(25)),
+               lambda: points.set_array(np.arange(5)[::-1]),
+               lambda: ax.grid(True),
+               lambda: ax.xaxis.grid(False),
+               lambda: ax.yaxis.set_ticks_position('right'),
+               lambda: fig.set_figwidth(4)]
+    for change in changes:
+        fig.canvas.draw()
+        assert not fig.get_stale()
+        change()
+        assert fig.get_stale()
+
+def test_path_array():
+    # collections keep their paths in a PathArray, which must draw,
+    # hit test and autoscale like the same paths in a list
+    from matplotlib.collections import PolyCollection, LineCollection
+    from matplotlib.path import PathArray
+    np.random.seed(0)
+    polys = [np.random.rand(np.random.randint(3, 8), 2) + i % 10
+             for i in range(100)]
+    polys[3] = np.zeros((0, 2))
+    segs = np.ma.masked_greater(np.random.rand(50, 5, 2) * 10, 9)
+    def draw(aslist):
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.set_yscale('log')
+        cols = [PolyCollection(polys, facecolors='r'),
+                PolyCollection(polys, closed=False, facecolors='none'),
+                LineCollection(segs, offsets=(1, 1))]
+        for col in cols:
+            assert isinstance(col.get_paths(), PathArray)
+            if aslist:
+                col._paths = list(col._paths)
+            ax.add_collection(col)
+        ax.autoscale_view()
+        fig.canvas.draw()
+        class Event:
+            x, y = ax.transData.transform_point((5.5, 1.2))
+        hits = [col.contains(Event)[1]['ind'] for col in cols]
+        return fig.canvas.tostring_rgb(), ax.dataLim.bounds, hits
+    assert draw(False) == draw(True)
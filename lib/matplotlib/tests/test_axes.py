@@ -425,6 +425,25 @@ def test_polycollection_joinstyle():
 
     fig.savefig('polycollection_joinstyle')
 
+def test_hexbin_marginals():
+    # empty marginal bins get the reduction of no data, as they did
+    # with the reduction done one bin at a time: 0 for a sum, and
+    # left out for a mean
+    np.random.seed(0)
+    x = np.concatenate([np.random.rand(100), np.random.rand(100) + 2])
+    y = np.random.rand(200)
+    ax = plt.figure().add_subplot(111)
+    col = ax.hexbin(x, y, C=y, gridsize=10, marginals=True,
+                    reduce_C_function=np.sum)
+    sums = col.hbar.get_array()
+    assert len(sums) == 10 and np.sum(sums == 0) >= 3
+    assert np.allclose(sums.sum(), y.sum())
+    col = ax.hexbin(x, y, C=y, gridsize=10, marginals=True,
+                    reduce_C_function=np.mean)
+    means = col.hbar.get_array()
+    assert len(means) == np.sum(sums != 0)
+    assert np.all(means > 0)
+
 if __name__=='__main__':
     import nose
     nose.runmodule(argv=['-s','--with-doctest'], exit=False)
@@ -0,0 +1,153 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import cStringIO as StringIO
+
+def _savefig_pdf(fig):
+    fd = StringIO.StringIO()
+    fig.savefig(fd, format='pdf')
+    buf = fd.getvalue()
+    fd.close()
+    return buf
+
+def _page_stream(buf):
+    # the content stream of a single page figure, the one that
+    # clips to the axes
+    pages = [stream for stream in _streams(buf) if ' re W n' in stream]
+    assert len(pages) == 1
+    return pages[0]
+
+def test_scatter_uses_form_xobjects():
+    # the marker is written once as a Form XObject and placed with
+    # Do at every point
+    import re
+    fig = plt.figure()
+    ax = fig.add_subplot(1,1,1)
+    np.random.seed(0)
+    ax.scatter(np.random.rand(500), np.random.rand(500), c='r')
+    buf = _savefig_pdf(fig)
+    assert buf.startswith('%PDF')
+    assert '/Subtype /Form' in buf
+    # the marker form is listed once among the page's XObjects
+    forms = re.findall(r'(/P\d+) \d+ 0 R', buf)
+    assert len(forms) == 1
+    page = _page_stream(buf)
+    names = re.findall(r' cm (/P\d+) Do$', page, re.M)
+    assert names == forms * 500
+
+def test_pcolormesh():
+    # each quadrilateral is filled straight from the page, without
+    # a path or XObject of its own
+    import re
+    fig = plt.figure()
+    ax = fig.add_subplot(1,1,1)
+    x, y = np.meshgrid(np.arange(5), np.arange(4))
+    ax.pcolormesh(x, y, np.arange(12).reshape((3, 4)))
+    buf = _savefig_pdf(fig)
+    assert buf.rstrip().endswith('%%EOF')
+    assert not re.findall(r'/P\d+ \d+ 0 R', buf)
+    page = _page_stream(buf)
+    assert ' Do' not in page
+    quads = re.findall(r'^\S+ \S+ m( \S+ \S+ l){3} h f$', page, re.M)
+    assert len(quads) == 12
+
+def test_multipage_streaming():
+    # identical images share an XObject; in streaming mode each page
+    # embeds its own font subset
+    from matplotlib.backends.backend_pdf import PdfPages
+    fig = plt.figure()
+    ax = fig.add_subplot(1,1,1)
+    ax.imshow(np.arange(16.).reshape((4, 4)), interpolation='nearest')
+    for streaming in (False, True):
+        fd = StringIO.StringIO()
+        pages = PdfPages(fd, streaming=streaming)
+        for i in range(3):
+            ax.set_title('page %d' % i)
+            pages.savefig(fig)
+        pages.close()
+        buf = fd.getvalue()
+        assert buf.rstrip().endswith('%%EOF')
+        assert buf.count('/Subtype /Image') == 2   # the image and its smask
+        if streaming:
+            assert buf.count('/Subtype /Type3') == 3
+        else:
+            assert buf.count('/Subtype /Type3') == 1
+
+def _streams(buf):
+    # the decompressed contents of the streams in buf, sorted
+    import re, zlib
+    streams = []
+    for match in re.finditer(r'<<(.*?)>>\nstream\n', buf, re.S):
+        end = buf.index('\nendstream', match.end())
+        data = buf[match.end():end]
+        if '/FlateDecode' in match.group(1):
+            data = zlib.decompress(data)
+        streams.append(data)
+    streams.sort()
+    return streams
+
+def test_compression_threads():
+    # streams compressed in threads hold the same data
+    import re
+    from matplotlib import rcParams
+    fig = plt.figure()
+    ax = fig.add_subplot(1,1,1)
+    ax.plot(np.arange(1000) ** 0.5)
+    ax.imshow(np.arange(16.).reshape((4, 4)), extent=(0, 1000, 0, 30))
+    threads = rcParams['pdf.compression_threads']
+    level = rcParams['pdf.image_compression']
+    try:
+        rcParams['pdf.compression_threads'] = 0
+        expected = _savefig_pdf(fig)
+        rcParams['pdf.compression_threads'] = 2
+        buf = _savefig_pdf(fig)
+        assert buf.rstrip().endswith('%%EOF')
+        assert _streams(buf) == _streams(expected)
+
+        rcParams['pdf.image_compression'] = 0
+        buf = _savefig_pdf(fig)
+        images = re.findall(r'<<[^>]*/Subtype /Image[^>]*>>', buf)
+        assert len(images) == 2
+        for header in images:
+            assert '/FlateDecode' not in header
+        assert _streams(buf) == _streams(expected)
+    finally:
+        rcParams['pdf.compression_threads'] = threads
+        rcParams['pdf.image_compression'] = level
+
+def test_compression_threads_exit():
+    # a save that fails, or a PdfPages that is never closed, leaves no
+    # compression threads behind
+    import threading, time
+    from matplotlib import rcParams
+    from matplotlib.backends.backend_pdf import PdfPages, StreamCompressor
+    def fail(renderer):
+        raise ValueError('cannot draw')
+    fig = plt.figure()
+    ax = fig.add_subplot(1,1,1)
+    ax.imshow(np.arange(16.).reshape((4, 4)))
+    threads = rcParams['pdf.compression_threads']
+    timeout = StreamCompressor.idle_timeout
+    nthreads = threading.activeCount()
+    try:
+        rcParams['pdf.compression_threads'] = 2
+        StreamCompressor.idle_timeout = 0.05
+        pages = PdfPages(StringIO.StringIO())
+        pages.savefig(fig)
+        text = ax.text(0.5, 0.5, 'x')
+        text.draw = fail
+        for i in range(3):
+            try:
+                _savefig_pdf(fig)
+            except ValueError:
+                pass
+            else:
+                assert False, 'the failing draw did not raise'
+        del pages
+        for i in range(100):
+            if threading.activeCount() == nthreads:
+                break
+            time.sleep(0.05)
+        assert threading.activeCount() == nthreads
+    finally:
+        rcParams['pdf.compression_threads'] = threads
+        StreamCompressor.idle_timeout = timeout
@@ -0,0 +1,39 @@
+import re
+import matplotlib.pyplot as plt
+import numpy as np
+import cStringIO as StringIO
+
+def _savefig_ps(fig):
+    fd = StringIO.StringIO()
+    fig.savefig(fd, format='ps')
+    buf = fd.getvalue()
+    fd.close()
+    return buf
+
+def test_repeated_image():
+    # an image drawn again is defined once and read from its definition
+    fig = plt.figure()
+    fig.suppressComposite = True
+    data = np.arange(100.0).reshape(10, 10)
+    for i in range(3):
+        fig.figimage(data, xo=20*i, yo=20*i)
+    buf = _savefig_ps(fig)
+    names = re.findall(r'^/(I[0-9a-f]+) \[$', buf, re.M)
+    assert len(names) == 1
+    # the first copy is read inline from the file
+    assert buf.count('currentfile DataString readhexstring pop') == 1
+    assert buf.count(' %s DataIndex get' % names[0]) == 2
+
+def test_repeated_marker():
+    # markers of the same shape and colour share one procedure
+    fig = plt.figure()
+    ax = fig.add_subplot(1,1,1)
+    ax.plot([0], [0], 'o', color='r')
+    ax.plot([1], [1], 'o', color='r')
+    # tick marks are markers too
+    ax.set_xticks([])
+    ax.set_yticks([])
+    buf = _savefig_ps(fig)
+    names = re.findall(r'^/(m[0-9a-f]+) \{$', buf, re.M)
+    assert len(names) == 1
+    assert len(re.findall(r'^\S+ \S+ %s$' % names[0], buf, re.M)) == 2
@@ -27,3 +27,22 @@ def test_visibility():
 
     parser = xml.parsers.expat.ParserCreate()
     parser.Parse(buf) # this will raise ExpatError if the svg is invalid
+
+def test_repeated_image():
+    # the pixels of an image drawn several times are embedded once
+    fig=plt.figure()
+    data = np.arange(100.0).reshape(10, 10)
+    for i in range(4):
+        ax=fig.add_subplot(2,2,i+1)
+        ax.imshow(data)
+
+    fd = StringIO.StringIO()
+    fig.savefig(fd,format='svg')
+    buf = fd.getvalue()
+    fd.close()
+
+    assert buf.count('<image') == 1
+    assert buf.count('data:image/png') == 1
+    assert buf.count('<use xlink:href="#i') == 3
+    parser = xml.parsers.expat.ParserCreate()
+    parser.Parse(buf)
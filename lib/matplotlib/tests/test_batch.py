@@ -0,0 +1,40 @@
+import os
+import shutil
+import tempfile
+from matplotlib.figure import Figure
+from matplotlib.batch import FigureJob, export_figures
+from nose.tools import assert_equal
+
+def _make_figure(n):
+    fig = Figure()
+    ax = fig.add_subplot(111)
+    ax.plot(range(n))
+    return fig
+
+def _fail(n):
+    raise ValueError('no figure %d' % n)
+
+def _check_export(processes):
+    dirname = tempfile.mkdtemp()
+    try:
+        fnames = [os.path.join(dirname, 'fig%d.png' % i) for i in range(4)]
+        jobs = [FigureJob(_make_figure, fname, args=(i + 2,))
+                for i, fname in enumerate(fnames)]
+        jobs.append(FigureJob(_fail, os.path.join(dirname, 'fail.png'),
+                              args=(4,)))
+        results = list(export_figures(jobs, processes=processes))
+        assert_equal( sorted([r.index for r in results]), range(5) )
+        for result in results:
+            if result.index == 4:
+                assert 'no figure 4' in result.error
+            else:
+                assert result.error is None
+                assert os.path.exists(fnames[result.index])
+    finally:
+        shutil.rmtree(dirname)
+
+def test_export_figures():
+    _check_export(2)
+
+def test_export_figures_serial():
+    _check_export(1)
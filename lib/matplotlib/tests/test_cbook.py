@@ -12,3 +12,26 @@ def test_is_string_like():
 
     assert cbook.is_string_like( "hello world" )
     assert_equal( cbook.is_string_like(10), False )
+
+def test_lrucache():
+    cache = cbook.LRUCache(3)
+    for i in range(3):
+        cache[i] = i
+    assert_equal( cache.get(0), 0 )
+    cache[3] = 3
+    # 1 was the least recently used entry
+    assert 1 not in cache
+    assert_equal( sorted(cache._map.keys()), [0, 2, 3] )
+    assert_equal( cache.get(1), None )
+    stats = cache.stats()
+    assert_equal( (stats['hits'], stats['misses']), (1, 1) )
+
+def test_lrucache_maxbytes():
+    cache = cbook.LRUCache(maxbytes=10)
+    cache['a'] = 'x' * 5
+    cache['b'] = 'y' * 4
+    cache['c'] = 'z' * 2
+    assert 'a' not in cache
+    assert_equal( cache.nbytes, 6 )
+    cache['d'] = 'w' * 11
+    assert 'd' not in cache
@@ -159,6 +159,79 @@ def test_empty_date_with_year_formatter():
 
     fig.savefig('empty_date_bug')
 
+def test_date2num_num2date_sequences():
+    # the sequence conversions must agree with the scalar ones
+    import pytz
+    import matplotlib.dates as dates
+    x = np.linspace(733000.1, 733400.9, 1001)
+    for tz in (dates.UTC, pytz.timezone('US/Pacific')):
+        dts = dates.num2date(x, tz)
+        assert dts == [dates.num2date(val, tz) for val in x]
+        nums = dates.date2num(dts)
+        assert np.all(nums == [dates.date2num(dt) for dt in dts])
+    d = [datetime.date(2009, 1, 20), datetime.date(2009, 1, 21)]
+    assert np.all(dates.date2num(d) == [733427., 733428.])
+
+def test_date2num_datetime64():
+    import matplotlib.dates as dates
+    if not dates._HAVE_DATETIME64:
+        return
+    d = np.array(['2009-01-20T06:00', 'NaT'], dtype='datetime64[m]')
+    nums = dates.date2num(d)
+    assert nums[0] == 733427.25
+    assert np.isnan(nums[1])
+
+def test_rrulelocator_tick_cache():
+    # the cached and arithmetically computed ticks must match dateutil's
+    import matplotlib.dates as dates
+    fig = plt.figure()
+    ax = fig.add_subplot(1,1,1)
+    ax.xaxis_date()
+    dates.RRuleLocator.tick_cache.clear()
+    for loc in (dates.HourLocator(interval=5), dates.MinuteLocator(),
+                dates.DayLocator(bymonthday=[1, 15]),
+                dates.MonthLocator(interval=2)):
+        loc.set_axis(ax.xaxis)
+        unit = loc._get_unit()
+        for vmin in np.linspace(733000, 733100, 7):
+            ax.set_xlim(vmin, vmin + 40*unit)
+            ticks = loc()
+            dmin, dmax = loc.viewlim_to_dt()
+            expected = dates.date2num(loc.rule.between(dmin, dmax, True))
+            assert np.all(ticks == expected)
+    hits = dates.RRuleLocator.tick_cache.hits
+    loc()
+    assert dates.RRuleLocator.tick_cache.hits == hits + 1
+
+def test_rrulelocator_dst():
+    # dateutil timezones change their offset at daylight saving time,
+    # so their ticks must still follow the wall clock
+    import datetime
+    import dateutil.tz
+    import matplotlib.dates as dates
+    fig = plt.figure()
+    ax = fig.add_subplot(1,1,1)
+    ax.xaxis_date()
+    ax.set_xlim(dates.date2num(datetime.datetime(2010, 3, 12)),
+                dates.date2num(datetime.datetime(2010, 3, 17)))
+    eastern = dateutil.tz.gettz('US/Eastern')
+    for tz in (eastern, dateutil.tz.tzoffset('EST', -5*3600),
+               dateutil.tz.tzutc(), dates.UTC):
+        for loc in (dates.DayLocator(tz=tz),
+                    dates.HourLocator(interval=6, tz=tz),
+                    dates.HourLocator(byhour=[0, 12], tz=tz)):
+            loc.set_axis(ax.xaxis)
+            ticks = loc()
+            dmin, dmax = loc.viewlim_to_dt()
+            expected = dates.date2num(loc.rule.between(dmin, dmax, True))
+            assert np.all(ticks == expected)
+    # local midnight every day, before and after the switch on the 14th
+    loc = dates.DayLocator(tz=eastern)
+    loc.set_axis(ax.xaxis)
+    expected = [datetime.datetime(2010, 3, day, tzinfo=eastern)
+                for day in range(12, 17)]
+    assert np.all(loc() == dates.date2num(expected))
+
 if __name__=='__main__':
     import nose
     nose.runmodule(argv=['-s','--with-doctest'], exit=False)
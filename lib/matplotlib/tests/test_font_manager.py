@@ -0,0 +1,152 @@
+import os
+import shutil
+import tempfile
+from matplotlib import rcParams
+import matplotlib.font_manager as font_manager
+from nose.tools import assert_equal
+
+_vera = os.path.join(rcParams['datapath'], 'fonts', 'ttf', 'Vera.ttf')
+
+class _CountingFT2Font:
+    # stands in for the ft2font module, counting the fonts opened
+    def __init__(self, ft2font):
+        self.ft2font = ft2font
+        self.opened = []
+
+    def FT2Font(self, fname):
+        self.opened.append(os.path.basename(fname))
+        return self.ft2font.FT2Font(fname)
+
+    def __getattr__(self, name):
+        return getattr(self.ft2font, name)
+
+def _count_ft2font(func, *args):
+    counter = _CountingFT2Font(font_manager.ft2font)
+    font_manager.ft2font = counter
+    try:
+        result = func(*args)
+    finally:
+        font_manager.ft2font = counter.ft2font
+    return result, sorted(counter.opened)
+
+def _add_font(dirname, name, mtime=None):
+    fname = os.path.join(dirname, name)
+    shutil.copyfile(_vera, fname)
+    if mtime is not None:
+        os.utime(fname, (mtime, mtime))
+    return fname
+
+def test_create_font_list_cache():
+    dirname = tempfile.mkdtemp()
+    try:
+        fnames = [_add_font(dirname, 'a.ttf'), _add_font(dirname, 'b.ttf')]
+        cache = {}
+        fonts, opened = _count_ft2font(font_manager.createFontList,
+                                       fnames, 'ttf', cache)
+        assert_equal( len(fonts), 2 )
+        assert_equal( opened, ['a.ttf', 'b.ttf'] )
+        # unchanged files reuse their entries
+        fonts, opened = _count_ft2font(font_manager.createFontList,
+                                       fnames, 'ttf', cache)
+        assert_equal( len(fonts), 2 )
+        assert_equal( opened, [] )
+        # a changed file is parsed again
+        st = os.stat(fnames[1])
+        os.utime(fnames[1], (st.st_atime, st.st_mtime + 10))
+        fonts, opened = _count_ft2font(font_manager.createFontList,
+                                       fnames, 'ttf', cache)
+        assert_equal( len(fonts), 2 )
+        assert_equal( opened, ['b.ttf'] )
+    finally:
+        shutil.rmtree(dirname)
+
+def test_refresh_stale():
+    dirname = tempfile.mkdtemp()
+    oldpath = os.environ.get('TTFPATH')
+    os.environ['TTFPATH'] = dirname
+    try:
+        _add_font(dirname, 'a.ttf')
+        fm = font_manager.FontManager()
+        assert os.path.join(dirname, 'a.ttf') in fm.ttffiles
+        assert not fm.is_stale()
+        # adding a font touches its directory
+        _add_font(dirname, 'b.ttf')
+        st = os.stat(dirname)
+        os.utime(dirname, (st.st_atime, st.st_mtime + 10))
+        assert fm.is_stale()
+        result, opened = _count_ft2font(fm.refresh)
+        assert_equal( opened, ['b.ttf'] )
+        fnames = [entry.fname for entry in fm.ttflist]
+        assert os.path.join(dirname, 'a.ttf') in fnames
+        assert os.path.join(dirname, 'b.ttf') in fnames
+        assert not fm.is_stale()
+    finally:
+        if oldpath is None:
+            del os.environ['TTFPATH']
+        else:
+            os.environ['TTFPATH'] = oldpath
+        shutil.rmtree(dirname)
+
+def test_refresh_new_subdirectory():
+    # fonts found through fontconfig, installed as a new directory next
+    # to an existing one
+    dirname = tempfile.mkdtemp()
+    get_fontconfig_fonts = font_manager.get_fontconfig_fonts
+    def fontconfig_fonts(fontext='ttf'):
+        fnames = []
+        for path, subdirs, files in os.walk(dirname):
+            fnames.extend([os.path.join(path, fname) for fname in files
+                           if fname.endswith('.' + fontext)])
+        return fnames
+    font_manager.get_fontconfig_fonts = fontconfig_fonts
+    try:
+        truetype = os.path.join(dirname, 'truetype')
+        os.makedirs(os.path.join(truetype, 'old'))
+        _add_font(os.path.join(truetype, 'old'), 'a.ttf')
+        fm = font_manager.FontManager()
+        assert not fm.is_stale()
+        os.mkdir(os.path.join(truetype, 'new'))
+        _add_font(os.path.join(truetype, 'new'), 'b.ttf')
+        st = os.stat(truetype)
+        os.utime(truetype, (st.st_atime, st.st_mtime + 10))
+        assert fm.is_stale()
+        result, opened = _count_ft2font(fm.refresh)
+        assert_equal( opened, ['b.ttf'] )
+        fnames = [entry.fname for entry in fm.ttflist]
+        assert os.path.join(truetype, 'new', 'b.ttf') in fnames
+    finally:
+        font_manager.get_fontconfig_fonts = get_fontconfig_fonts
+        shutil.rmtree(dirname)
+
+def test_walk_search_path():
+    # a new directory below a search path makes the list stale
+    dirname = tempfile.mkdtemp()
+    oldpath = os.environ.get('TTFPATH')
+    os.environ['TTFPATH'] = dirname
+    try:
+        os.makedirs(os.path.join(dirname, 'a', 'b'))
+        fm = font_manager.FontManager()
+        assert not fm.is_stale()
+        inner = os.path.join(dirname, 'a', 'b')
+        os.mkdir(os.path.join(inner, 'c'))
+        st = os.stat(inner)
+        os.utime(inner, (st.st_atime, st.st_mtime + 10))
+        assert fm.is_stale()
+    finally:
+        if oldpath is None:
+            del os.environ['TTFPATH']
+        else:
+            os.environ['TTFPATH'] = oldpath
+        shutil.rmtree(dirname)
+
+def test_pickle_dump():
+    dirname = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(dirname, 'data.cache')
+        font_manager.pickle_dump({'a': 1}, fname)
+        # the file is replaced, not written over
+        font_manager.pickle_dump({'b': 2}, fname)
+        assert_equal( font_manager.pickle_load(fname), {'b': 2} )
+        assert_equal( os.listdir(dirname), ['data.cache'] )
+    finally:
+        shutil.rmtree(dirname)
@@ -2,10 +2,12 @@ import numpy as np
 
 from matplotlib.testing.decorators import image_comparison, knownfailureif
 import matplotlib.pyplot as plt
+import matplotlib.image as mimage
 from nose.tools import assert_raises
 
 import cStringIO
 import os
+import tempfile
 
 @image_comparison(baseline_images=['image_interps'])
 def test_image_interps():
@@ -38,6 +40,144 @@ def test_image_python_io():
     buffer.seek(0)
     plt.imread(buffer)
 
+def test_rgba_tiles():
+    'the tiled rgba cache matches a direct conversion of the slice'
+    X = np.arange(35*45, dtype=np.float).reshape(35, 45)
+    fig = plt.figure()
+    ax = fig.add_subplot(111)
+    im = ax.imshow(X)
+    im.rgba_tile_size = 8
+    expected = im.to_rgba(X, bytes=True)
+    yslice, xslice = slice(3, 30), slice(10, 43)
+    assert np.all(im._get_rgba_bytes(yslice, xslice) ==
+                  expected[yslice, xslice])
+    # now served from the cached tiles
+    assert len(im._rgbacache) == 20
+    assert np.all(im._get_rgba_bytes(slice(0, 35), slice(0, 45)) ==
+                  expected)
+    assert len(im._rgbacache) == 30
+
+def test_downsample():
+    X = np.arange(30, dtype=np.float).reshape(5, 6)
+    Y = mimage._downsample(X)
+    assert Y.shape == (2, 3)
+    assert np.allclose(Y[0], [3.5, 5.5, 7.5])
+
+    X = np.ma.masked_array(X, mask=np.zeros(X.shape, bool))
+    X[0, 0] = X[1, 0] = X[0, 1] = np.ma.masked
+    X[2:4, 4:6] = np.ma.masked
+    Y = mimage._downsample(X)
+    assert Y[0, 0] == 7.0
+    assert Y[1, 2] is np.ma.masked
+
+def _render_image(X, origin, shape, extent=None, pyramid=False):
+    # draw X in the view of an image of the given shape
+    fig = plt.figure(figsize=(4, 3), dpi=50)
+    ax = fig.add_subplot(111)
+    im = ax.imshow(X, origin=origin, extent=extent, interpolation='nearest',
+                   vmin=0, vmax=shape[0]*shape[1])
+    im.set_pyramid(pyramid)
+    ax.set_xlim(-0.5, shape[1] - 0.5)
+    if origin == 'upper':
+        ax.set_ylim(shape[0] - 0.5, -0.5)
+    else:
+        ax.set_ylim(-0.5, shape[0] - 0.5)
+    fig.canvas.draw()
+    return im, fig.canvas.tostring_rgb()
+
+def test_pyramid_level():
+    'zoomed out, the image is drawn from the matching pyramid level'
+    X = np.arange(799*1197, dtype=np.float).reshape(799, 1197)
+    for origin in ('upper', 'lower'):
+        im, buf = _render_image(X, origin, X.shape, pyramid=True)
+        l, b, r, t = im.axes.bbox.extents
+        # the data pixels per display pixel, rounded down to a power of 2
+        ratio = min(1197 / (r - l), 799 / (t - b))
+        level = int(np.log2(ratio))
+        assert level >= 2
+        assert im._oldlevel == level
+        A = im._get_pyramid(level)
+        assert A.shape == (799 >> level, 1197 >> level)
+
+        # the level covers the rows and columns that fill whole blocks,
+        # the first ones from the top with origin upper, from the
+        # bottom with origin lower
+        rows, cols = A.shape[0] << level, A.shape[1] << level
+        if origin == 'upper':
+            extent = (-0.5, cols - 0.5, rows - 0.5, -0.5)
+        else:
+            extent = (-0.5, cols - 0.5, -0.5, rows - 0.5)
+        expected = _render_image(A, origin, X.shape, extent=extent)[1]
+        assert buf == expected
+
+        im, buf = _render_image(X, origin, X.shape, pyramid=False)
+        assert im._oldlevel == 0
+
+def test_imshow_memmap():
+    'a memory-mapped array is drawn without being copied'
+    fd, fname = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        X = np.memmap(fname, dtype=np.float32, mode='w+', shape=(60, 80))
+        X[:] = np.arange(60*80).reshape(60, 80)
+        X[10, 10] = np.nan
+
+        def render(data):
+            fig = plt.figure()
+            ax = fig.add_subplot(111)
+            im = ax.imshow(data, interpolation='nearest')
+            ax.set_xlim(20, 50)
+            fig.canvas.draw()
+            return im, fig.canvas.tostring_rgb()
+
+        im, buf = render(X)
+        assert im.get_array() is X
+        assert (im.norm.vmin, im.norm.vmax) == (0, 60*80-1)
+        assert render(np.array(X))[1] == buf
+        del im, X
+    finally:
+        os.remove(fname)
+
+class _CountingSource(object):
+    # an array source that counts the elements read from it
+    def __init__(self, A):
+        self.A = A
+        self.shape = A.shape
+        self.dtype = A.dtype
+        self.nread = 0
+
+    def __getitem__(self, key):
+        block = self.A[key]
+        self.nread += block.size
+        return block
+
+def test_array_source_reads_display():
+    'zoomed out, an array source is read at the display resolution'
+    X = _CountingSource(np.arange(2000*3000.).reshape(2000, 3000))
+    fig = plt.figure(figsize=(4, 3), dpi=50)
+    ax = fig.add_subplot(111)
+    im = ax.imshow(X, vmin=0, vmax=X.A.max())
+    im.rgba_tile_size = 32
+    im.rgba_cache_bytes = 64*1024
+    fig.canvas.draw()
+    assert im._oldlevel > 0
+    # no more than a few tiles beyond the axes' pixels
+    l, b, w, h = ax.bbox.bounds
+    assert X.nread < 4*w*h
+    assert 0 < im._rgbacache.nbytes <= im.rgba_cache_bytes
+    for x0 in range(0, 3000, 300):
+        ax.set_xlim(x0, x0 + 1000)
+        fig.canvas.draw()
+        assert 0 < im._rgbacache.nbytes <= im.rgba_cache_bytes
+
+def test_source_level():
+    'every step-th row and column of an array source'
+    A = np.arange(7*9).reshape(7, 9)
+    level = mimage._SourceLevel(_CountingSource(A), 2)
+    assert level.shape == (3, 4)
+    assert np.all(level[0:3, 0:4] == A[0:6:2, 0:8:2])
+    assert np.all(level[1:2, 2:4] == A[2:4:2, 4:8:2])
+
 # def test_image_unicode_io():
 #     fig = plt.figure()
 #     ax = fig.add_subplot(111)
@@ -114,3 +114,21 @@ def test_mathtext_stixsans():
     matplotlib.rcParams['mathtext.fontset'] = 'cm'
 
 
+
+def test_shared_cache():
+    # parsers for the same output share their results, but a change of
+    # fontset lays the expression out again
+    from matplotlib.mathtext import MathTextParser
+    from matplotlib.font_manager import FontProperties
+    s = r'$\sqrt{\alpha^2 + \beta_i}$'
+    cache = MathTextParser.get_cache('Agg')
+    cache.clear()
+    first = MathTextParser('Agg').parse(s, 72, FontProperties())
+    assert MathTextParser('agg').parse(s, 72, FontProperties()) is first
+    assert cache.stats()['hits'] == 1
+    matplotlib.rcParams['mathtext.fontset'] = 'stix'
+    try:
+        assert MathTextParser('Agg').parse(s, 72, FontProperties()) \
+               is not first
+    finally:
+        matplotlib.rcParams['mathtext.fontset'] = 'cm'
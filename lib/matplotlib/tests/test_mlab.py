@@ -8,3 +8,126 @@ def test_colinear_pca():
     assert(np.allclose(pca.fracs[2:], 0.))
     assert(np.allclose(pca.Y[:,2:], 0.))
 
+
+def test_reduce_bins():
+    ind = np.array([3, 0, 3, 1, 3, 0])
+    values = np.array([5., 2., 1., 7., 3., 4.])
+    for func in (np.sum, np.mean, np.min, np.max, np.median, len,
+                 lambda v: v[0]):
+        reduced, counts = mlab.reduce_bins(ind, values, 5, func)
+        assert np.all(counts == [2, 1, 0, 3, 0])
+        assert np.all(np.isnan(reduced[[2, 4]]))
+        for i in (0, 1, 3):
+            assert reduced[i] == func(values[ind == i])
+
+def test_hexbin_accumulator():
+    # binning in chunks gives the same result as all at once
+    np.random.seed(0)
+    x, y, C = np.random.randn(3, 5000)
+    lattice = mlab.get_hex_lattice((-2, 2, -2, 2), 10)
+    assert mlab.get_hex_lattice((-2., 2., -2., 2.), 10) is lattice
+    assert lattice.polygons().shape == (lattice.n, 6, 2)
+    ind = lattice.bin(x, y)
+    assert ind.min() == -1 and ind.max() < lattice.n
+    for func in (None, np.mean, np.max, np.median):
+        whole = mlab.HexBinAccumulator(lattice, func)
+        whole.add(x, y, C)
+        chunked = mlab.HexBinAccumulator(lattice, func)
+        chunked.chunksize = 999
+        for i in range(0, 5000, 1500):
+            chunked.add(x[i:i+1500], y[i:i+1500], C[i:i+1500])
+        assert np.all(whole.counts == chunked.counts)
+        assert whole.counts.sum() == (ind >= 0).sum()
+        for mincnt in (None, 3):
+            a = whole.result(mincnt)
+            b = chunked.result(mincnt)
+            assert np.all(np.isnan(a) == np.isnan(b))
+            good = ~np.isnan(a)
+            assert np.allclose(a[good], b[good])
+
+def test_stream_histogram():
+    np.random.seed(0)
+    x = np.random.randn(10000)
+    w = np.random.rand(10000)
+    expected, bins = np.histogram(x, 20)
+    chunks = lambda: (x[i:i+1234] for i in range(0, len(x), 1234))
+    for data in (x, chunks):
+        n, b = mlab.stream_histogram(data, 20, chunksize=1000)
+        assert np.all(n == expected) and np.all(b == bins)
+    n, b = mlab.stream_histogram(chunks(), bins)
+    assert np.all(n == expected)
+    n, b = mlab.stream_histogram(x, bins, weights=w, normed=True,
+                                 chunksize=1000)
+    expected = np.histogram(x, bins, weights=w)[0]
+    assert np.allclose(n, expected / (np.diff(bins) * expected.sum()))
+    try:
+        mlab.stream_histogram(chunks(), 20)
+    except ValueError:
+        pass
+    else:
+        assert False, 'binning a one-shot iterator needs explicit bins'
+
+def test_hist_memmap():
+    # a 2D memmap gives a histogram per column, like the array in
+    # memory, and quantile binning takes explicit bins
+    import os, tempfile
+    from matplotlib.figure import Figure
+    np.random.seed(0)
+    data = np.random.randn(1000, 2)
+    data[:, 1] += 1
+    fd, fname = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        x = np.memmap(fname, np.float_, 'w+', shape=data.shape)
+        x[:] = data
+        ax = Figure().add_subplot(111)
+        n, bins, patches = ax.hist(x, 10)
+        assert np.shape(n) == (2, 10)
+        expected, edges = np.histogram(data[:, 0], 10)
+        assert np.allclose(bins, edges) and np.all(n[0] == expected)
+        assert np.all(n[1] == np.histogram(data[:, 1], edges)[0])
+        edges = [-3, -1, 0, 1, 3]
+        n, bins, patches = ax.hist(x, edges, binning='quantile')
+        assert np.all(bins == edges)
+        assert np.all(n[1] == np.histogram(data[:, 1], edges)[0])
+        del x
+    finally:
+        os.remove(fname)
+
+def test_quantile_sketch():
+    np.random.seed(0)
+    x = np.random.rand(100000)
+    q = np.linspace(0, 1, 11)
+    sketch = mlab.QuantileSketch(k=len(x))
+    sketch.add(x)
+    assert np.all(sketch.quantiles(q[1:-1]) ==
+                  mlab.prctile(x, 100 * q[1:-1]))
+    sketch = mlab.QuantileSketch(k=500)
+    for i in range(0, len(x), 3000):
+        sketch.add(x[i:i+3000])
+    assert sketch.count == len(x)
+    assert sum([len(level) for level in sketch._levels]) < 5000
+    estimate = sketch.quantiles(q)
+    assert estimate[0] == x.min() and estimate[-1] == x.max()
+    assert np.allclose(estimate, q, atol=0.01)
+    n, bins = mlab.stream_histogram(x, 10, binning='quantile')
+    assert np.all(abs(n - 10000) < 100)
+
+def test_spectral_segments():
+    # the batched ffts match transforming the segments one by one
+    np.random.seed(0)
+    x = np.random.randn(5000)
+    NFFT, noverlap = 256, 100
+    window = np.hanning(NFFT)
+    for detrend in (mlab.detrend_none, mlab.detrend_mean,
+                    mlab.detrend_linear, lambda seg: seg - seg[0]):
+        Pxx, freqs, t = mlab.specgram(x, NFFT, detrend=detrend,
+                                      noverlap=noverlap)
+        ind = np.arange(0, len(x) - NFFT + 1, NFFT - noverlap)
+        assert Pxx.shape == (NFFT//2 + 1, len(ind))
+        for i, start in enumerate(ind):
+            fx = np.fft.fft(window * detrend(x[start:start+NFFT]))
+            expected = 2 * np.abs(fx[:NFFT//2 + 1])**2 / (window**2).sum() / 2
+            assert np.allclose(Pxx[:,i], expected)
+        psd, freqs = mlab.psd(x, NFFT, detrend=detrend, noverlap=noverlap)
+        assert np.allclose(psd, Pxx.mean(axis=1))
@@ -0,0 +1,60 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d import Axes3D, art3d, proj3d
+
+class _Renderer:
+    # all that Poly3DCollection.do_3d_projection needs of a renderer
+    def __init__(self, M):
+        self.M = M
+
+def _project(verts, facecolors, nan_face=None):
+    fig = plt.figure()
+    ax = Axes3D(fig)
+    if nan_face is not None:
+        verts[nan_face][0][2] = np.nan
+    col = art3d.Poly3DCollection(verts, facecolors=facecolors,
+                                 edgecolors=facecolors[::-1])
+    ax.add_collection3d(col)
+    M = ax.get_proj()
+    col.do_3d_projection(_Renderer(M))
+
+    # sort the faces one at a time, as the collection used to, except
+    # that faces of unknown depth go first
+    faces = []
+    for i, poly in enumerate(verts):
+        xs, ys, zs = proj3d.proj_transform(*(list(np.transpose(poly)) + [M]))
+        depth = np.average(zs)
+        if np.isnan(depth):
+            depth = np.inf
+        faces.append((-depth, i, zip(xs, ys)))
+    faces.sort()
+    order = [i for depth, i, xy in faces]
+    return col, order, [xy for depth, i, xy in faces]
+
+def _check_order(verts, nan_face=None):
+    facecolors = np.random.rand(len(verts), 4)
+    col, order, xys = _project(verts, facecolors, nan_face)
+    assert np.all(col.get_facecolors() == facecolors[order])
+    assert np.all(col.get_edgecolors() == facecolors[::-1][order])
+    paths = col.get_paths()
+    assert len(paths) == len(verts)
+    for path, xy in zip(paths, xys):
+        # the path is closed with an extra vertex
+        vertices, xy = path.vertices[:-1], np.array(xy)
+        nan = np.isnan(xy)
+        assert np.all(np.isnan(vertices) == nan)
+        assert np.allclose(vertices[~nan], xy[~nan])
+    return order
+
+def test_poly3d_order():
+    # triangles and quadrilaterals at random depths
+    np.random.seed(0)
+    verts = [np.random.rand(3 + i % 2, 3) for i in range(20)]
+    _check_order(verts)
+
+def test_poly3d_order_nan():
+    # a face with a nan vertex is painted first, furthest back
+    np.random.seed(1)
+    verts = [np.random.rand(4, 3) for i in range(10)]
+    order = _check_order(verts, nan_face=6)
+    assert order[0] == 6
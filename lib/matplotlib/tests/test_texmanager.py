@@ -0,0 +1,136 @@
+import os
+import shutil
+import tempfile
+import threading
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.figure import Figure
+from matplotlib.testing.noseclasses import KnownFailureTest
+from nose.tools import assert_equal
+
+def _stub_texmanager(dirname):
+    # a TexManager that writes empty files to dirname instead of
+    # running latex and dvipng, and records what it was asked for
+    try:
+        from matplotlib.texmanager import TexManager
+    except RuntimeError:
+        # the class checks the dvipng version when it is defined
+        raise KnownFailureTest('dvipng is not installed')
+    texmanager = TexManager()
+    texmanager.texcache = dirname
+    texmanager.made = []
+    lock = threading.Lock()
+    def make(ext, tex, fontsize, *args):
+        fname = texmanager.get_basefile(tex, fontsize, *args) + ext
+        open(fname, 'w').close()
+        lock.acquire()
+        texmanager.made.append((tex, fontsize) + args)
+        lock.release()
+        return fname
+    texmanager.make_dvi = lambda *args: make('.dvi', *args)
+    texmanager.make_png = lambda *args: make('.png', *args)
+    return texmanager
+
+def _make_figure():
+    fig = Figure()
+    ax = fig.add_subplot(111)
+    ax.set_xticks([0, 1])
+    ax.set_yticks([0, 1])
+    ax.set_title('$x^2$')
+    ax.set_xlabel('$x^2$')
+    ax.set_ylabel('two\nlines')
+    ax.text(0.5, 0.5, 'lines', size=20)
+    return fig
+
+def test_prefetch_figure():
+    dirname = tempfile.mkdtemp()
+    try:
+        texmanager = _stub_texmanager(dirname)
+        fig = _make_figure()
+        texmanager.prefetch_figure(fig, processes=3)
+        made = texmanager.made
+        assert_equal( len(made), len(set(made)) )
+        for tex, fontsize in made:
+            assert os.path.exists(texmanager.get_basefile(tex, fontsize)
+                                  + '.dvi')
+        texts = set([tex for tex, fontsize in made])
+        for tex in ('lp', '0', '1', '$x^2$', 'two', 'lines'):
+            assert tex in texts
+        assert ('lines', 20) in made
+        # everything is in the cache directory now
+        texmanager.made = []
+        texmanager.prefetch_figure(fig, processes=3)
+        assert_equal( texmanager.made, [] )
+        # rendering to png needs its own files
+        texmanager.prefetch_figure(fig, dpi=72, processes=3)
+        assert_equal( sorted(texmanager.made),
+                      sorted([args + (72,) for args in made]) )
+    finally:
+        shutil.rmtree(dirname)
+
+def test_prefetch_error():
+    dirname = tempfile.mkdtemp()
+    try:
+        texmanager = _stub_texmanager(dirname)
+        def fail(tex, fontsize):
+            raise ValueError('cannot make %s' % tex)
+        texmanager.make_dvi = fail
+        try:
+            texmanager.prefetch([('a', 10), ('a', 10), ('b', 12)])
+        except ValueError, err:
+            assert 'cannot make' in str(err)
+        else:
+            assert False, 'prefetch did not raise'
+    finally:
+        shutil.rmtree(dirname)
+
+def test_extent_cache():
+    # extents are measured once per string, font and preamble
+    dirname = tempfile.mkdtemp()
+    preamble = rcParams['text.latex.preamble']
+    try:
+        texmanager = _stub_texmanager(dirname)
+        texmanager.extentd.clear()
+        measured = []
+        def measure(tex, fontsize, dpi_fraction):
+            measured.append(tex)
+            return 10.0, 5.0, 1.0
+        texmanager._get_text_width_height_descent = measure
+        for i in range(3):
+            extent = texmanager.get_text_width_height_descent('x', 12)
+            assert_equal( extent, (10.0, 5.0, 1.0) )
+        assert_equal( measured, ['x'] )
+        assert_equal( texmanager.extentd.hits, 2 )
+        rcParams['text.latex.preamble'] = [r'\usepackage{amsmath}']
+        texmanager.get_text_width_height_descent('x', 12)
+        assert_equal( measured, ['x', 'x'] )
+    finally:
+        rcParams['text.latex.preamble'] = preamble
+        shutil.rmtree(dirname)
+
+def test_agg_draw_tex_cache():
+    # a string drawn again with the same preamble comes from texd
+    from matplotlib.backends.backend_agg import RendererAgg
+    from matplotlib.font_manager import FontProperties
+    dirname = tempfile.mkdtemp()
+    try:
+        texmanager = _stub_texmanager(dirname)
+        rastered = []
+        def get_grey(tex, fontsize=None, dpi=None):
+            rastered.append(tex)
+            return np.ones((8, 20))
+        texmanager.get_grey = get_grey
+        RendererAgg.texd.clear()
+        for i in range(2):
+            renderer = RendererAgg(100, 100, 72)
+            renderer._texmanager = texmanager
+            gc = renderer.new_gc()
+            renderer.draw_tex(gc, 10, 50, 'x', FontProperties(), 0)
+            gc.restore()
+        assert_equal( rastered, ['x'] )
+        assert_equal( RendererAgg.texd.hits, 1 )
+        # the cached raster was drawn
+        image = np.fromstring(renderer.tostring_argb(), np.uint8)
+        assert image.reshape((100, 100, 4))[:, :, 0].any()
+    finally:
+        shutil.rmtree(dirname)
@@ -17,6 +17,15 @@ Backends:
 * PS
 * PDF
 
+The rasters and text extents read back from the cache directory are
+also kept in memory, in size-bounded caches shared by all
+:class:`TexManager` instances, so drawing the same strings again does
+not touch the disk.
+
+Each new string costs a run of latex (and dvipng).  When a figure has
+many of them, :meth:`TexManager.prefetch_figure` compiles all of its
+strings up front, running several of these programs at once.
+
 For raster output, you can get RGBA numpy arrays from TeX expressions
 as follows::
 
@@ -33,7 +42,7 @@ or include these two lines in your script::
 
 """
 
-import copy, glob, os, shutil, sys, warnings
+import copy, glob, os, shutil, sys, threading, warnings
 from subprocess import Popen, PIPE, STDOUT
 
 try:
@@ -41,11 +50,17 @@ try:
 except ImportError:
     from md5 import md5 #Deprecated in 2.5
 
+try:
+    from multiprocessing import cpu_count
+except ImportError:
+    def cpu_count(): return 1
+
 import distutils.version
 import numpy as np
 import matplotlib as mpl
 from matplotlib import rcParams
 from matplotlib._png import read_png
+from matplotlib.cbook import LRUCache
 import matplotlib.dviread as dviread
 import re
 
@@ -93,9 +108,11 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
 
     _dvipng_hack_alpha = dvipng_hack_alpha()
 
-    # mappable cache of
-    rgba_arrayd = {}
-    grey_arrayd = {}
+    # in-memory caches of the rasters and extents derived from the
+    # files in texcache, keyed on everything that goes into the file name
+    rgba_arrayd = LRUCache(maxbytes=32*1024*1024, sizeof=lambda a: a.nbytes)
+    grey_arrayd = LRUCache(maxbytes=16*1024*1024, sizeof=lambda a: a.nbytes)
+    extentd = LRUCache(4096)
     postscriptd = {}
     pscnt = 0
 
@@ -492,6 +509,80 @@ process the flowing file:\n%s\nHere is the full report generated by dvipng: \
 
         return psfile
 
+    def prefetch(self, strings, dpi=None, processes=None):
+        """
+        Compile the (*tex*, *fontsize*) pairs in *strings* that are not
+        in the cache directory yet, and with *dpi*, render them to png
+        files too.  Up to *processes* latex or dvipng processes run at
+        the same time; the default is one per cpu.  If some strings
+        fail, the error of one of them is raised once all are done.
+        """
+        if processes is None:
+            processes = cpu_count()
+        # settle the font configuration before the threads use it
+        self.get_font_config()
+        if dpi is None:
+            make, ext = self.make_dvi, '.dvi'
+        else:
+            make, ext = self.make_png, '.png'
+        jobs = {}
+        for tex, fontsize in strings:
+            fname = self.get_basefile(tex, fontsize, dpi) + ext
+            if fname not in jobs and (DEBUG or not os.path.exists(fname)):
+                jobs[fname] = (tex, fontsize)
+        jobs = jobs.values()
+        if dpi is not None:
+            jobs = [(tex, fontsize, dpi) for tex, fontsize in jobs]
+        errors = []
+        def work():
+            # make_dvi and make_png wait for the programs they start,
+            # which does not hold the GIL
+            while 1:
+                try:
+                    args = jobs.pop()
+                except IndexError:
+                    return
+                try:
+                    make(*args)
+                except Exception:
+                    errors.append(sys.exc_info())
+        threads = [threading.Thread(target=work)
+                   for i in range(min(processes, len(jobs)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0][0], errors[0][1], errors[0][2]
+
+    def prefetch_figure(self, fig, dpi=None, processes=None):
+        """
+        :meth:`prefetch` the strings of the text and tick labels of the
+        :class:`~matplotlib.figure.Figure` *fig*, as they would be
+        drawn with usetex.  Pass the *dpi* of the figure for raster
+        output.
+        """
+        from matplotlib.text import Text
+        strings = []
+        sizes = {}
+        def add(s, fontsize):
+            if fontsize not in sizes:
+                # every text is laid out against the extent of 'lp'
+                sizes[fontsize] = True
+                strings.append(('lp', fontsize))
+            for line in s.split('\n'):
+                strings.append((line, fontsize))
+        for ax in fig.axes:
+            for axis in ax.xaxis, ax.yaxis:
+                for tick, loc, label in axis.iter_ticks():
+                    if label:
+                        add(label, tick.label1.get_size())
+        for text in fig.findobj(Text):
+            s = text.get_text()
+            if s and text.get_visible():
+                add(s, text.get_size())
+        self.prefetch(strings, dpi, processes)
+
     def get_ps_bbox(self, tex, fontsize):
         """
         returns a list containing the postscript bounding box for latex's
@@ -506,7 +597,8 @@ process the flowing file:\n%s\nHere is the full report generated by dvipng: \
 
     def get_grey(self, tex, fontsize=None, dpi=None):
         """returns the alpha channel"""
-        key = tex, self.get_font_config(), fontsize, dpi
+        key = (tex, self.get_font_config(), self.get_custom_preamble(),
+               fontsize, dpi)
         alpha = self.grey_arrayd.get(key)
 
         if alpha is None:
@@ -543,7 +635,8 @@ process the flowing file:\n%s\nHere is the full report generated by dvipng: \
                 #alpha = npy.sqrt(1-X[:,:,0]) # should this be sqrt here?
                 alpha = 1-X[:,:,0]
             else:
-                alpha = X[:,:,-1]
+                # copy, so the cache does not keep the whole of X alive
+                alpha = X[:,:,-1].copy()
 
             self.grey_arrayd[key] = alpha
         return alpha
@@ -556,7 +649,8 @@ process the flowing file:\n%s\nHere is the full report generated by dvipng: \
         if not fontsize: fontsize = rcParams['font.size']
         if not dpi: dpi = rcParams['savefig.dpi']
         r,g,b = rgb
-        key = tex, self.get_font_config(), fontsize, dpi, tuple(rgb)
+        key = (tex, self.get_font_config(), self.get_custom_preamble(),
+               fontsize, dpi, tuple(rgb))
         Z = self.rgba_arrayd.get(key)
 
         if Z is None:
@@ -583,6 +677,16 @@ process the flowing file:\n%s\nHere is the full report generated by dvipng: \
         else:
             dpi_fraction = 1.
 
+        key = (tex, self.get_font_config(), self.get_custom_preamble(),
+               fontsize, dpi_fraction, rcParams['text.latex.preview'])
+        extent = self.extentd.get(key)
+        if extent is None:
+            extent = self._get_text_width_height_descent(tex, fontsize,
+                                                         dpi_fraction)
+            self.extentd[key] = extent
+        return extent
+
+    def _get_text_width_height_descent(self, tex, fontsize, dpi_fraction):
         if rcParams['text.latex.preview']:
             # use preview.sty
             basefile = self.get_basefile(tex, fontsize)
@@ -10,7 +10,7 @@ from matplotlib import cbook
 from matplotlib import rcParams
 import matplotlib.artist as artist
 from matplotlib.artist import Artist
-from matplotlib.cbook import is_string_like, maxdict
+from matplotlib.cbook import is_string_like, maxdict, LRUCache
 from matplotlib import docstring
 from matplotlib.font_manager import FontProperties
 from matplotlib.patches import bbox_artist, YAArrow, FancyBboxPatch, \
@@ -26,6 +26,7 @@ import matplotlib.nxutils as nxutils
 from matplotlib.path import Path
 import matplotlib.font_manager as font_manager
 from matplotlib.ft2font import FT2Font
+from matplotlib.mathtext import MathTextParser
 
 from matplotlib.backend_bases import RendererBase
 
@@ -38,6 +39,38 @@ def _process_text_args(override, fontdict=None, **kwargs):
     override.update(kwargs)
     return override
 
+# The extents measured by the renderers, shared by all Text instances
+# and the layout code of axes, legends and offset boxes; use its
+# stats() method to see how well it does.
+metrics_cache = LRUCache(4096)
+
+def get_text_metrics(renderer, s, prop, ismath):
+    """
+    Return the width, height and descent of the string *s* drawn by
+    *renderer* with the :class:`~matplotlib.font_manager.FontProperties`
+    *prop*, as ``renderer.get_text_width_height_descent`` does, but
+    look it up in :data:`metrics_cache` first.  The cache is keyed on
+    the string, the font properties, *ismath*, the renderer class and
+    its dpi, and the rc settings that change how text is measured:
+    the mathtext settings for math text, and the TeX font
+    configuration and preamble for TeX.
+    """
+    key = (s, hash(prop), ismath, renderer.__class__,
+           getattr(renderer, 'dpi', None), rcParams['text.hinting'],
+           rcParams['pdf.use14corefonts'], rcParams['ps.useafm'])
+    if ismath == 'TeX':
+        texmanager = renderer.get_texmanager()
+        key += (texmanager.get_font_config(),
+                texmanager.get_custom_preamble())
+    elif ismath:
+        key += tuple([rcParams[k] for k in MathTextParser._cache_rc_keys])
+    metrics = metrics_cache.get(key)
+    if metrics is None:
+        metrics = renderer.get_text_width_height_descent(s, prop,
+                                                         ismath=ismath)
+        metrics_cache[key] = metrics
+    return metrics
+
 # Extracted from Text's method to serve as a function
 def get_rotation(rotation):
     """
@@ -240,6 +273,7 @@ class Text(Artist):
             self._rotation_mode = m
         else:
             raise ValueError("Unknown rotation_mode : %s" % repr(m))
+        self.set_stale()
 
     def get_rotation_mode(self):
         "get text rotation mode"
@@ -288,7 +322,8 @@ class Text(Artist):
                     return RendererBase.get_text_width_height_descent(renderer,
                                                                       *kl, **kwargs)
         else:
-            get_text_width_height_descent = renderer.get_text_width_height_descent
+            def get_text_width_height_descent(s, prop, ismath):
+                return get_text_metrics(renderer, s, prop, ismath)
 
         # Find full vertical extent of font,
         # including ascenders and descenders:
@@ -407,6 +442,7 @@ class Text(Artist):
 
     def set_path_effects(self, path_effects):
         self._path_effects = path_effects
+        self.set_stale()
 
     def get_path_effects(self):
         return self._path_effects
@@ -446,6 +482,7 @@ class Text(Artist):
         else:
             self._bbox_patch = None
             self._bbox = rectprops
+        self.set_stale()
 
 
     def get_bbox_patch(self):
@@ -788,6 +825,7 @@ class Text(Artist):
             self._bbox = dict(facecolor=color, edgecolor=color)
         else:
             self._bbox.update(dict(facecolor=color))
+        self.set_stale()
 
 
 
@@ -803,6 +841,7 @@ class Text(Artist):
         except TypeError:
             color = tuple(color)
         self._color = color
+        self.set_stale()
 
     def set_ha(self, align):
         'alias for set_horizontalalignment'
@@ -818,6 +857,7 @@ class Text(Artist):
         if align not in legal:
             raise ValueError('Horizontal alignment must be one of %s' % str(legal))
         self._horizontalalignment = align
+        self.set_stale()
 
     def set_ma(self, align):
         'alias for set_verticalalignment'
@@ -837,6 +877,7 @@ class Text(Artist):
         if align not in legal:
             raise ValueError('Horizontal alignment must be one of %s' % str(legal))
         self._multialignment = align
+        self.set_stale()
 
     def set_linespacing(self, spacing):
         """
@@ -846,6 +887,7 @@ class Text(Artist):
         ACCEPTS: float (multiple of font size)
         """
         self._linespacing = spacing
+        self.set_stale()
 
     def set_family(self, fontname):
         """
@@ -858,6 +900,7 @@ class Text(Artist):
         ACCEPTS: [ FONTNAME | 'serif' | 'sans-serif' | 'cursive' | 'fantasy' | 'monospace' ]
         """
         self._fontproperties.set_family(fontname)
+        self.set_stale()
 
     def set_variant(self, variant):
         """
@@ -866,6 +909,7 @@ class Text(Artist):
         ACCEPTS: [ 'normal' | 'small-caps' ]
         """
         self._fontproperties.set_variant(variant)
+        self.set_stale()
 
     def set_fontvariant(self, variant):
         'alias for set_variant'
@@ -886,6 +930,7 @@ class Text(Artist):
         ACCEPTS: [ 'normal' | 'italic' | 'oblique']
         """
         self._fontproperties.set_style(fontstyle)
+        self.set_stale()
 
     def set_fontstyle(self, fontstyle):
         'alias for set_style'
@@ -899,6 +944,7 @@ class Text(Artist):
         ACCEPTS: [ size in points | 'xx-small' | 'x-small' | 'small' | 'medium' | 'large' | 'x-large' | 'xx-large' ]
         """
         self._fontproperties.set_size(fontsize)
+        self.set_stale()
 
     def set_fontsize(self, fontsize):
         'alias for set_size'
@@ -911,6 +957,7 @@ class Text(Artist):
         ACCEPTS: [ a numeric value in range 0-1000 | 'ultralight' | 'light' | 'normal' | 'regular' | 'book' | 'medium' | 'roman' | 'semibold' | 'demibold' | 'demi' | 'bold' | 'heavy' | 'extra bold' | 'black' ]
         """
         self._fontproperties.set_weight(weight)
+        self.set_stale()
 
     def set_fontweight(self, weight):
         'alias for set_weight'
@@ -923,6 +970,7 @@ class Text(Artist):
         ACCEPTS: [ a numeric value in range 0-1000 | 'ultra-condensed' | 'extra-condensed' | 'condensed' | 'semi-condensed' | 'normal' | 'semi-expanded' | 'expanded' | 'extra-expanded' | 'ultra-expanded' ]
         """
         self._fontproperties.set_stretch(stretch)
+        self.set_stale()
 
     def set_fontstretch(self, stretch):
         'alias for set_stretch'
@@ -944,6 +992,7 @@ class Text(Artist):
         ACCEPTS: float
         """
         self._x = x
+        self.set_stale()
 
 
     def set_y(self, y):
@@ -953,6 +1002,7 @@ class Text(Artist):
         ACCEPTS: float
         """
         self._y = y
+        self.set_stale()
 
 
     def set_rotation(self, s):
@@ -962,6 +1012,7 @@ class Text(Artist):
         ACCEPTS: [ angle in degrees | 'vertical' | 'horizontal' ]
         """
         self._rotation = s
+        self.set_stale()
 
 
 
@@ -980,6 +1031,7 @@ class Text(Artist):
             raise ValueError('Vertical alignment must be one of %s' % str(legal))
 
         self._verticalalignment = align
+        self.set_stale()
 
     def set_text(self, s):
         """
@@ -990,6 +1042,7 @@ class Text(Artist):
         ACCEPTS: string or anything printable with '%s' conversion.
         """
         self._text = '%s' % (s,)
+        self.set_stale()
 
     def is_math_text(self, s):
         """
@@ -1018,6 +1071,7 @@ class Text(Artist):
         if is_string_like(fp):
             fp = FontProperties(fp)
         self._fontproperties = fp.copy()
+        self.set_stale()
 
     def set_font_properties(self, fp):
         'alias for set_fontproperties'
@@ -1270,6 +1324,7 @@ class TextWithDash(Text):
         ACCEPTS: float (canvas units)
         """
         self._dashlength = dl
+        self.set_stale()
 
     def get_dashdirection(self):
         """
@@ -1287,6 +1342,7 @@ class TextWithDash(Text):
         ACCEPTS: int (1 is before, 0 is after)
         """
         self._dashdirection = dd
+        self.set_stale()
 
     def get_dashrotation(self):
         """
@@ -1304,6 +1360,7 @@ class TextWithDash(Text):
         ACCEPTS: float (degrees)
         """
         self._dashrotation = dr
+        self.set_stale()
 
     def get_dashpad(self):
         """
@@ -1319,6 +1376,7 @@ class TextWithDash(Text):
         ACCEPTS: float (canvas units)
         """
         self._dashpad = dp
+        self.set_stale()
 
     def get_dashpush(self):
         """
@@ -1336,6 +1394,7 @@ class TextWithDash(Text):
         ACCEPTS: float (canvas units)
         """
         self._dashpush = dp
+        self.set_stale()
 
 
     def set_position(self, xy):
@@ -1354,6 +1413,7 @@ class TextWithDash(Text):
         ACCEPTS: float
         """
         self._dashx = float(x)
+        self.set_stale()
 
     def set_y(self, y):
         """
@@ -1362,6 +1422,7 @@ class TextWithDash(Text):
         ACCEPTS: float
         """
         self._dashy = float(y)
+        self.set_stale()
 
     def set_transform(self, t):
         """
@@ -1509,6 +1570,7 @@ class _AnnotationBase(object):
           * None : the self.xy will be checked only if *xycoords* is "data"
         """
         self._annotation_clip = b
+        self.set_stale()
 
     def get_annotation_clip(self):
         """
@@ -799,8 +799,8 @@ class TickLabels(AxisLabel, AttributeCopier): # mtext.Text
         whd_list = []
         for (x, y), a, l in self._locs_angles_labels:
             clean_line, ismath = self.is_math_text(l)
-            whd = renderer.get_text_width_height_descent(
-                clean_line, self._fontproperties, ismath=ismath)
+            whd = mtext.get_text_metrics(
+                renderer, clean_line, self._fontproperties, ismath=ismath)
             whd_list.append(whd)
 
         return whd_list
@@ -327,19 +327,41 @@ class Poly3DCollection(PolyCollection):
 
     def get_vector(self, segments3d):
         """Optimize points for projection"""
-        si = 0
-        ei = 0
-        segis = []
-        points = []
-        for p in segments3d:
-            points.extend(p)
-            ei = si+len(p)
-            segis.append((si, ei))
-            si = ei
-        xs, ys, zs = zip(*points)
-        ones = np.ones(len(xs))
-        self._vec = np.array([xs, ys, zs, ones])
-        self._segis = segis
+        segments3d = [np.asarray(p, np.float_).reshape(-1, 3)
+                      for p in segments3d]
+        lens = np.array([len(p) for p in segments3d], int)
+        if lens.sum():
+            points = np.concatenate(segments3d)
+        else:
+            points = np.zeros((0, 3))
+        self._vec = np.vstack([points.T, np.ones(len(points))])
+        self._seglens = lens
+        self._segstarts = lens.cumsum() - lens
+        self._segsbylen = [(n, np.flatnonzero(lens == n))
+                           for n in np.unique(lens) if n]
+
+        # The 2D paths are views into one buffer, which is refilled with
+        # the projected points at each draw.  Each polygon takes one row
+        # more than its points, for the CLOSEPOLY vertex.
+        self._xy2d = np.zeros((len(points) + len(lens), 2))
+        self._xyind = (np.arange(len(points)) +
+                       np.repeat(np.arange(len(lens)), lens))
+        codes = {}
+        paths = []
+        for start, n in zip(self._segstarts + np.arange(len(lens)), lens):
+            if n:
+                if n not in codes:
+                    codes[n] = np.empty(n + 1, dtype=mpath.Path.code_type)
+                    codes[n][:] = mpath.Path.LINETO
+                    codes[n][0] = mpath.Path.MOVETO
+                    codes[n][-1] = mpath.Path.CLOSEPOLY
+                paths.append(mpath.Path(self._xy2d[start:start+n+1],
+                                        codes[n]))
+            else:
+                paths.append(mpath.Path(np.zeros((0, 2))))
+        self._paths3d = np.empty(len(paths), object)
+        self._paths3d[:] = paths
+        self._nonfinite = np.zeros(len(paths), bool)
 
     def set_verts(self, verts, closed=True):
         '''Set 3D vertices.'''
@@ -366,33 +388,54 @@ class Poly3DCollection(PolyCollection):
             self._facecolors3d = self._facecolors
 
         txs, tys, tzs = proj3d.proj_transform_vec(self._vec, renderer.M)
-        xyzlist = [(txs[si:ei], tys[si:ei], tzs[si:ei]) \
-                for si, ei in self._segis]
+        npoly = len(self._seglens)
 
         # This extra fuss is to re-order face / edge colors
-        cface = self._facecolors3d
-        cedge = self._edgecolors3d
-        if len(cface) != len(xyzlist):
-            cface = cface.repeat(len(xyzlist), axis=0)
-        if len(cedge) != len(xyzlist):
+        cface = np.asarray(self._facecolors3d)
+        cedge = np.asarray(self._edgecolors3d)
+        if len(cface) != npoly:
+            cface = cface.repeat(npoly, axis=0)
+        if len(cedge) != npoly:
             if len(cedge) == 0:
                 cedge = cface
-            cedge = cedge.repeat(len(xyzlist), axis=0)
+            cedge = cedge.repeat(npoly, axis=0)
+        # polygons without colors are not drawn
+        ndraw = min(npoly, len(cface), len(cedge))
+
+        xy = self._xy2d
+        xy[self._xyind, 0] = txs
+        xy[self._xyind, 1] = tys
+        full = self._seglens > 0
+        starts = self._segstarts[full]
+        nonfinite = np.zeros(npoly, bool)
+        if len(starts):
+            nonfinite[full] = np.logical_or.reduceat(
+                ~(np.isfinite(txs) & np.isfinite(tys)), starts)
+        for i in np.flatnonzero(nonfinite != self._nonfinite):
+            self._paths3d[i].has_nonfinite = nonfinite[i]
+        self._nonfinite = nonfinite
 
         # if required sort by depth (furthest drawn first)
         if self._zsort:
-            z_segments_2d = [(np.average(zs), zip(xs, ys), fc, ec) for
-                    (xs, ys, zs), fc, ec in zip(xyzlist, cface, cedge)]
-            z_segments_2d.sort(cmp=lambda x, y: cmp(y[0], x[0]))
+            zs = np.empty(npoly)
+            zs.fill(np.nan)
+            # average the polygons with n points as rows of a 2D array
+            for n, polys in self._segsbylen:
+                ind = self._segstarts[polys][:,np.newaxis] + np.arange(n)
+                zs[polys] = tzs[ind].mean(axis=1)
+            # a stable sort, like list.sort; polygons with a nan depth,
+            # which have a non-finite vertex, are painted first, as if
+            # they were furthest back
+            key = -zs[:ndraw]
+            key[np.isnan(key)] = -np.inf
+            order = key.argsort(kind='mergesort')
         else:
             raise ValueError, "whoops"
 
-        segments_2d = [s for z, s, fc, ec in z_segments_2d]
-        PolyCollection.set_verts(self, segments_2d)
-
-        self._facecolors2d = [fc for z, s, fc, ec in z_segments_2d]
+        self._paths = list(self._paths3d[order])
+        self._facecolors2d = cface[order]
         if len(self._edgecolors3d) == len(cface):
-            self._edgecolors2d = [ec for z, s, fc, ec in z_segments_2d]
+            self._edgecolors2d = cedge[order]
         else:
             self._edgecolors2d = self._edgecolors3d
 
@@ -561,32 +561,40 @@ RendererAgg::draw_markers(const Py::Tuple& args) {
 
   try {
     unsigned fillSize = 0;
-    if (face.first) {
-      theRasterizer.add_path(marker_path_curve);
+    unsigned strokeSize = 0;
+    {
+      GILReleaser release;
+
+      if (face.first) {
+        theRasterizer.add_path(marker_path_curve);
+        agg::render_scanlines(theRasterizer, slineP8, scanlines);
+        fillSize = scanlines.byte_size();
+        if (fillSize >= MARKER_CACHE_SIZE)
+          fillCache = new agg::int8u[fillSize];
+        scanlines.serialize(fillCache);
+      }
+
+      stroke_t stroke(marker_path_curve);
+      stroke.width(gc.linewidth);
+      stroke.line_cap(gc.cap);
+      stroke.line_join(gc.join);
+      theRasterizer.reset();
+      theRasterizer.add_path(stroke);
       agg::render_scanlines(theRasterizer, slineP8, scanlines);
-      fillSize = scanlines.byte_size();
-      if (fillSize >= MARKER_CACHE_SIZE)
-        fillCache = new agg::int8u[fillSize];
-      scanlines.serialize(fillCache);
+      strokeSize = scanlines.byte_size();
+      if (strokeSize >= MARKER_CACHE_SIZE)
+        strokeCache = new agg::int8u[strokeSize];
+      scanlines.serialize(strokeCache);
     }
 
-    stroke_t stroke(marker_path_curve);
-    stroke.width(gc.linewidth);
-    stroke.line_cap(gc.cap);
-    stroke.line_join(gc.join);
-    theRasterizer.reset();
-    theRasterizer.add_path(stroke);
-    agg::render_scanlines(theRasterizer, slineP8, scanlines);
-    unsigned strokeSize = scanlines.byte_size();
-    if (strokeSize >= MARKER_CACHE_SIZE)
-      strokeCache = new agg::int8u[strokeSize];
-    scanlines.serialize(strokeCache);
-
     theRasterizer.reset_clipping();
     rendererBase.reset_clipping(true);
     set_clipbox(gc.cliprect, rendererBase);
     bool has_clippath = render_clippath(gc.clippath, gc.clippath_trans);
 
+    // Only the numpy buffers of the paths are read from here on
+    GILReleaser release;
+
     double x, y;
 
     agg::serialized_scanlines_adaptor_aa8 sa;
@@ -830,42 +838,48 @@ RendererAgg::draw_image(const Py::Tuple& args) {
   image->flipud_out(empty);
   pixfmt pixf(*(image->rbufOut));
 
-  if (has_clippath) {
-    agg::trans_affine mtx;
-    mtx *= agg::trans_affine_translation((int)x, (int)(height-(y+image->rowsOut)));
-
-    agg::path_storage rect;
-    rect.move_to(0, 0);
-    rect.line_to(image->colsOut, 0);
-    rect.line_to(image->colsOut, image->rowsOut);
-    rect.line_to(0, image->rowsOut);
-    rect.line_to(0, 0);
-    agg::conv_transform<agg::path_storage> rect2(rect, mtx);
-
-    agg::trans_affine inv_mtx(mtx);
-    inv_mtx.invert();
-
-    typedef agg::span_allocator<agg::rgba8> color_span_alloc_type;
-    typedef agg::pixfmt_amask_adaptor<pixfmt, alpha_mask_type> pixfmt_amask_type;
-    typedef agg::renderer_base<pixfmt_amask_type> amask_ren_type;
-    typedef agg::image_accessor_clip<agg::pixfmt_rgba32> image_accessor_type;
-    typedef agg::span_interpolator_linear<> interpolator_type;
-    typedef agg::span_image_filter_rgba_nn<image_accessor_type, interpolator_type> image_span_gen_type;
-    typedef agg::renderer_scanline_aa<amask_ren_type, color_span_alloc_type, image_span_gen_type> renderer_type;
-
-    color_span_alloc_type sa;
-    image_accessor_type ia(pixf, agg::rgba8(0, 0, 0, 0));
-    interpolator_type interpolator(inv_mtx);
-    image_span_gen_type image_span_generator(ia, interpolator);
-    pixfmt_amask_type pfa(pixFmt, alphaMask);
-    amask_ren_type r(pfa);
-    renderer_type ri(r, sa, image_span_generator);
-
-    theRasterizer.add_path(rect2);
-    agg::render_scanlines(theRasterizer, slineP8, ri);
-  } else {
+  if (!has_clippath)
     set_clipbox(gc.cliprect, rendererBase);
-    rendererBase.blend_from(pixf, 0, (int)x, (int)(height-(y+image->rowsOut)));
+
+  {
+    GILReleaser release;
+
+    if (has_clippath) {
+      agg::trans_affine mtx;
+      mtx *= agg::trans_affine_translation((int)x, (int)(height-(y+image->rowsOut)));
+
+      agg::path_storage rect;
+      rect.move_to(0, 0);
+      rect.line_to(image->colsOut, 0);
+      rect.line_to(image->colsOut, image->rowsOut);
+      rect.line_to(0, image->rowsOut);
+      rect.line_to(0, 0);
+      agg::conv_transform<agg::path_storage> rect2(rect, mtx);
+
+      agg::trans_affine inv_mtx(mtx);
+      inv_mtx.invert();
+
+      typedef agg::span_allocator<agg::rgba8> color_span_alloc_type;
+      typedef agg::pixfmt_amask_adaptor<pixfmt, alpha_mask_type> pixfmt_amask_type;
+      typedef agg::renderer_base<pixfmt_amask_type> amask_ren_type;
+      typedef agg::image_accessor_clip<agg::pixfmt_rgba32> image_accessor_type;
+      typedef agg::span_interpolator_linear<> interpolator_type;
+      typedef agg::span_image_filter_rgba_nn<image_accessor_type, interpolator_type> image_span_gen_type;
+      typedef agg::renderer_scanline_aa<amask_ren_type, color_span_alloc_type, image_span_gen_type> renderer_type;
+
+      color_span_alloc_type sa;
+      image_accessor_type ia(pixf, agg::rgba8(0, 0, 0, 0));
+      interpolator_type interpolator(inv_mtx);
+      image_span_gen_type image_span_generator(ia, interpolator);
+      pixfmt_amask_type pfa(pixFmt, alphaMask);
+      amask_ren_type r(pfa);
+      renderer_type ri(r, sa, image_span_generator);
+
+      theRasterizer.add_path(rect2);
+      agg::render_scanlines(theRasterizer, slineP8, ri);
+    } else {
+      rendererBase.blend_from(pixf, 0, (int)x, (int)(height-(y+image->rowsOut)));
+    }
   }
 
   image->flipud_out(empty);
@@ -1062,6 +1076,8 @@ RendererAgg::draw_path(const Py::Tuple& args) {
   curve_t            curve(simplified);
 
   try {
+    // Drawing a hatch needs Python to get at the hatch path
+    GILReleaser release(gc.hatchpath.isNone());
     _draw_path(curve, has_clippath, face, gc);
   } catch (const char* e) {
     throw Py::RuntimeError(e);
@@ -1158,6 +1174,17 @@ RendererAgg::_draw_path_collection_generic
       convert_dashes(Py::Tuple(linestyles_obj[i]), dpi, d->second, d->first);
     }
 
+    // Convert the linewidths and antialiaseds up front, so that the
+    // loop below needs no Python objects
+    std::vector<double> linewidths_vec(Nlinewidths);
+    for (i = 0; i < Nlinewidths; ++i) {
+      linewidths_vec[i] = double(Py::Float(linewidths[i])) * dpi/72.0;
+    }
+    std::vector<bool> antialiaseds_vec(Naa);
+    for (i = 0; i < Naa; ++i) {
+      antialiaseds_vec[i] = bool(Py::Int(antialiaseds[i]));
+    }
+
     // Handle any clipping globally
     theRasterizer.reset_clipping();
     rendererBase.reset_clipping(true);
@@ -1170,78 +1197,84 @@ RendererAgg::_draw_path_collection_generic
     face.first = Nfacecolors != 0;
     agg::trans_affine trans;
 
-    for (i = 0; i < N; ++i) {
-      typename PathGenerator::path_iterator path = path_generator(i);
-
-      if (Ntransforms) {
-        trans = transforms[i % Ntransforms];
-      } else {
-        trans = master_transform;
-      }
-
-      if (Noffsets) {
-        double xo = *(double*)PyArray_GETPTR2(offsets, i % Noffsets, 0);
-        double yo = *(double*)PyArray_GETPTR2(offsets, i % Noffsets, 1);
-        offset_trans.transform(&xo, &yo);
-        trans *= agg::trans_affine_translation(xo, yo);
-      }
-
-      // These transformations must be done post-offsets
-      trans *= agg::trans_affine_scaling(1.0, -1.0);
-      trans *= agg::trans_affine_translation(0.0, (double)height);
-
-      if (Nfacecolors) {
-        size_t fi = i % Nfacecolors;
-        face.second = agg::rgba(*(double*)PyArray_GETPTR2(facecolors, fi, 0),
-                                *(double*)PyArray_GETPTR2(facecolors, fi, 1),
-                                *(double*)PyArray_GETPTR2(facecolors, fi, 2),
-                                *(double*)PyArray_GETPTR2(facecolors, fi, 3));
-      }
+    {
+      // Drawing a hatch needs Python to get at the hatch path.  The
+      // GIL is taken back before the arrays are released below.
+      GILReleaser release(gc.hatchpath.isNone());
 
-      if (Nedgecolors) {
-        size_t ei = i % Nedgecolors;
-        gc.color = agg::rgba(*(double*)PyArray_GETPTR2(edgecolors, ei, 0),
-                             *(double*)PyArray_GETPTR2(edgecolors, ei, 1),
-                             *(double*)PyArray_GETPTR2(edgecolors, ei, 2),
-                             *(double*)PyArray_GETPTR2(edgecolors, ei, 3));
+      for (i = 0; i < N; ++i) {
+        typename PathGenerator::path_iterator& path = path_generator(i);
 
-        if (Nlinewidths) {
-          gc.linewidth = double(Py::Float(linewidths[i % Nlinewidths])) * dpi/72.0;
+        if (Ntransforms) {
+          trans = transforms[i % Ntransforms];
         } else {
-          gc.linewidth = 1.0;
+          trans = master_transform;
         }
-        if (Nlinestyles) {
-          gc.dashes = dashes[i % Nlinestyles].second;
-          gc.dashOffset = dashes[i % Nlinestyles].first;
+
+        if (Noffsets) {
+          double xo = *(double*)PyArray_GETPTR2(offsets, i % Noffsets, 0);
+          double yo = *(double*)PyArray_GETPTR2(offsets, i % Noffsets, 1);
+          offset_trans.transform(&xo, &yo);
+          trans *= agg::trans_affine_translation(xo, yo);
         }
-      }
 
-      bool do_clip = !face.first && gc.hatchpath.isNone();
+        // These transformations must be done post-offsets
+        trans *= agg::trans_affine_scaling(1.0, -1.0);
+        trans *= agg::trans_affine_translation(0.0, (double)height);
 
-      if (check_snap) {
-        gc.isaa = bool(Py::Int(antialiaseds[i % Naa]));
+        if (Nfacecolors) {
+          size_t fi = i % Nfacecolors;
+          face.second = agg::rgba(*(double*)PyArray_GETPTR2(facecolors, fi, 0),
+                                  *(double*)PyArray_GETPTR2(facecolors, fi, 1),
+                                  *(double*)PyArray_GETPTR2(facecolors, fi, 2),
+                                  *(double*)PyArray_GETPTR2(facecolors, fi, 3));
+        }
 
-        transformed_path_t tpath(path, trans);
-        nan_removed_t      nan_removed(tpath, true, has_curves);
-        clipped_t          clipped(nan_removed, do_clip, width, height);
-        quantized_t        quantized(clipped, gc.quantize_mode, path.total_vertices());
-        if (has_curves) {
-          quantized_curve_t curve(quantized);
-          _draw_path(curve, has_clippath, face, gc);
-        } else {
-          _draw_path(quantized, has_clippath, face, gc);
+        if (Nedgecolors) {
+          size_t ei = i % Nedgecolors;
+          gc.color = agg::rgba(*(double*)PyArray_GETPTR2(edgecolors, ei, 0),
+                               *(double*)PyArray_GETPTR2(edgecolors, ei, 1),
+                               *(double*)PyArray_GETPTR2(edgecolors, ei, 2),
+                               *(double*)PyArray_GETPTR2(edgecolors, ei, 3));
+
+          if (Nlinewidths) {
+            gc.linewidth = linewidths_vec[i % Nlinewidths];
+          } else {
+            gc.linewidth = 1.0;
+          }
+          if (Nlinestyles) {
+            gc.dashes = dashes[i % Nlinestyles].second;
+            gc.dashOffset = dashes[i % Nlinestyles].first;
+          }
         }
-      } else {
-        gc.isaa = bool(Py::Int(antialiaseds[i % Naa]));
-
-        transformed_path_t tpath(path, trans);
-        nan_removed_t      nan_removed(tpath, true, has_curves);
-        clipped_t          clipped(nan_removed, do_clip, width, height);
-        if (has_curves) {
-          curve_t curve(clipped);
-          _draw_path(curve, has_clippath, face, gc);
+
+        bool do_clip = !face.first && gc.hatchpath.isNone();
+
+        if (check_snap) {
+          gc.isaa = antialiaseds_vec[i % Naa];
+
+          transformed_path_t tpath(path, trans);
+          nan_removed_t      nan_removed(tpath, true, has_curves);
+          clipped_t          clipped(nan_removed, do_clip, width, height);
+          quantized_t        quantized(clipped, gc.quantize_mode, path.total_vertices());
+          if (has_curves) {
+            quantized_curve_t curve(quantized);
+            _draw_path(curve, has_clippath, face, gc);
+          } else {
+            _draw_path(quantized, has_clippath, face, gc);
+          }
         } else {
-          _draw_path(clipped, has_clippath, face, gc);
+          gc.isaa = antialiaseds_vec[i % Naa];
+
+          transformed_path_t tpath(path, trans);
+          nan_removed_t      nan_removed(tpath, true, has_curves);
+          clipped_t          clipped(nan_removed, do_clip, width, height);
+          if (has_curves) {
+            curve_t curve(clipped);
+            _draw_path(curve, has_clippath, face, gc);
+          } else {
+            _draw_path(clipped, has_clippath, face, gc);
+          }
         }
       }
     }
@@ -1260,23 +1293,66 @@ RendererAgg::_draw_path_collection_generic
 
 
 class PathListGenerator {
-  const Py::SeqBase<Py::Object>& m_paths;
-  size_t m_npaths;
+  // The iterators are made up front, so that the paths can be drawn
+  // without the GIL.
+  std::vector<PathIterator*> m_paths;
 
 public:
   typedef PathIterator path_iterator;
 
-  inline PathListGenerator(const Py::SeqBase<Py::Object>& paths) :
-    m_paths(paths), m_npaths(paths.size()) {
+  inline PathListGenerator(const Py::SeqBase<Py::Object>& paths) {
+    size_t npaths = paths.size();
+    m_paths.reserve(npaths);
+    try {
+      for (size_t i = 0; i < npaths; ++i) {
+        m_paths.push_back(new PathIterator(paths[i]));
+      }
+    } catch (...) {
+      clear();
+      throw;
+    }
+  }
+
+  inline ~PathListGenerator() {
+    clear();
+  }
+
+  inline void clear() {
+    for (size_t i = 0; i < m_paths.size(); ++i) {
+      delete m_paths[i];
+    }
+    m_paths.clear();
+  }
+
+  inline size_t num_paths() const {
+    return m_paths.size();
+  }
+
+  inline path_iterator& operator()(size_t i) const {
+    return *m_paths[i % m_paths.size()];
+  }
+};
+
+class PathArrayGenerator {
+  // Hands out iterators straight over the arrays of a PathArray, so
+  // that no Python object is needed for any of its paths.
+  const PathArray& m_paths;
+  mutable PathArrayIterator m_path;
 
+public:
+  typedef PathArrayIterator path_iterator;
+
+  inline PathArrayGenerator(const PathArray& paths) :
+    m_paths(paths) {
   }
 
   inline size_t num_paths() const {
-    return m_npaths;
+    return m_paths.num_paths();
   }
 
-  inline path_iterator operator()(size_t i) const {
-    return PathIterator(m_paths[i % m_npaths]);
+  inline path_iterator& operator()(size_t i) const {
+    m_path = m_paths.path(i % m_paths.num_paths());
+    return m_path;
   }
 };
 
@@ -1288,8 +1364,7 @@ RendererAgg::draw_path_collection(const Py::Tuple& args) {
   Py::Object gc_obj = args[0];
   GCAgg gc(gc_obj, dpi);
   agg::trans_affine       master_transform = py_to_agg_transformation_matrix(args[1].ptr());
-  Py::SeqBase<Py::Object> path   = args[2];
-  PathListGenerator       path_generator(path);
+  Py::Object              path             = args[2];
   Py::SeqBase<Py::Object> transforms_obj   = args[3];
   Py::Object              offsets_obj      = args[4];
   agg::trans_affine       offset_trans     = py_to_agg_transformation_matrix(args[5].ptr());
@@ -1302,21 +1377,60 @@ RendererAgg::draw_path_collection(const Py::Tuple& args) {
   // Py::SeqBase<Py::Object> urls             = args[11];
 
   try {
-    _draw_path_collection_generic<PathListGenerator, 0, 1>
-      (gc,
-       master_transform,
-       gc.cliprect,
-       gc.clippath,
-       gc.clippath_trans,
-       path_generator,
-       transforms_obj,
-       offsets_obj,
-       offset_trans,
-       facecolors_obj,
-       edgecolors_obj,
-       linewidths,
-       linestyles_obj,
-       antialiaseds);
+    if (PathArray::check(path)) {
+      PathArray          paths(path);
+      PathArrayGenerator path_generator(paths);
+      if (paths.has_curves()) {
+        _draw_path_collection_generic<PathArrayGenerator, 0, 1>
+          (gc,
+           master_transform,
+           gc.cliprect,
+           gc.clippath,
+           gc.clippath_trans,
+           path_generator,
+           transforms_obj,
+           offsets_obj,
+           offset_trans,
+           facecolors_obj,
+           edgecolors_obj,
+           linewidths,
+           linestyles_obj,
+           antialiaseds);
+      } else {
+        _draw_path_collection_generic<PathArrayGenerator, 0, 0>
+          (gc,
+           master_transform,
+           gc.cliprect,
+           gc.clippath,
+           gc.clippath_trans,
+           path_generator,
+           transforms_obj,
+           offsets_obj,
+           offset_trans,
+           facecolors_obj,
+           edgecolors_obj,
+           linewidths,
+           linestyles_obj,
+           antialiaseds);
+      }
+    } else {
+      PathListGenerator path_generator(path);
+      _draw_path_collection_generic<PathListGenerator, 0, 1>
+        (gc,
+         master_transform,
+         gc.cliprect,
+         gc.clippath,
+         gc.clippath_trans,
+         path_generator,
+         transforms_obj,
+         offsets_obj,
+         offset_trans,
+         facecolors_obj,
+         edgecolors_obj,
+         linewidths,
+         linestyles_obj,
+         antialiaseds);
+    }
   } catch (const char *e) {
     throw Py::RuntimeError(e);
   }
@@ -1368,11 +1482,15 @@ class QuadMeshGenerator {
     }
   };
 
+  // The iterator handed out for the current quad
+  mutable QuadMeshPathIterator m_path;
+
 public:
   typedef QuadMeshPathIterator path_iterator;
 
   inline QuadMeshGenerator(size_t meshWidth, size_t meshHeight, PyObject* coordinates) :
-    m_meshWidth(meshWidth), m_meshHeight(meshHeight), m_coordinates(NULL) {
+    m_meshWidth(meshWidth), m_meshHeight(meshHeight), m_coordinates(NULL),
+    m_path(0, 0, NULL) {
     PyArrayObject* coordinates_array = (PyArrayObject*)PyArray_ContiguousFromObject(coordinates, PyArray_DOUBLE, 3, 3);
     if (!coordinates_array) {
       throw Py::ValueError("Invalid coordinates array.");
@@ -1389,8 +1507,9 @@ public:
     return m_meshWidth * m_meshHeight;
   }
 
-  inline path_iterator operator()(size_t i) const {
-    return QuadMeshPathIterator(i % m_meshWidth, i / m_meshWidth, m_coordinates);
+  inline path_iterator& operator()(size_t i) const {
+    m_path = QuadMeshPathIterator(i % m_meshWidth, i / m_meshWidth, m_coordinates);
+    return m_path;
   }
 };
 
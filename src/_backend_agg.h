@@ -51,6 +51,23 @@
 
 const size_t NUM_VERTICES[] = { 1, 1, 1, 2, 3, 1 };
 
+// Releases the GIL for its lifetime (if *release* is true), so that
+// other threads can run while Agg rasterizes.  The GIL is taken back
+// when it goes out of scope, including when an exception propagates.
+// No Python objects may be touched while it is alive.
+class GILReleaser {
+  PyThreadState* m_save;
+public:
+  explicit GILReleaser(bool release = true) :
+    m_save(release ? PyEval_SaveThread() : NULL) {
+  }
+
+  ~GILReleaser() {
+    if (m_save)
+      PyEval_RestoreThread(m_save);
+  }
+};
+
 typedef agg::pixfmt_rgba32 pixfmt;
 typedef agg::renderer_base<pixfmt> renderer_base;
 typedef agg::renderer_scanline_aa_solid<renderer_base> renderer_aa;
@@ -210,9 +210,10 @@ bool point_in_path_impl(const double tx, const double ty, T& path)
     return (inside_flag != 0);
 }
 
-inline bool point_in_path(double x, double y, PathIterator& path, const agg::trans_affine& trans)
+template<class PathIteratorType>
+inline bool point_in_path(double x, double y, PathIteratorType& path, const agg::trans_affine& trans)
 {
-    typedef agg::conv_transform<PathIterator> transformed_path_t;
+    typedef agg::conv_transform<PathIteratorType> transformed_path_t;
     typedef agg::conv_curve<transformed_path_t> curve_t;
 
     if (path.total_vertices() < 3)
@@ -223,9 +224,10 @@ inline bool point_in_path(double x, double y, PathIterator& path, const agg::tra
     return point_in_path_impl(x, y, curved_path);
 }
 
-inline bool point_on_path(double x, double y, double r, PathIterator& path, const agg::trans_affine& trans)
+template<class PathIteratorType>
+inline bool point_on_path(double x, double y, double r, PathIteratorType& path, const agg::trans_affine& trans)
 {
-    typedef agg::conv_transform<PathIterator> transformed_path_t;
+    typedef agg::conv_transform<PathIteratorType> transformed_path_t;
     typedef agg::conv_curve<transformed_path_t> curve_t;
     typedef agg::conv_stroke<curve_t> stroke_t;
 
@@ -265,11 +267,12 @@ Py::Object _path_module::point_on_path(const Py::Tuple& args)
     return Py::Int(0);
 }
 
-void get_path_extents(PathIterator& path, const agg::trans_affine& trans,
+template<class PathIteratorType>
+void get_path_extents(PathIteratorType& path, const agg::trans_affine& trans,
                       double* x0, double* y0, double* x1, double* y1,
                       double* xm, double* ym)
 {
-    typedef agg::conv_transform<PathIterator> transformed_path_t;
+    typedef agg::conv_transform<PathIteratorType> transformed_path_t;
     typedef PathNanRemover<transformed_path_t> nan_removed_t;
     typedef agg::conv_curve<nan_removed_t> curve_t;
     double x, y;
@@ -456,13 +459,103 @@ Py::Object _path_module::update_path_extents(const Py::Tuple& args)
     return result;
 }
 
+// Gives a Python sequence of Path objects the interface of a
+// PathArray, so that the functions below can take either
+class PathSequence
+{
+    const Py::SeqBase<Py::Object>& m_paths;
+
+public:
+    typedef PathIterator path_iterator;
+
+    inline PathSequence(const Py::SeqBase<Py::Object>& paths) :
+        m_paths(paths)
+    {
+    }
+
+    inline size_t num_paths() const
+    {
+        return m_paths.length();
+    }
+
+    inline Py::Object path(size_t i) const
+    {
+        return m_paths[i];
+    }
+};
+
+typedef std::vector<agg::trans_affine> transforms_t;
+
+// Convert the transforms of a path collection of N items up front
+void
+convert_collection_transforms(const Py::SeqBase<Py::Object>& transforms_obj,
+                              const agg::trans_affine& master_transform,
+                              size_t N, transforms_t& transforms)
+{
+    size_t Ntransforms = std::min(transforms_obj.length(), N);
+    transforms.reserve(Ntransforms);
+    for (size_t i = 0; i < Ntransforms; ++i)
+    {
+        agg::trans_affine trans = py_to_agg_transformation_matrix
+            (transforms_obj[i].ptr(), false);
+        trans *= master_transform;
+        transforms.push_back(trans);
+    }
+}
+
+template<class PathSource>
+void
+get_path_collection_extents(const PathSource& paths,
+                            const agg::trans_affine& master_transform,
+                            const Py::SeqBase<Py::Object>& transforms_obj,
+                            PyArrayObject* offsets,
+                            const agg::trans_affine& offset_trans,
+                            double* x0, double* y0, double* x1, double* y1,
+                            double* xm, double* ym)
+{
+    size_t Npaths      = paths.num_paths();
+    size_t Noffsets    = offsets->dimensions[0];
+    size_t N           = std::max(Npaths, Noffsets);
+    size_t i;
+
+    transforms_t transforms;
+    convert_collection_transforms(transforms_obj, master_transform, N, transforms);
+    size_t Ntransforms = transforms.size();
+
+    // The offset each of those and collect the mins/maxs
+    agg::trans_affine trans;
+
+    for (i = 0; i < N; ++i)
+    {
+        typename PathSource::path_iterator path(paths.path(i % Npaths));
+        if (Ntransforms)
+        {
+            trans = transforms[i % Ntransforms];
+        }
+        else
+        {
+            trans = master_transform;
+        }
+
+        if (Noffsets)
+        {
+            double xo                = *(double*)PyArray_GETPTR2(offsets, i % Noffsets, 0);
+            double yo                = *(double*)PyArray_GETPTR2(offsets, i % Noffsets, 1);
+            offset_trans.transform(&xo, &yo);
+            trans *= agg::trans_affine_translation(xo, yo);
+        }
+
+        ::get_path_extents(path, trans, x0, y0, x1, y1, xm, ym);
+    }
+}
+
 Py::Object _path_module::get_path_collection_extents(const Py::Tuple& args)
 {
     args.verify_length(5);
 
     //segments, trans, clipbox, colors, linewidths, antialiaseds
     agg::trans_affine       master_transform = py_to_agg_transformation_matrix(args[0].ptr());
-    Py::SeqBase<Py::Object> paths            = args[1];
+    Py::Object              paths_obj        = args[1];
     Py::SeqBase<Py::Object> transforms_obj   = args[2];
     Py::Object              offsets_obj      = args[3];
     agg::trans_affine       offset_trans     = py_to_agg_transformation_matrix(args[4].ptr(), false);
@@ -480,54 +573,27 @@ Py::Object _path_module::get_path_collection_extents(const Py::Tuple& args)
             throw Py::ValueError("Offsets array must be Nx2");
         }
 
-        size_t Npaths      = paths.length();
-        size_t Noffsets    = offsets->dimensions[0];
-        size_t N               = std::max(Npaths, Noffsets);
-        size_t Ntransforms = std::min(transforms_obj.length(), N);
-        size_t i;
-
-        // Convert all of the transforms up front
-        typedef std::vector<agg::trans_affine> transforms_t;
-        transforms_t transforms;
-        transforms.reserve(Ntransforms);
-        for (i = 0; i < Ntransforms; ++i)
-        {
-            agg::trans_affine trans = py_to_agg_transformation_matrix
-                (transforms_obj[i].ptr(), false);
-            trans *= master_transform;
-            transforms.push_back(trans);
-        }
-
-        // The offset each of those and collect the mins/maxs
         x0 = std::numeric_limits<double>::infinity();
         y0 = std::numeric_limits<double>::infinity();
         x1 = -std::numeric_limits<double>::infinity();
         y1 = -std::numeric_limits<double>::infinity();
         xm = std::numeric_limits<double>::infinity();
         ym = std::numeric_limits<double>::infinity();
-        agg::trans_affine trans;
 
-        for (i = 0; i < N; ++i)
+        if (PathArray::check(paths_obj))
         {
-            PathIterator path(paths[i % Npaths]);
-            if (Ntransforms)
-            {
-                trans = transforms[i % Ntransforms];
-            }
-            else
-            {
-                trans = master_transform;
-            }
-
-            if (Noffsets)
-            {
-                double xo                = *(double*)PyArray_GETPTR2(offsets, i % Noffsets, 0);
-                double yo                = *(double*)PyArray_GETPTR2(offsets, i % Noffsets, 1);
-                offset_trans.transform(&xo, &yo);
-                trans *= agg::trans_affine_translation(xo, yo);
-            }
-
-            ::get_path_extents(path, trans, &x0, &y0, &x1, &y1, &xm, &ym);
+            PathArray paths(paths_obj);
+            ::get_path_collection_extents
+                (paths, master_transform, transforms_obj, offsets, offset_trans,
+                 &x0, &y0, &x1, &y1, &xm, &ym);
+        }
+        else
+        {
+            Py::SeqBase<Py::Object> paths_seq(paths_obj);
+            PathSequence paths(paths_seq);
+            ::get_path_collection_extents
+                (paths, master_transform, transforms_obj, offsets, offset_trans,
+                 &x0, &y0, &x1, &y1, &xm, &ym);
         }
     }
     catch (...)
@@ -546,54 +612,30 @@ Py::Object _path_module::get_path_collection_extents(const Py::Tuple& args)
     return result;
 }
 
-Py::Object _path_module::point_in_path_collection(const Py::Tuple& args)
+template<class PathSource>
+void
+point_in_path_collection(double x, double y, double radius,
+                         const PathSource& paths,
+                         const agg::trans_affine& master_transform,
+                         const Py::SeqBase<Py::Object>& transforms_obj,
+                         PyArrayObject* offsets,
+                         const agg::trans_affine& offset_trans,
+                         bool filled, Py::List& result)
 {
-    args.verify_length(9);
-
-    //segments, trans, clipbox, colors, linewidths, antialiaseds
-    double                  x                = Py::Float(args[0]);
-    double                  y                = Py::Float(args[1]);
-    double                  radius           = Py::Float(args[2]);
-    agg::trans_affine       master_transform = py_to_agg_transformation_matrix(args[3].ptr());
-    Py::SeqBase<Py::Object> paths            = args[4];
-    Py::SeqBase<Py::Object> transforms_obj   = args[5];
-    Py::SeqBase<Py::Object> offsets_obj      = args[6];
-    agg::trans_affine       offset_trans     = py_to_agg_transformation_matrix(args[7].ptr());
-    bool                    filled           = Py::Int(args[8]);
-
-    PyArrayObject* offsets = (PyArrayObject*)PyArray_FromObject(offsets_obj.ptr(), PyArray_DOUBLE, 0, 2);
-    if (!offsets ||
-        (PyArray_NDIM(offsets) == 2 && PyArray_DIM(offsets, 1) != 2) ||
-        (PyArray_NDIM(offsets) == 1 && PyArray_DIM(offsets, 0) != 0))
-    {
-        Py_XDECREF(offsets);
-        throw Py::ValueError("Offsets array must be Nx2");
-    }
-
-    size_t Npaths      = paths.length();
+    size_t Npaths      = paths.num_paths();
     size_t Noffsets    = offsets->dimensions[0];
     size_t N           = std::max(Npaths, Noffsets);
-    size_t Ntransforms = std::min(transforms_obj.length(), N);
     size_t i;
 
-    // Convert all of the transforms up front
-    typedef std::vector<agg::trans_affine> transforms_t;
     transforms_t transforms;
-    transforms.reserve(Ntransforms);
-    for (i = 0; i < Ntransforms; ++i)
-    {
-        agg::trans_affine trans = py_to_agg_transformation_matrix
-            (transforms_obj[i].ptr(), false);
-        trans *= master_transform;
-        transforms.push_back(trans);
-    }
+    convert_collection_transforms(transforms_obj, master_transform, N, transforms);
+    size_t Ntransforms = transforms.size();
 
-    Py::List result;
     agg::trans_affine trans;
 
     for (i = 0; i < N; ++i)
     {
-        PathIterator path(paths[i % Npaths]);
+        typename PathSource::path_iterator path(paths.path(i % Npaths));
 
         if (Ntransforms)
         {
@@ -623,6 +665,59 @@ Py::Object _path_module::point_in_path_collection(const Py::Tuple& args)
                 result.append(Py::Int((int)i));
         }
     }
+}
+
+Py::Object _path_module::point_in_path_collection(const Py::Tuple& args)
+{
+    args.verify_length(9);
+
+    //segments, trans, clipbox, colors, linewidths, antialiaseds
+    double                  x                = Py::Float(args[0]);
+    double                  y                = Py::Float(args[1]);
+    double                  radius           = Py::Float(args[2]);
+    agg::trans_affine       master_transform = py_to_agg_transformation_matrix(args[3].ptr());
+    Py::Object              paths_obj        = args[4];
+    Py::SeqBase<Py::Object> transforms_obj   = args[5];
+    Py::SeqBase<Py::Object> offsets_obj      = args[6];
+    agg::trans_affine       offset_trans     = py_to_agg_transformation_matrix(args[7].ptr());
+    bool                    filled           = Py::Int(args[8]);
+
+    PyArrayObject* offsets = (PyArrayObject*)PyArray_FromObject(offsets_obj.ptr(), PyArray_DOUBLE, 0, 2);
+    if (!offsets ||
+        (PyArray_NDIM(offsets) == 2 && PyArray_DIM(offsets, 1) != 2) ||
+        (PyArray_NDIM(offsets) == 1 && PyArray_DIM(offsets, 0) != 0))
+    {
+        Py_XDECREF(offsets);
+        throw Py::ValueError("Offsets array must be Nx2");
+    }
+
+    Py::List result;
+
+    try
+    {
+        if (PathArray::check(paths_obj))
+        {
+            PathArray paths(paths_obj);
+            ::point_in_path_collection
+                (x, y, radius, paths, master_transform, transforms_obj,
+                 offsets, offset_trans, filled, result);
+        }
+        else
+        {
+            Py::SeqBase<Py::Object> paths_seq(paths_obj);
+            PathSequence paths(paths_seq);
+            ::point_in_path_collection
+                (x, y, radius, paths, master_transform, transforms_obj,
+                 offsets, offset_trans, filled, result);
+        }
+    }
+    catch (...)
+    {
+        Py_XDECREF(offsets);
+        throw;
+    }
+
+    Py_XDECREF(offsets);
 
     return result;
 }
@@ -132,4 +132,186 @@ public:
     }
 };
 
+/************************************************************
+ PathArray holds the arrays of a matplotlib.path.PathArray: the
+ vertices and codes of many paths packed end to end, and the index
+ array "starts" of where each path begins.  PathArrayIterator is the
+ vertex source for one of those paths.  It refers to the arrays
+ without holding Python references, so it must not outlive the
+ PathArray, but it can be copied freely and used without the GIL.
+ */
+class PathArrayIterator
+{
+    const double* m_vertices;
+    const npy_uint8* m_codes;
+
+    size_t m_iterator;
+    size_t m_total_vertices;
+
+public:
+    inline PathArrayIterator() :
+    m_vertices(NULL), m_codes(NULL), m_iterator(0), m_total_vertices(0)
+    {
+    }
+
+    inline PathArrayIterator(const double* vertices, const npy_uint8* codes,
+                             size_t total_vertices) :
+    m_vertices(vertices), m_codes(codes), m_iterator(0),
+    m_total_vertices(total_vertices)
+    {
+    }
+
+    inline unsigned vertex(double* x, double* y)
+    {
+        if (m_iterator >= m_total_vertices) return agg::path_cmd_stop;
+
+        const size_t idx = m_iterator++;
+
+        *x = m_vertices[2 * idx];
+        *y = m_vertices[2 * idx + 1];
+
+        if (m_codes)
+        {
+            return (unsigned)m_codes[idx];
+        }
+        else
+        {
+            return idx == 0 ? agg::path_cmd_move_to : agg::path_cmd_line_to;
+        }
+    }
+
+    inline void rewind(unsigned path_id)
+    {
+        m_iterator = path_id;
+    }
+
+    inline unsigned total_vertices()
+    {
+        return m_total_vertices;
+    }
+
+    inline bool should_simplify()
+    {
+        return false;
+    }
+
+    inline double simplify_threshold()
+    {
+        return 0.0;
+    }
+
+    inline bool has_curves()
+    {
+        return m_codes != NULL;
+    }
+};
+
+class PathArray
+{
+    PyArrayObject* m_vertices;
+    PyArrayObject* m_codes;
+    PyArrayObject* m_starts;
+
+    size_t m_num_paths;
+
+    inline void clear()
+    {
+        Py_XDECREF(m_vertices);
+        Py_XDECREF(m_codes);
+        Py_XDECREF(m_starts);
+        m_vertices = m_codes = m_starts = NULL;
+    }
+
+public:
+    typedef PathArrayIterator path_iterator;
+
+    /* Whether path_obj is a PathArray rather than a sequence of Paths */
+    static inline bool check(const Py::Object& path_obj)
+    {
+        return path_obj.hasAttr("starts");
+    }
+
+    inline PathArray(const Py::Object& path_obj) :
+    m_vertices(NULL), m_codes(NULL), m_starts(NULL), m_num_paths(0)
+    {
+        Py::Object vertices_obj = path_obj.getAttr("vertices");
+        Py::Object codes_obj    = path_obj.getAttr("codes");
+        Py::Object starts_obj   = path_obj.getAttr("starts");
+
+        m_vertices = (PyArrayObject*)PyArray_ContiguousFromObject
+                     (vertices_obj.ptr(), PyArray_DOUBLE, 2, 2);
+        if (!m_vertices ||
+            PyArray_DIM(m_vertices, 1) != 2)
+        {
+            clear();
+            throw Py::ValueError("Invalid vertices array.");
+        }
+        npy_intp nvertices = PyArray_DIM(m_vertices, 0);
+
+        if (codes_obj.ptr() != Py_None)
+        {
+            m_codes = (PyArrayObject*)PyArray_ContiguousFromObject
+                      (codes_obj.ptr(), PyArray_UINT8, 1, 1);
+            if (!m_codes || PyArray_DIM(m_codes, 0) != nvertices)
+            {
+                clear();
+                throw Py::ValueError("Invalid codes array.");
+            }
+        }
+
+        m_starts = (PyArrayObject*)PyArray_ContiguousFromObject
+                   (starts_obj.ptr(), PyArray_INTP, 1, 1);
+        if (!m_starts || PyArray_DIM(m_starts, 0) < 1)
+        {
+            clear();
+            throw Py::ValueError("Invalid starts array.");
+        }
+
+        const npy_intp* starts = (const npy_intp*)PyArray_DATA(m_starts);
+        m_num_paths = PyArray_DIM(m_starts, 0) - 1;
+        if (starts[0] < 0 || starts[m_num_paths] > nvertices)
+        {
+            clear();
+            throw Py::ValueError("Starts array out of range.");
+        }
+        for (size_t i = 0; i < m_num_paths; ++i)
+        {
+            if (starts[i + 1] < starts[i])
+            {
+                clear();
+                throw Py::ValueError("Starts array must be increasing.");
+            }
+        }
+    }
+
+    ~PathArray()
+    {
+        clear();
+    }
+
+    inline size_t num_paths() const
+    {
+        return m_num_paths;
+    }
+
+    inline bool has_curves() const
+    {
+        return m_codes != NULL;
+    }
+
+    inline path_iterator path(size_t i) const
+    {
+        const npy_intp* starts = (const npy_intp*)PyArray_DATA(m_starts);
+        const npy_intp start = starts[i];
+        const npy_uint8* codes = NULL;
+        if (m_codes)
+        {
+            codes = (const npy_uint8*)PyArray_DATA(m_codes) + start;
+        }
+        return path_iterator
+            ((const double*)PyArray_DATA(m_vertices) + 2 * start, codes,
+             starts[i + 1] - start);
+    }
+};
+
 #endif // __AGG_PY_PATH_ITERATOR_H__